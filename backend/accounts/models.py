@@ -1 +1,29 @@
-# Create your models here.
+from django.contrib.auth.models import AbstractUser
+from django.db import models
+
+
+class User(AbstractUser):
+    """사용자 모델"""
+
+    USER_MODE_CHOICES = [
+        ("caregiver", "돌봄 제공자"),
+        ("familyMember", "가족 구성원"),
+        ("professional", "전문가"),
+    ]
+
+    user_mode = models.CharField(
+        max_length=20,
+        choices=USER_MODE_CHOICES,
+        default="caregiver",
+        verbose_name="사용자 모드",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="가입일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        db_table = "users"
+        verbose_name = "사용자"
+        verbose_name_plural = "사용자"
+
+    def __str__(self):
+        return self.email or self.username
@@ -72,14 +72,14 @@ class SignupSerializer(serializers.Serializer):
             user_mode=validated_data["user_mode"],
         )
 
-        # 보호자 모드인 경우 아이 정보 생성 및 예방접종 일정 자동 생성
+        # 보호자 모드인 경우 아이 정보 생성 및 예방접종 일정 생성 작업 등록
         if child_info_data and user.user_mode == "caregiver":
             child = Child.objects.create(user=user, **child_info_data)
 
-            # 예방접종 일정 자동 생성
-            from vaccinations.services import create_vaccination_schedules
+            # 일정 생성은 워커(run_worker)가 처리해 가입 응답을 늦추지 않음
+            from jobs.services import enqueue
 
-            create_vaccination_schedules(child)
+            enqueue("vaccinations.generate_schedules", {"child_id": child.pk})
 
         return user
 
@@ -1 +1,70 @@
-# Create your views here.
+"""
+계정 API 뷰
+"""
+
+from django.contrib.auth import authenticate
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.serializers import LoginSerializer, SignupSerializer, UserSerializer
+
+
+def _issue_tokens(user) -> dict:
+    """사용자에게 JWT access/refresh 토큰 발급"""
+    refresh = RefreshToken.for_user(user)
+    return {"access": str(refresh.access_token), "refresh": str(refresh)}
+
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def signup(request):
+    """회원가입 (보호자 모드는 아이 정보와 예방접종 일정 생성 작업까지 등록)"""
+    serializer = SignupSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    user = serializer.save()
+
+    return Response(
+        {
+            "message": "회원가입이 완료되었습니다.",
+            "user": UserSerializer(user).data,
+            "tokens": _issue_tokens(user),
+        },
+        status=status.HTTP_201_CREATED,
+    )
+
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def login(request):
+    """이메일/비밀번호 로그인"""
+    serializer = LoginSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    user = authenticate(
+        request,
+        username=serializer.validated_data["email"],
+        password=serializer.validated_data["password"],
+    )
+    if user is None:
+        return Response(
+            {"error": "이메일 또는 비밀번호가 올바르지 않습니다."},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    return Response(
+        {
+            "message": "로그인되었습니다.",
+            "user": UserSerializer(user).data,
+            "tokens": _issue_tokens(user),
+        }
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def me(request):
+    """내 정보 조회"""
+    return Response(UserSerializer(request.user).data)
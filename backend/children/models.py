@@ -1 +1,34 @@
-# Create your models here.
+from django.conf import settings
+from django.db import models
+
+
+class Child(models.Model):
+    """아이 모델"""
+
+    GENDER_CHOICES = [
+        ("male", "남아"),
+        ("female", "여아"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="children",
+        verbose_name="보호자",
+    )
+    name = models.CharField(max_length=50, verbose_name="아이 이름")
+    birth_date = models.DateField(verbose_name="출생일")
+    gender = models.CharField(
+        max_length=10, choices=GENDER_CHOICES, verbose_name="성별"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        db_table = "children"
+        verbose_name = "아이"
+        verbose_name_plural = "아이들"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.name} ({self.birth_date})"
@@ -21,6 +21,7 @@ INSTALLED_APPS = [
     "accounts",
     "children",
     "vaccinations",
+    "jobs",
 ]
 
 MIDDLEWARE = [
@@ -104,3 +105,27 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Custom User Model
 AUTH_USER_MODEL = "accounts.User"
+
+# 예방접종 알림 발송 백엔드 (실제 푸시 연동 전까지는 발송이 항상 실패)
+# 테스트는 conftest.py에서 FakePushSender로 바꿉니다.
+NOTIFICATION_SENDER_BACKEND = "vaccinations.senders.UnconfiguredSender"
+
+# 발송/읽음 처리된 알림을 원본 테이블에 남겨 두는 기간 (이후 보관 테이블로 이동)
+NOTIFICATION_RETENTION_DAYS = 180
+
+# 캐시 (배포 환경에서는 memcached/redis로 교체)
+# 웹 서버, run_worker, cron 명령이 무효화(버전 토큰)를 함께 봐야 하므로
+# 프로세스마다 따로인 LocMemCache는 쓰지 않습니다.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / ".cache",
+    }
+}
+
+# 예방접종 조회 응답 캐시 (키에 날짜가 있으므로 하루면 충분)
+VACCINATION_CACHE_ALIAS = "default"
+VACCINATION_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 델타 동기화 삭제 기록 보존 기간 (이보다 오래된 cursor는 전체 동기화)
+SYNC_TOMBSTONE_RETENTION_DAYS = 90
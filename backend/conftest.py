@@ -1,3 +1,5 @@
+from datetime import date
+
 import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
@@ -5,6 +7,38 @@ from rest_framework.test import APIClient
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def test_cache(settings):
+    """개발 서버의 파일 캐시를 건드리지 않도록 테스트는 메모리 캐시 사용"""
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "mamy-tests",
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(test_cache):
+    """
+    테스트마다 캐시 초기화
+
+    테스트 DB는 롤백되며 ID가 다시 쓰일 수 있으므로 이전 테스트의
+    캐시 항목이 남지 않게 합니다.
+    """
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def fake_sender_backend(settings):
+    """알림 발송은 실제로 보내지 않는 가짜 백엔드로"""
+    settings.NOTIFICATION_SENDER_BACKEND = "vaccinations.senders.FakePushSender"
+
+
 @pytest.fixture
 def api_client():
     """
@@ -45,6 +79,40 @@ def authenticated_client(api_client, user):
     return api_client
 
 
+@pytest.fixture
+def child(user):
+    """
+    테스트용 아이 (user의 자녀)
+
+    Usage:
+        def test_something(child):
+            assert child.user.email == "testuser@example.com"
+    """
+    from children.models import Child
+
+    return Child.objects.create(
+        user=user,
+        name="홍길동",
+        birth_date=date(2024, 1, 15),
+        gender="male",
+    )
+
+
+@pytest.fixture
+def schedules(child):
+    """
+    child의 예방접종 일정 (접종 예정일, id 순 QuerySet)
+
+    Usage:
+        def test_something(child, schedules):
+            assert schedules.first().child == child
+    """
+    from vaccinations.services import create_vaccination_schedules
+
+    create_vaccination_schedules(child)
+    return child.vaccination_schedules.order_by("vaccination_date", "id")
+
+
 @pytest.fixture
 def user_data():
     """
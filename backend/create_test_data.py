@@ -13,7 +13,10 @@ from datetime import date
 
 from accounts.models import User
 from children.models import Child
-from vaccinations.services import create_vaccination_schedules
+from vaccinations.services import (
+    create_vaccination_schedules,
+    sync_vaccination_schedules,
+)
 
 
 def create_test_data():
@@ -56,20 +59,19 @@ def create_test_data():
     existing_schedules = VaccinationSchedule.objects.filter(child=child).count()
 
     if existing_schedules > 0:
+        # 기존 일정은 지우지 않고 바뀐 부분만 반영 (접종 완료 정보 유지)
         print(f"ℹ️  이미 {existing_schedules}개의 예방접종 일정이 존재합니다.")
-
-        response = input("기존 일정을 삭제하고 새로 생성하시겠습니까? (y/n): ")
-        if response.lower() == "y":
-            VaccinationSchedule.objects.filter(child=child).delete()
-            print("✅ 기존 일정 삭제 완료")
-        else:
-            print("❌ 생성 취소")
-            return
-
-    # 예방접종 일정 생성
-    print("\n📅 예방접종 일정 생성 중...")
-    created_count = create_vaccination_schedules(child)
-    print(f"✅ {created_count}개의 예방접종 일정이 생성되었습니다!")
+        print("\n📅 예방접종 일정 동기화 중...")
+        result = sync_vaccination_schedules([child])
+        print(
+            f"✅ 추가 {result.created}개, 수정 {result.updated}개, "
+            f"삭제 {result.deleted}개, 변경 없음 {result.unchanged}개"
+        )
+    else:
+        # 예방접종 일정 생성
+        print("\n📅 예방접종 일정 생성 중...")
+        created_count = create_vaccination_schedules(child)
+        print(f"✅ {created_count}개의 예방접종 일정이 생성되었습니다!")
 
     print("\n" + "=" * 60)
     print("테스트 계정 정보:")
@@ -5,23 +5,248 @@
 접종 1달 전 알림을 생성하는 로직을 제공합니다.
 """
 
+import hashlib
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-
+import os
+import pickle
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from pathlib import Path
+from time import monotonic
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
 from dateutil.relativedelta import relativedelta
 
+DEFAULT_SCHEDULE_PATH = (
+    Path(__file__).resolve().parent / "immunization_schedule_2025.json"
+)
+
+
+class DoseInfo(NamedTuple):
+    """백신 차수별 메타데이터 (같은 계산기의 모든 일정 항목이 공유)"""
+
+    vaccine_id: int
+    vaccine_name: str
+    disease: str
+    dose_number: int
+    age_description: str
+    age_in_months: int
+    max_age_in_weeks: Optional[int]
+    gender: Optional[str]
+    is_mandatory: bool
+    is_annual: bool
+    notes: str
+    age_range_end: Optional[int]
+
+
+class ScheduleItem(NamedTuple):
+    """아이 한 명의 예방접종 일정 항목 (날짜는 date 객체)"""
+
+    dose: DoseInfo
+    vaccination_date: date
+    notification_date: date
+
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """접종 예정일(자정)이 현재 시각보다 이전인지 여부"""
+        return datetime.combine(self.vaccination_date, time.min) < (
+            now or datetime.now()
+        )
+
+    def to_dict(self, now: Optional[datetime] = None) -> Dict:
+        """
+        기존 get_child_schedule 딕셔너리 형식으로 변환
+
+        Args:
+            now: 지연 여부 판단 기준 시각 (기본 현재 시각)
+
+        Returns:
+            문자열 날짜를 가진 일정 딕셔너리
+        """
+        dose = self.dose
+        return {
+            "vaccine_id": dose.vaccine_id,
+            "vaccine_name": dose.vaccine_name,
+            "disease": dose.disease,
+            "dose_number": dose.dose_number,
+            "age_description": dose.age_description,
+            "vaccination_date": self.vaccination_date.strftime("%Y-%m-%d"),
+            "notification_date": self.notification_date.strftime("%Y-%m-%d"),
+            "is_mandatory": dose.is_mandatory,
+            "is_annual": dose.is_annual,
+            "notes": dose.notes,
+            "age_range_end": dose.age_range_end,
+            "is_overdue": self.is_overdue(now),
+        }
+
+
+class ScheduleValidationError(ValueError):
+    """예방접종 일정 데이터가 스키마와 맞지 않을 때 발생"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__("\n".join(errors))
+
+
+# 필드 이름: (허용 타입, 필수 여부)
+_VACCINE_FIELDS = {
+    "id": (int, True),
+    "vaccine_name": (str, True),
+    "disease": (str, True),
+    "vaccine_type": (str, True),
+    "schedules": (list, True),
+}
+_DOSE_FIELDS = {
+    "dose_number": (int, True),
+    "age_in_months": (int, True),
+    "age_description": (str, True),
+    "max_age_in_weeks": (int, False),
+    "age_range_end": (int, False),
+    "gender": (str, False),
+    "is_mandatory": (bool, False),
+    "is_annual": (bool, False),
+    "notes": (str, False),
+    "relative_to_previous": (bool, False),
+    "interval_months": (int, False),
+}
+VACCINE_TYPES = ("국가필수", "기타")
+GENDERS = ("male", "female")
+
+
+def _check_fields(obj, fields: Dict, where: str, errors: List[str]) -> bool:
+    if not isinstance(obj, dict):
+        errors.append(f"{where}: 객체여야 합니다.")
+        return False
+
+    for name, (expected, required) in fields.items():
+        if name not in obj:
+            if required:
+                errors.append(f"{where}: '{name}' 필드가 없습니다.")
+            continue
+        value = obj[name]
+        # bool은 int의 하위 타입이므로 별도로 구분
+        if not isinstance(value, expected) or (
+            expected is int and isinstance(value, bool)
+        ):
+            errors.append(f"{where}: '{name}'은(는) {expected.__name__}이어야 합니다.")
+
+    return True
+
+
+def validate_schedule_data(schedule_data) -> List[str]:
+    """
+    예방접종 일정 데이터 스키마 검증
+
+    Args:
+        schedule_data: 파싱된 일정 JSON
+
+    Returns:
+        오류 메시지 리스트 (비어 있으면 유효)
+    """
+    errors: List[str] = []
+    if not isinstance(schedule_data, dict):
+        return ["최상위 값은 객체여야 합니다."]
+
+    settings = schedule_data.get("notification_settings")
+    advance_days = (
+        settings.get("default_advance_days") if isinstance(settings, dict) else None
+    )
+    # bool은 int의 하위 타입이므로 별도로 구분 (_check_fields와 같은 기준)
+    if (
+        not isinstance(advance_days, int)
+        or isinstance(advance_days, bool)
+        or advance_days < 0
+    ):
+        errors.append(
+            "notification_settings.default_advance_days는 0 이상 정수여야 합니다."
+        )
+
+    metadata = schedule_data.get("metadata", {})
+    if not isinstance(metadata, dict) or not isinstance(metadata.get("version"), str):
+        errors.append("metadata.version은 문자열이어야 합니다.")
+
+    vaccinations = schedule_data.get("vaccinations")
+    if not isinstance(vaccinations, list) or not vaccinations:
+        errors.append("vaccinations는 비어 있지 않은 배열이어야 합니다.")
+        return errors
+
+    vaccine_ids = set()
+    for i, vaccine in enumerate(vaccinations):
+        where = f"vaccinations[{i}]"
+        if not _check_fields(vaccine, _VACCINE_FIELDS, where, errors):
+            continue
+        if vaccine.get("id") in vaccine_ids:
+            errors.append(f"{where}: 중복된 id {vaccine['id']}")
+        vaccine_ids.add(vaccine.get("id"))
+        if vaccine.get("vaccine_type") not in VACCINE_TYPES:
+            errors.append(
+                f"{where}: vaccine_type은 {VACCINE_TYPES} 중 하나여야 합니다."
+            )
+
+        dose_numbers = set()
+        for j, dose in enumerate(vaccine.get("schedules") or []):
+            dose_where = f"{where}.schedules[{j}]"
+            if not _check_fields(dose, _DOSE_FIELDS, dose_where, errors):
+                continue
+            if dose.get("dose_number") in dose_numbers:
+                errors.append(f"{dose_where}: 중복된 dose_number {dose['dose_number']}")
+            dose_numbers.add(dose.get("dose_number"))
+            if isinstance(dose.get("age_in_months"), int) and dose["age_in_months"] < 0:
+                errors.append(f"{dose_where}: age_in_months는 0 이상이어야 합니다.")
+            if "gender" in dose and dose["gender"] not in GENDERS:
+                errors.append(f"{dose_where}: gender는 {GENDERS} 중 하나여야 합니다.")
+
+    return errors
+
+
+class ScheduleIndex(NamedTuple):
+    """접종일 순으로 정렬된 아이별 일정 인덱스 (bisect 조회용)"""
+
+    items: Tuple[ScheduleItem, ...]
+    ordinals: List[int]  # items의 접종일 서수 (date.toordinal)
+    mandatory_items: Tuple[ScheduleItem, ...]
+    mandatory_ordinals: List[int]
+
 
 class ImmunizationScheduleCalculator:
     """예방접종 일정 계산기"""
 
-    def __init__(self, schedule_json_path: str = "immunization_schedule_2025.json"):
+    def __init__(
+        self,
+        schedule_json_path: str = "immunization_schedule_2025.json",
+        schedule_data: Optional[Dict] = None,
+        index_cache_size: int = 4096,
+        validate: bool = True,
+    ):
         """
         Args:
             schedule_json_path: 예방접종 일정 JSON 파일 경로
+            schedule_data: 이미 파싱된 일정 데이터 (주어지면 파일을 읽지 않음)
+            index_cache_size: (출생일, 성별)별 일정 인덱스 LRU 캐시 크기
+            validate: 일정 데이터 스키마 검증 여부
+
+        Raises:
+            ScheduleValidationError: 스키마 검증 실패 시
         """
-        with open(schedule_json_path, "r", encoding="utf-8") as f:
-            self.schedule_data = json.load(f)
+        if schedule_data is None:
+            with open(schedule_json_path, "r", encoding="utf-8") as f:
+                schedule_data = json.load(f)
+
+        errors = validate_schedule_data(schedule_data) if validate else []
+        if errors:
+            raise ScheduleValidationError(errors)
+
+        self.schedule_data = schedule_data
+        self.version = schedule_data.get("metadata", {}).get("version")
+        self.compiled_path: Optional[Path] = None  # 컴파일 파일에서 로드한 경우
+        self._dose_infos: Dict[bool, Tuple[DoseInfo, ...]] = {}
+        self._dose_tables: Dict[bool, Dict[str, np.ndarray]] = {}
+        self._schedule_index = lru_cache(maxsize=index_cache_size)(
+            self._build_schedule_index
+        )
 
         self.notification_advance_days = self.schedule_data["notification_settings"][
             "default_advance_days"
@@ -63,6 +288,131 @@ class ImmunizationScheduleCalculator:
         """
         return vaccination_date - timedelta(days=self.notification_advance_days)
 
+    def _doses(self, include_optional: bool) -> Tuple["DoseInfo", ...]:
+        """
+        접종 차수 메타데이터 (JSON 순서, 계산기 단위로 한 번만 생성)
+
+        Args:
+            include_optional: 기타(선택) 접종 포함 여부
+
+        Returns:
+            DoseInfo 튜플 (모든 ScheduleItem이 공유)
+        """
+        if include_optional in self._dose_infos:
+            return self._dose_infos[include_optional]
+
+        doses = tuple(
+            DoseInfo(
+                vaccine_id=vaccine["id"],
+                vaccine_name=sys.intern(vaccine["vaccine_name"]),
+                disease=sys.intern(vaccine["disease"]),
+                dose_number=dose["dose_number"],
+                age_description=sys.intern(dose["age_description"]),
+                age_in_months=dose["age_in_months"],
+                max_age_in_weeks=dose.get("max_age_in_weeks"),
+                gender=dose.get("gender"),
+                is_mandatory=dose.get("is_mandatory", False),
+                is_annual=dose.get("is_annual", False),
+                notes=sys.intern(dose.get("notes", "")),
+                age_range_end=dose.get("age_range_end"),
+            )
+            for vaccine in self.schedule_data["vaccinations"]
+            # 국가필수만 또는 모든 접종
+            if include_optional or vaccine["vaccine_type"] != "기타"
+            for dose in vaccine["schedules"]
+        )
+        self._dose_infos[include_optional] = doses
+        return doses
+
+    def _build_schedule_index(
+        self, birth_date: date, gender: Optional[str], include_optional: bool
+    ) -> "ScheduleIndex":
+        """
+        아이 한 명의 정렬된 일정 인덱스 생성 (LRU 캐시 대상)
+
+        Args:
+            birth_date: 아이의 출생일 (date)
+            gender: 성별
+            include_optional: 기타(선택) 접종 포함 여부
+
+        Returns:
+            ScheduleIndex
+        """
+        items = []
+        for dose in self._doses(include_optional):
+            # 성별 필터링 (HPV 등)
+            if dose.gender and gender and dose.gender != gender:
+                continue
+
+            vaccination_date = self.calculate_vaccination_date(
+                birth_date, dose.age_in_months, dose.max_age_in_weeks
+            )
+            items.append(
+                ScheduleItem(
+                    dose=dose,
+                    vaccination_date=vaccination_date,
+                    notification_date=self.calculate_notification_date(
+                        vaccination_date
+                    ),
+                )
+            )
+
+        # 접종일 기준 정렬 (같은 날짜는 JSON 순서 유지)
+        items.sort(key=lambda item: item.vaccination_date)
+        mandatory = [item for item in items if item.dose.is_mandatory]
+
+        return ScheduleIndex(
+            items=tuple(items),
+            ordinals=[item.vaccination_date.toordinal() for item in items],
+            mandatory_items=tuple(mandatory),
+            mandatory_ordinals=[
+                item.vaccination_date.toordinal() for item in mandatory
+            ],
+        )
+
+    def get_schedule_index(
+        self,
+        birth_date: date,
+        gender: Optional[str] = None,
+        include_optional: bool = False,
+    ) -> "ScheduleIndex":
+        """
+        (출생일, 성별) 단위로 캐시된 일정 인덱스 조회
+
+        출생일은 날짜 단위로 취급합니다 (datetime이면 날짜만 사용).
+
+        Args:
+            birth_date: 아이의 출생일
+            gender: 성별 ('male', 'female', None)
+            include_optional: 기타(선택) 접종 포함 여부
+
+        Returns:
+            ScheduleIndex
+        """
+        if isinstance(birth_date, datetime):
+            birth_date = birth_date.date()
+
+        return self._schedule_index(birth_date, gender, include_optional)
+
+    def iter_child_schedule(
+        self,
+        birth_date: date,
+        gender: Optional[str] = None,
+        include_optional: bool = False,
+    ) -> Iterator["ScheduleItem"]:
+        """
+        아이의 전체 예방접종 일정을 접종일 순으로 생성 (제너레이터)
+
+        Args:
+            birth_date: 아이의 출생일
+            gender: 성별 ('male', 'female', None)
+            include_optional: 기타(선택) 접종 포함 여부
+
+        Yields:
+            ScheduleItem (접종일/알림일은 date 객체)
+        """
+        yield from self.get_schedule_index(birth_date, gender, include_optional).items
+
     def get_child_schedule(
         self,
         birth_date: datetime,
@@ -72,6 +422,8 @@ class ImmunizationScheduleCalculator:
         """
         아이의 전체 예방접종 일정 생성
 
+        iter_child_schedule 결과를 기존 딕셔너리 형식으로 변환합니다.
+
         Args:
             birth_date: 아이의 출생일
             gender: 성별 ('male', 'female', None)
@@ -80,53 +432,65 @@ class ImmunizationScheduleCalculator:
         Returns:
             접종 일정 리스트 (알림일 포함)
         """
-        schedule = []
-        today = datetime.now()
+        now = datetime.now()
 
-        for vaccine in self.schedule_data["vaccinations"]:
-            # 국가필수만 또는 모든 접종
-            if vaccine["vaccine_type"] == "기타" and not include_optional:
-                continue
+        return [
+            item.to_dict(now)
+            for item in self.iter_child_schedule(birth_date, gender, include_optional)
+        ]
 
-            for dose in vaccine["schedules"]:
-                # 성별 필터링 (HPV 등)
-                if "gender" in dose and gender and dose["gender"] != gender:
-                    continue
+    def get_upcoming_items(
+        self,
+        birth_date: date,
+        gender: Optional[str] = None,
+        days_ahead: int = 60,
+        now: Optional[datetime] = None,
+    ) -> Tuple["ScheduleItem", ...]:
+        """
+        접종 예정일(자정)이 [now, now + N일] 구간에 있는 일정 (이진 탐색)
 
-                # 접종일 계산
-                max_weeks = dose.get("max_age_in_weeks")
-                vaccination_date = self.calculate_vaccination_date(
-                    birth_date, dose["age_in_months"], max_weeks
-                )
+        Args:
+            birth_date: 아이의 출생일
+            gender: 성별
+            days_ahead: 조회 기간 (기본 60일)
+            now: 기준 시각 (기본 현재 시각)
 
-                # 과거 접종은 제외하고 미래 일정만 포함 (옵션)
-                # if vaccination_date < today:
-                #     continue
+        Returns:
+            ScheduleItem 튜플
+        """
+        now = now or datetime.now()
+        index = self.get_schedule_index(birth_date, gender)
 
-                # 알림일 계산
-                notification_date = self.calculate_notification_date(vaccination_date)
+        # 자정이 아닌 시각이면 오늘 접종분은 이미 지난 것으로 취급
+        first = now.date().toordinal() + (0 if now.time() == time.min else 1)
+        last = (now + timedelta(days=days_ahead)).date().toordinal()
 
-                schedule_item = {
-                    "vaccine_id": vaccine["id"],
-                    "vaccine_name": vaccine["vaccine_name"],
-                    "disease": vaccine["disease"],
-                    "dose_number": dose["dose_number"],
-                    "age_description": dose["age_description"],
-                    "vaccination_date": vaccination_date.strftime("%Y-%m-%d"),
-                    "notification_date": notification_date.strftime("%Y-%m-%d"),
-                    "is_mandatory": dose.get("is_mandatory", False),
-                    "is_annual": dose.get("is_annual", False),
-                    "notes": dose.get("notes", ""),
-                    "age_range_end": dose.get("age_range_end"),
-                    "is_overdue": vaccination_date < today,
-                }
+        lo = bisect_left(index.ordinals, first)
+        hi = bisect_right(index.ordinals, last)
+        return index.items[lo:hi]
+
+    def get_overdue_items(
+        self,
+        birth_date: date,
+        gender: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> Tuple["ScheduleItem", ...]:
+        """
+        접종 예정일(자정)이 now 이전인 필수 일정 (이진 탐색)
 
-                schedule.append(schedule_item)
+        Args:
+            birth_date: 아이의 출생일
+            gender: 성별
+            now: 기준 시각 (기본 현재 시각)
 
-        # 접종일 기준 정렬
-        schedule.sort(key=lambda x: x["vaccination_date"])
+        Returns:
+            ScheduleItem 튜플
+        """
+        now = now or datetime.now()
+        index = self.get_schedule_index(birth_date, gender)
 
-        return schedule
+        end = now.date().toordinal() + (0 if now.time() == time.min else 1)
+        return index.mandatory_items[: bisect_left(index.mandatory_ordinals, end)]
 
     def get_upcoming_vaccinations(
         self, birth_date: datetime, gender: Optional[str] = None, days_ahead: int = 60
@@ -142,20 +506,13 @@ class ImmunizationScheduleCalculator:
         Returns:
             다가오는 접종 일정 리스트
         """
-        all_schedule = self.get_child_schedule(birth_date, gender)
-        today = datetime.now()
-        cutoff_date = today + timedelta(days=days_ahead)
+        now = datetime.now()
 
-        upcoming = [
-            item
-            for item in all_schedule
-            if today
-            <= datetime.strptime(item["vaccination_date"], "%Y-%m-%d")
-            <= cutoff_date
+        return [
+            item.to_dict(now)
+            for item in self.get_upcoming_items(birth_date, gender, days_ahead, now)
         ]
 
-        return upcoming
-
     def get_overdue_vaccinations(
         self, birth_date: datetime, gender: Optional[str] = None
     ) -> List[Dict]:
@@ -169,13 +526,369 @@ class ImmunizationScheduleCalculator:
         Returns:
             지연된 접종 리스트
         """
-        all_schedule = self.get_child_schedule(birth_date, gender)
+        now = datetime.now()
 
-        overdue = [
-            item for item in all_schedule if item["is_overdue"] and item["is_mandatory"]
+        return [
+            item.to_dict(now)
+            for item in self.get_overdue_items(birth_date, gender, now)
         ]
 
-        return overdue
+    def _dose_table(self, include_optional: bool) -> Dict[str, np.ndarray]:
+        """
+        일괄 계산용 접종 차수 테이블 (JSON 순서, 열 단위 배열)
+
+        Args:
+            include_optional: 기타(선택) 접종 포함 여부
+
+        Returns:
+            차수별 속성 배열 딕셔너리
+        """
+        if include_optional in self._dose_tables:
+            return self._dose_tables[include_optional]
+
+        doses = self._doses(include_optional)
+        table = {
+            "vaccine_id": np.array([d.vaccine_id for d in doses], dtype=np.int64),
+            "dose_number": np.array([d.dose_number for d in doses], dtype=np.int64),
+            "age_in_months": np.array([d.age_in_months for d in doses], dtype=np.int64),
+            # 0이면 월 단위 계산 (calculate_vaccination_date와 동일한 규칙)
+            "max_age_in_weeks": np.array(
+                [d.max_age_in_weeks or 0 for d in doses], dtype=np.int64
+            ),
+            "gender": np.array([d.gender or "" for d in doses], dtype=object),
+            "is_mandatory": np.array([d.is_mandatory for d in doses], dtype=bool),
+            "is_annual": np.array([d.is_annual for d in doses], dtype=bool),
+        }
+        self._dose_tables[include_optional] = table
+        return table
+
+    def get_schedules_bulk(
+        self,
+        birth_dates: Sequence,
+        genders: Optional[Sequence[Optional[str]]] = None,
+        include_optional: bool = False,
+        today: Optional[date] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        여러 아이의 예방접종 일정을 한 번에 계산 (배열 연산)
+
+        get_child_schedule과 같은 규칙(월말 보정, 주 단위 접종, 성별 필터,
+        접종일 기준 안정 정렬)을 datetime64 배열 연산으로 적용합니다.
+        출생일은 날짜 단위로 취급합니다.
+
+        Args:
+            birth_dates: 아이별 출생일 (date/datetime/datetime64)
+            genders: 아이별 성별 ('male', 'female', None), 생략 시 모두 None
+            include_optional: 기타(선택) 접종 포함 여부
+            today: 지연 여부 판단 기준일 (기본 오늘)
+
+        Returns:
+            행 단위로 정렬된 열 배열 딕셔너리
+            (child_index, vaccine_id, dose_number, is_mandatory, is_annual,
+            vaccination_date, notification_date, is_overdue)
+        """
+        table = self._dose_table(include_optional)
+        births = np.asarray(birth_dates, dtype="datetime64[D]").reshape(-1)
+        n_children = births.shape[0]
+
+        # 월 단위: 목표 월의 1일 + min(출생일의 일 - 1, 목표 월 일수 - 1)
+        birth_months = births.astype("datetime64[M]")
+        day_offset = (births - birth_months.astype("datetime64[D]")).astype(np.int64)
+        target_months = birth_months[:, None] + table["age_in_months"].astype(
+            "timedelta64[M]"
+        )
+        month_starts = target_months.astype("datetime64[D]")
+        month_lengths = (
+            (target_months + np.timedelta64(1, "M")).astype("datetime64[D]")
+            - month_starts
+        ).astype(np.int64)
+        by_month = month_starts + np.minimum(day_offset[:, None], month_lengths - 1)
+
+        # 주 단위 (BCG 등)
+        weeks = table["max_age_in_weeks"]
+        by_week = births[:, None] + (weeks * 7).astype("timedelta64[D]")
+        vaccination = np.where(weeks[None, :] > 0, by_week, by_month)
+
+        # 성별 필터링 (HPV 등)
+        if genders is None:
+            keep = np.ones(vaccination.shape, dtype=bool)
+        else:
+            child_genders = np.array([g or "" for g in genders], dtype=object).reshape(
+                -1
+            )
+            dose_genders = table["gender"]
+            keep = ~(
+                (dose_genders[None, :] != "")
+                & (child_genders[:, None] != "")
+                & (dose_genders[None, :] != child_genders[:, None])
+            )
+
+        # 아이별 접종일 기준 안정 정렬 후 필터 적용
+        order = np.argsort(vaccination, axis=1, kind="stable")
+        vaccination = np.take_along_axis(vaccination, order, axis=1)
+        keep = np.take_along_axis(keep, order, axis=1)
+
+        dose_index = order[keep]
+        vaccination_dates = vaccination[keep]
+        child_index = np.broadcast_to(np.arange(n_children)[:, None], order.shape)[keep]
+
+        # 자정 기준 접종일 < 현재 시각 (get_child_schedule) == 접종일 <= 오늘
+        today64 = np.datetime64(today or date.today(), "D")
+
+        return {
+            "child_index": child_index,
+            "vaccine_id": table["vaccine_id"][dose_index],
+            "dose_number": table["dose_number"][dose_index],
+            "is_mandatory": table["is_mandatory"][dose_index],
+            "is_annual": table["is_annual"][dose_index],
+            "vaccination_date": vaccination_dates,
+            "notification_date": vaccination_dates
+            - np.timedelta64(self.notification_advance_days, "D"),
+            "is_overdue": vaccination_dates <= today64,
+        }
+
+
+def _compiled_format() -> bytes:
+    """
+    컴파일 파일 포맷 식별자 (8바이트)
+
+    pickle에 담기는 DoseInfo/ScheduleItem의 필드 이름과 타입에서 만들므로,
+    필드가 바뀌면 이전에 만든 컴파일 파일은 자동으로 무시됩니다.
+    """
+    layout = [
+        (
+            cls.__name__,
+            [(name, repr(cls.__annotations__[name])) for name in cls._fields],
+        )
+        for cls in (DoseInfo, ScheduleItem)
+    ]
+    return hashlib.sha256(repr(layout).encode()).digest()[:8]
+
+
+# 컴파일된 일정 파일: MAGIC + 포맷 식별자(8바이트) + 원본 JSON sha256(32바이트) + pickle
+COMPILED_MAGIC = b"MAMYSCH"
+COMPILED_FORMAT = _compiled_format()
+COMPILED_SUFFIX = ".compiled"
+_COMPILED_HEADER_SIZE = len(COMPILED_MAGIC) + len(COMPILED_FORMAT) + 32
+
+
+def compiled_path_for(schedule_json_path: str | os.PathLike) -> Path:
+    """일정 JSON에 대응하는 컴파일 파일 경로"""
+    return Path(schedule_json_path).with_suffix(COMPILED_SUFFIX)
+
+
+def compile_schedule(
+    schedule_json_path: str | os.PathLike = DEFAULT_SCHEDULE_PATH,
+    output_path: Optional[str | os.PathLike] = None,
+) -> Path:
+    """
+    일정 JSON을 검증하고 차수 테이블을 미리 풀어 둔 바이너리 파일로 컴파일
+
+    Args:
+        schedule_json_path: 예방접종 일정 JSON 파일 경로
+        output_path: 출력 경로 (기본: JSON 옆의 .compiled 파일)
+
+    Returns:
+        생성된 파일 경로
+
+    Raises:
+        ScheduleValidationError: 스키마 검증 실패 시
+    """
+    raw = Path(schedule_json_path).read_bytes()
+    calculator = ImmunizationScheduleCalculator(
+        schedule_data=json.loads(raw.decode("utf-8"))
+    )
+
+    payload = {
+        "schedule_data": calculator.schedule_data,
+        # include_optional별 DoseInfo 행 (주/월 단위, 성별, 필수 여부 포함)
+        "doses": {
+            include_optional: [
+                tuple(dose) for dose in calculator._doses(include_optional)
+            ]
+            for include_optional in (False, True)
+        },
+    }
+    header = COMPILED_MAGIC + COMPILED_FORMAT + hashlib.sha256(raw).digest()
+
+    output_path = Path(output_path or compiled_path_for(schedule_json_path))
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    tmp_path.write_bytes(
+        header + pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def load_compiled_schedule(
+    compiled_path: str | os.PathLike, source_digest: Optional[bytes] = None
+) -> Optional[ImmunizationScheduleCalculator]:
+    """
+    컴파일된 일정 파일로 계산기 생성
+
+    Args:
+        compiled_path: 컴파일 파일 경로
+        source_digest: 원본 JSON sha256 (주어지면 일치할 때만 사용)
+
+    Returns:
+        계산기, 파일이 없거나 포맷/원본이 다르거나 손상됐으면 None
+        (호출하는 쪽은 JSON으로 대체)
+    """
+    try:
+        with open(compiled_path, "rb") as f:
+            header = f.read(_COMPILED_HEADER_SIZE)
+            if (
+                len(header) != _COMPILED_HEADER_SIZE
+                or header[:-32] != COMPILED_MAGIC + COMPILED_FORMAT
+            ):
+                return None
+            if source_digest is not None and header[-32:] != source_digest:
+                return None
+            payload = pickle.load(f)
+
+        # 빌드 시 검증된 데이터이므로 다시 검증하지 않음
+        calculator = ImmunizationScheduleCalculator(
+            schedule_data=payload["schedule_data"], validate=False
+        )
+        dose_infos = {
+            include_optional: tuple(DoseInfo(*row) for row in rows)
+            for include_optional, rows in payload["doses"].items()
+        }
+    except (
+        OSError,
+        IndexError,
+        pickle.UnpicklingError,
+        EOFError,
+        TypeError,
+        ValueError,
+        KeyError,
+        AttributeError,
+    ):
+        # 잘린 파일, 다른 포맷의 행 등: 컴파일 파일 없이 JSON으로 로드
+        return None
+
+    calculator.compiled_path = Path(compiled_path)
+    calculator._dose_infos.update(dose_infos)
+    return calculator
+
+
+class _RegistryEntry(NamedTuple):
+    """레지스트리에 보관되는 계산기와 파일 시그니처"""
+
+    calculator: ImmunizationScheduleCalculator
+    signature: Tuple[int, int]  # (mtime_ns, size)
+    digest: str  # 파일 내용 sha256
+    checked_at: float  # 마지막 파일 확인 시각 (monotonic)
+
+
+class ScheduleRegistry:
+    """
+    프로세스 전역 예방접종 계산기 레지스트리
+
+    일정 JSON 경로별로 계산기를 한 번만 만들어 재사용합니다.
+    파일의 mtime/크기가 바뀌면 내용 해시를 비교해 실제로 변경된 경우에만
+    다시 파싱하고, 새 계산기로 원자적으로 교체합니다.
+    해시가 일치하는 컴파일 파일(compile_schedule)이 있으면 그것을 사용합니다.
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        """
+        Args:
+            check_interval: 파일 변경 여부를 다시 확인하기까지의 최소 간격(초)
+        """
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _RegistryEntry] = {}
+        self.load_count = 0
+        self.reload_count = 0
+
+    def get(
+        self, schedule_json_path: str | os.PathLike = DEFAULT_SCHEDULE_PATH
+    ) -> ImmunizationScheduleCalculator:
+        """
+        경로에 해당하는 계산기 반환 (필요 시 로드/리로드)
+
+        Args:
+            schedule_json_path: 예방접종 일정 JSON 파일 경로
+
+        Returns:
+            공유 계산기 인스턴스
+        """
+        path = str(Path(schedule_json_path).resolve())
+        entry = self._entries.get(path)
+        if entry is not None and self._is_fresh(entry):
+            return entry.calculator
+
+        with self._lock:
+            # 대기하는 동안 다른 스레드가 이미 갱신했을 수 있음
+            entry = self._entries.get(path)
+            if entry is not None and self._is_fresh(entry):
+                return entry.calculator
+
+            now = monotonic()
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if entry is not None and entry.signature == signature:
+                self._entries[path] = entry._replace(checked_at=now)
+                return entry.calculator
+
+            with open(path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry is not None and entry.digest == digest:
+                # touch 등으로 mtime만 바뀐 경우: 다시 파싱하지 않음
+                self._entries[path] = entry._replace(
+                    signature=signature, checked_at=now
+                )
+                return entry.calculator
+
+            # 원본과 일치하는 컴파일 파일이 있으면 JSON 파싱/검증 생략
+            calculator = load_compiled_schedule(
+                compiled_path_for(path), source_digest=bytes.fromhex(digest)
+            ) or ImmunizationScheduleCalculator(
+                path, schedule_data=json.loads(raw.decode("utf-8"))
+            )
+            self._entries[path] = _RegistryEntry(calculator, signature, digest, now)
+            if entry is None:
+                self.load_count += 1
+            else:
+                self.reload_count += 1
+            return calculator
+
+    def _is_fresh(self, entry: _RegistryEntry) -> bool:
+        return monotonic() - entry.checked_at < self.check_interval
+
+    def stats(self) -> Dict:
+        """
+        로드/리로드 카운터와 현재 로드된 일정 버전 조회
+
+        Returns:
+            {"load_count", "reload_count", "schedules": {경로: 버전}}
+        """
+        return {
+            "load_count": self.load_count,
+            "reload_count": self.reload_count,
+            "schedules": {
+                path: entry.calculator.version for path, entry in self._entries.items()
+            },
+        }
+
+    def clear(self):
+        """등록된 계산기와 카운터 초기화 (테스트용)"""
+        with self._lock:
+            self._entries.clear()
+            self.load_count = 0
+            self.reload_count = 0
+
+
+schedule_registry = ScheduleRegistry()
+
+
+def get_calculator(
+    schedule_json_path: str | os.PathLike = DEFAULT_SCHEDULE_PATH,
+) -> ImmunizationScheduleCalculator:
+    """프로세스 전역 레지스트리에서 공유 계산기 조회"""
+    return schedule_registry.get(schedule_json_path)
 
 
 # ============== 사용 예시 ==============
@@ -0,0 +1,113 @@
+"""
+DB 작업 큐 워커
+
+jobs 테이블에서 실행할 작업을 점유해 실행합니다. 여러 프로세스를 동시에
+띄워도 한 작업은 한 워커만 실행합니다. SIGTERM/SIGINT를 받으면 현재
+배치를 마치고 종료합니다.
+
+실행 방법:
+    python manage.py run_worker
+    python manage.py run_worker --queue default --batch-size 20
+    python manage.py run_worker --once
+    python manage.py run_worker --stats
+"""
+
+import json
+import os
+import signal
+import socket
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.services import claim_jobs, queue_stats, requeue_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "DB 작업 큐의 작업을 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--queue", default="default", help="큐 이름")
+        parser.add_argument(
+            "--batch-size", type=int, default=10, help="한 번에 점유할 작업 수"
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="실행할 작업이 없을 때 대기 시간(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="지금 실행 가능한 작업만 처리하고 종료",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=0,
+            help="이 수만큼 실행한 뒤 종료 (0이면 제한 없음)",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="큐 지표를 JSON으로 출력하고 종료",
+        )
+
+    def handle(self, *args, **options):
+        queue = options["queue"]
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        if options["stats"]:
+            self.stdout.write(json.dumps(queue_stats(queue), ensure_ascii=False))
+            return
+
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        max_jobs = options["max_jobs"]
+        self.stopping = False
+        self._install_signal_handlers()
+
+        requeued = requeue_stale_jobs(queue)
+        if requeued:
+            self.stdout.write(f"ℹ️  멈춘 작업 {requeued}개를 다시 대기 상태로 돌림")
+
+        succeeded = failed = 0
+        while not self.stopping:
+            limit = batch_size
+            if max_jobs:
+                limit = min(limit, max_jobs - succeeded - failed)
+            jobs = claim_jobs(worker_id, queue=queue, limit=limit)
+            if not jobs:
+                if options["once"]:
+                    break
+                time.sleep(options["sleep"])
+                continue
+
+            for job in jobs:
+                if run_job(job):
+                    succeeded += 1
+                else:
+                    failed += 1
+                    self.stderr.write(
+                        f"❌ {job} 실패 ({job.attempts}/{job.max_attempts})"
+                    )
+
+            if max_jobs and succeeded + failed >= max_jobs:
+                break
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 작업 {succeeded}개 성공, {failed}개 실패")
+        )
+
+    def _install_signal_handlers(self):
+        def stop(signum, frame):
+            self.stopping = True
+
+        try:
+            signal.signal(signal.SIGTERM, stop)
+            signal.signal(signal.SIGINT, stop)
+        except ValueError:
+            # 메인 스레드가 아닌 곳(테스트 등)에서는 시그널 처리 생략
+            pass
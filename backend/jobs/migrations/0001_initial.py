@@ -0,0 +1,110 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Job",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "queue",
+                    models.CharField(
+                        default="default", max_length=50, verbose_name="큐"
+                    ),
+                ),
+                ("task", models.CharField(max_length=100, verbose_name="작업 이름")),
+                (
+                    "payload",
+                    models.JSONField(blank=True, default=dict, verbose_name="인자"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "실행 중"),
+                            ("succeeded", "완료"),
+                            ("dead", "실패(재시도 중단)"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="시도 횟수"),
+                ),
+                (
+                    "max_attempts",
+                    models.PositiveIntegerField(
+                        default=5, verbose_name="최대 시도 횟수"
+                    ),
+                ),
+                (
+                    "run_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="실행 예정 시간"
+                    ),
+                ),
+                (
+                    "locked_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="점유 시간"
+                    ),
+                ),
+                (
+                    "locked_by",
+                    models.CharField(
+                        blank=True, max_length=100, verbose_name="점유 워커"
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="마지막 오류"),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="종료 시간"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+            ],
+            options={
+                "verbose_name": "백그라운드 작업",
+                "verbose_name_plural": "백그라운드 작업",
+                "db_table": "jobs",
+                "ordering": ["run_at", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["queue", "status", "run_at"],
+                        name="jobs_queue_25c5e6_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """DB 기반 백그라운드 작업"""
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_DEAD = "dead"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_RUNNING, "실행 중"),
+        (STATUS_SUCCEEDED, "완료"),
+        (STATUS_DEAD, "실패(재시도 중단)"),
+    ]
+
+    queue = models.CharField(max_length=50, default="default", verbose_name="큐")
+    task = models.CharField(max_length=100, verbose_name="작업 이름")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="인자")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name="상태",
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name="시도 횟수")
+    max_attempts = models.PositiveIntegerField(default=5, verbose_name="최대 시도 횟수")
+    run_at = models.DateTimeField(default=timezone.now, verbose_name="실행 예정 시간")
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name="점유 시간")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="점유 워커")
+    last_error = models.TextField(blank=True, verbose_name="마지막 오류")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="종료 시간")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        db_table = "jobs"
+        verbose_name = "백그라운드 작업"
+        verbose_name_plural = "백그라운드 작업"
+        ordering = ["run_at", "id"]
+        indexes = [
+            # 워커가 실행할 작업을 찾는 조회 (queue, status, run_at 순)
+            models.Index(fields=["queue", "status", "run_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.get_status_display()})"
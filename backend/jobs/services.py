@@ -0,0 +1,263 @@
+"""
+DB 기반 작업 큐 서비스
+
+외부 브로커 없이 jobs 테이블만으로 작업을 등록하고 워커가 안전하게
+점유(claim)해서 실행합니다. PostgreSQL에서는 SELECT ... FOR UPDATE SKIP
+LOCKED를, 지원하지 않는 DB(SQLite 등)에서는 상태 조건부 UPDATE로
+한 작업을 한 워커만 가져가도록 합니다.
+"""
+
+import traceback
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Set
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+from jobs.models import Job
+
+# 재시도 대기 시간: BACKOFF_BASE_SECONDS * 2^(시도 횟수 - 1), 최대 BACKOFF_MAX_SECONDS
+BACKOFF_BASE_SECONDS = 10
+BACKOFF_MAX_SECONDS = 60 * 60
+
+# 실행 중인 채로 이 시간이 지나면 워커가 죽은 것으로 보고 다시 대기 상태로
+STALE_AFTER = timedelta(minutes=10)
+
+_tasks: Dict[str, Callable] = {}
+# 트랜잭션으로 감싸지 않고 실행하는 작업 (스스로 짧은 트랜잭션으로 나누는 일괄 작업)
+_non_atomic_tasks: Set[str] = set()
+
+
+def task(name: str, atomic: bool = True):
+    """
+    작업 핸들러 등록 데코레이터
+
+    Args:
+        name: 작업 이름
+        atomic: False면 핸들러 전체를 한 트랜잭션으로 감싸지 않음. 배치마다
+            커밋하는 일괄 작업용이며, 재시도해도 안전해야 합니다.
+
+    Usage:
+        @task("vaccinations.generate_schedules")
+        def generate_schedules(child_id):
+            ...
+    """
+
+    def decorator(func):
+        _tasks[name] = func
+        if not atomic:
+            _non_atomic_tasks.add(name)
+        return func
+
+    return decorator
+
+
+def get_task(name: str) -> Callable:
+    """등록된 작업 핸들러 조회"""
+    return _tasks[name]
+
+
+def enqueue(
+    task_name: str,
+    payload: Optional[dict] = None,
+    queue: str = "default",
+    run_at=None,
+    max_attempts: int = 5,
+) -> Job:
+    """
+    작업 등록
+
+    호출한 트랜잭션 안에서 INSERT 되므로, 트랜잭션이 롤백되면 작업도 사라집니다.
+
+    Args:
+        task_name: @task로 등록한 작업 이름
+        payload: 핸들러에 키워드 인자로 넘길 값 (JSON 직렬화 가능해야 함)
+        queue: 큐 이름
+        run_at: 실행 예정 시간 (기본: 즉시)
+        max_attempts: 최대 시도 횟수 (초과 시 dead 상태)
+
+    Returns:
+        생성된 Job
+    """
+    if task_name not in _tasks:
+        raise ValueError(f"등록되지 않은 작업입니다: {task_name}")
+
+    return Job.objects.create(
+        queue=queue,
+        task=task_name,
+        payload=payload or {},
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts,
+    )
+
+
+def claim_jobs(worker_id: str, queue: str = "default", limit: int = 10) -> List[Job]:
+    """
+    실행할 작업을 점유
+
+    Args:
+        worker_id: 워커 식별자 (locked_by에 기록)
+        queue: 큐 이름
+        limit: 한 번에 가져올 최대 작업 수
+
+    Returns:
+        running 상태로 바뀐 Job 리스트 (attempts 1 증가)
+    """
+    now = timezone.now()
+    due = Job.objects.filter(
+        queue=queue, status=Job.STATUS_PENDING, run_at__lte=now
+    ).order_by("run_at", "id")
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            jobs = list(due.select_for_update(skip_locked=True)[:limit])
+            for job in jobs:
+                _mark_running(job, worker_id, now)
+            Job.objects.bulk_update(
+                jobs, ["status", "attempts", "locked_at", "locked_by", "updated_at"]
+            )
+        return jobs
+
+    # SKIP LOCKED가 없는 DB: 상태 조건부 UPDATE가 성공한 작업만 가져감
+    return [job for job in due[:limit] if _claim_if_due(job, worker_id, now)]
+
+
+def _claim_if_due(job: Job, worker_id: str, now) -> bool:
+    """
+    조회 후에도 여전히 실행할 수 있는 작업이면 점유 (조건부 UPDATE)
+
+    조회와 UPDATE 사이에 다른 워커가 점유하고 실패 처리해 백오프로
+    미뤘을 수 있으므로 run_at을 다시 확인하고, 시도 횟수는 DB 값에서
+    늘립니다. 성공하면 job을 DB 값으로 갱신합니다.
+    """
+    updated = Job.objects.filter(
+        pk=job.pk, status=Job.STATUS_PENDING, run_at__lte=now
+    ).update(
+        status=Job.STATUS_RUNNING,
+        attempts=F("attempts") + 1,
+        locked_at=now,
+        locked_by=worker_id,
+        updated_at=now,
+    )
+    if updated:
+        job.refresh_from_db()
+    return bool(updated)
+
+
+def _mark_running(job: Job, worker_id: str, now):
+    job.status = Job.STATUS_RUNNING
+    job.attempts += 1
+    job.locked_at = now
+    job.locked_by = worker_id
+    job.updated_at = now
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """시도 횟수에 따른 재시도 대기 시간 (지수 백오프)"""
+    seconds = BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, BACKOFF_MAX_SECONDS))
+
+
+def run_job(job: Job) -> bool:
+    """
+    점유한 작업 실행 후 결과 기록
+
+    실패하면 지수 백오프로 다시 대기 상태로 돌리고, 최대 시도 횟수에
+    도달하면 dead 상태로 남깁니다.
+
+    Args:
+        job: claim_jobs로 점유한 Job
+
+    Returns:
+        성공 여부
+    """
+    try:
+        handler = get_task(job.task)
+        if job.task in _non_atomic_tasks:
+            handler(**job.payload)
+        else:
+            with transaction.atomic():
+                handler(**job.payload)
+    except Exception:
+        now = timezone.now()
+        job.last_error = traceback.format_exc()
+        job.locked_at = None
+        job.locked_by = ""
+        if job.attempts >= job.max_attempts:
+            job.status = Job.STATUS_DEAD
+            job.finished_at = now
+        else:
+            job.status = Job.STATUS_PENDING
+            job.run_at = now + backoff_delay(job.attempts)
+        job.save()
+        return False
+
+    job.status = Job.STATUS_SUCCEEDED
+    job.finished_at = timezone.now()
+    job.locked_at = None
+    job.locked_by = ""
+    job.last_error = ""
+    job.save()
+    return True
+
+
+def requeue_stale_jobs(queue: str = "default", stale_after=STALE_AFTER) -> int:
+    """
+    워커가 죽어 running 상태로 남은 작업을 다시 대기 상태로
+
+    시도 횟수를 다 쓴 작업은 dead로 바꿉니다. 워커를 죽게 만드는 작업이
+    끝없이 다시 실행되지 않게 하기 위함입니다 (run_job의 실패 처리와 같은 기준).
+
+    Returns:
+        다시 대기 상태가 된 작업 수
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(
+        queue=queue,
+        status=Job.STATUS_RUNNING,
+        locked_at__lt=now - stale_after,
+    )
+    with transaction.atomic():
+        stale.filter(attempts__gte=F("max_attempts")).update(
+            status=Job.STATUS_DEAD,
+            locked_at=None,
+            locked_by="",
+            last_error="워커가 작업을 끝내지 못하고 멈춤 (최대 시도 횟수 도달)",
+            finished_at=now,
+            updated_at=now,
+        )
+        return stale.update(
+            status=Job.STATUS_PENDING,
+            locked_at=None,
+            locked_by="",
+            run_at=now,
+            updated_at=now,
+        )
+
+
+def queue_stats(queue: str = "default") -> dict:
+    """
+    큐 깊이 지표
+
+    Returns:
+        상태별 작업 수, 실행 가능한 대기 작업 수, 가장 오래된 대기 작업의 지연(초)
+    """
+    now = timezone.now()
+    jobs = Job.objects.filter(queue=queue)
+    counts = {status: 0 for status, _ in Job.STATUS_CHOICES}
+    counts.update(
+        jobs.order_by()
+        .values("status")
+        .annotate(count=Count("id"))
+        .values_list("status", "count")
+    )
+    due = jobs.filter(status=Job.STATUS_PENDING, run_at__lte=now)
+    oldest = due.aggregate(oldest=Min("run_at"))["oldest"]
+
+    return {
+        "queue": queue,
+        "counts": counts,
+        "due": due.count(),
+        "oldest_due_seconds": (now - oldest).total_seconds() if oldest else 0.0,
+    }
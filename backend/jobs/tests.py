@@ -0,0 +1,271 @@
+"""
+Jobs 앱 테스트
+
+실행 방법:
+    pytest jobs/tests.py
+    pytest jobs/tests.py::TestRunJob
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+
+@pytest.fixture
+def flaky_task():
+    """호출될 때마다 실패하는 테스트용 작업"""
+    from jobs.services import _tasks, task
+
+    calls = []
+
+    @task("tests.flaky")
+    def flaky(**kwargs):
+        calls.append(kwargs)
+        raise RuntimeError("boom")
+
+    yield calls
+    _tasks.pop("tests.flaky", None)
+
+
+@pytest.mark.django_db
+class TestEnqueueAndClaim:
+    """작업 등록/점유 테스트"""
+
+    def test_enqueue_unknown_task(self):
+        """등록되지 않은 작업은 거부"""
+        from jobs.services import enqueue
+
+        with pytest.raises(ValueError):
+            enqueue("tests.unknown")
+
+    def test_claim_marks_running(self, child):
+        """점유한 작업은 running 상태가 되고 다시 점유되지 않음"""
+        from jobs.models import Job
+        from jobs.services import claim_jobs, enqueue
+
+        job = enqueue("vaccinations.generate_schedules", {"child_id": child.pk})
+
+        claimed = claim_jobs("worker-1")
+        assert [j.pk for j in claimed] == [job.pk]
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_RUNNING
+        assert job.attempts == 1
+        assert job.locked_by == "worker-1"
+
+        assert claim_jobs("worker-2") == []
+
+    def test_claim_rechecks_job_requeued_meanwhile(self, child):
+        """조회 후 다른 워커가 실패 처리해 미룬 작업은 점유하지 않음"""
+        from jobs.models import Job
+        from jobs.services import _claim_if_due, enqueue
+
+        job = enqueue("vaccinations.generate_schedules", {"child_id": child.pk})
+        stale = Job.objects.get(pk=job.pk)
+        Job.objects.filter(pk=job.pk).update(
+            attempts=1, run_at=timezone.now() + timedelta(minutes=5)
+        )
+
+        assert _claim_if_due(stale, "worker-1", timezone.now()) is False
+        job.refresh_from_db()
+        assert (job.status, job.attempts) == (Job.STATUS_PENDING, 1)
+
+        # 백오프가 지나면 DB의 시도 횟수에서 1 증가
+        assert _claim_if_due(stale, "worker-1", timezone.now() + timedelta(minutes=6))
+        assert (stale.status, stale.attempts) == (Job.STATUS_RUNNING, 2)
+
+    def test_claim_skips_future_jobs(self, child):
+        """run_at이 미래인 작업은 점유하지 않음"""
+        from jobs.services import claim_jobs, enqueue
+
+        enqueue(
+            "vaccinations.generate_schedules",
+            {"child_id": child.pk},
+            run_at=timezone.now() + timedelta(hours=1),
+        )
+        assert claim_jobs("worker-1") == []
+
+
+@pytest.mark.django_db
+class TestRunJob:
+    """작업 실행/재시도 테스트"""
+
+    def test_success(self, child):
+        """성공한 작업은 succeeded 상태가 되고 일정이 생성됨"""
+        from jobs.models import Job
+        from jobs.services import claim_jobs, enqueue, run_job
+
+        enqueue("vaccinations.generate_schedules", {"child_id": child.pk})
+        (job,) = claim_jobs("worker-1")
+
+        assert run_job(job) is True
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_SUCCEEDED
+        assert job.finished_at is not None
+        assert child.vaccination_schedules.exists()
+
+    def test_retry_with_backoff(self, flaky_task):
+        """실패한 작업은 백오프 후 다시 대기 상태"""
+        from jobs.models import Job
+        from jobs.services import backoff_delay, claim_jobs, enqueue, run_job
+
+        enqueue("tests.flaky", {"n": 1})
+        (job,) = claim_jobs("worker-1")
+        before = timezone.now()
+
+        assert run_job(job) is False
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_PENDING
+        assert job.run_at >= before + backoff_delay(1)
+        assert "boom" in job.last_error
+        assert flaky_task == [{"n": 1}]
+
+    def test_dead_after_max_attempts(self, flaky_task):
+        """최대 시도 횟수에 도달하면 dead 상태"""
+        from jobs.models import Job
+        from jobs.services import claim_jobs, enqueue, run_job
+
+        job = enqueue("tests.flaky", max_attempts=2)
+        for _ in range(2):
+            Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+            (claimed,) = claim_jobs("worker-1")
+            run_job(claimed)
+
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_DEAD
+        assert job.attempts == 2
+
+    def test_non_atomic_task_keeps_committed_batches(self, child):
+        """atomic=False 작업은 실패해도 이미 처리한 변경이 남음"""
+        from children.models import Child
+        from jobs.services import (
+            _non_atomic_tasks,
+            _tasks,
+            claim_jobs,
+            enqueue,
+            run_job,
+            task,
+        )
+
+        @task("tests.partial", atomic=False)
+        def partial():
+            Child.objects.filter(pk=child.pk).update(name="변경됨")
+            raise RuntimeError("boom")
+
+        try:
+            enqueue("tests.partial")
+            (claimed,) = claim_jobs("worker-1")
+            assert run_job(claimed) is False
+        finally:
+            _tasks.pop("tests.partial", None)
+            _non_atomic_tasks.discard("tests.partial")
+
+        child.refresh_from_db()
+        assert child.name == "변경됨"
+
+    def test_backoff_is_capped(self):
+        """백오프는 최대 대기 시간을 넘지 않음"""
+        from jobs.services import BACKOFF_MAX_SECONDS, backoff_delay
+
+        assert backoff_delay(2) == 2 * backoff_delay(1)
+        assert backoff_delay(100).total_seconds() == BACKOFF_MAX_SECONDS
+
+    def test_requeue_stale_jobs(self, child):
+        """오래 running 상태로 남은 작업은 다시 대기 상태"""
+        from jobs.models import Job
+        from jobs.services import claim_jobs, enqueue, requeue_stale_jobs
+
+        job = enqueue("vaccinations.generate_schedules", {"child_id": child.pk})
+        claim_jobs("worker-1")
+        Job.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+
+        assert requeue_stale_jobs() == 1
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_PENDING
+
+    def test_stale_job_out_of_attempts_is_dead(self, child):
+        """시도 횟수를 다 쓴 멈춘 작업은 다시 실행하지 않고 dead"""
+        from jobs.models import Job
+        from jobs.services import claim_jobs, enqueue, requeue_stale_jobs
+
+        job = enqueue(
+            "vaccinations.generate_schedules", {"child_id": child.pk}, max_attempts=1
+        )
+        claim_jobs("worker-1")
+        Job.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+
+        assert requeue_stale_jobs() == 0
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_DEAD
+        assert job.finished_at is not None
+        assert job.last_error
+
+
+@pytest.mark.django_db
+class TestRunWorkerCommand:
+    """run_worker 명령 테스트"""
+
+    def test_once(self, child):
+        """--once는 실행 가능한 작업을 모두 처리하고 종료"""
+        from jobs.models import Job
+        from jobs.services import enqueue
+
+        enqueue("vaccinations.generate_schedules", {"child_id": child.pk})
+        out = StringIO()
+        call_command("run_worker", "--once", stdout=out)
+
+        assert "1개 성공" in out.getvalue()
+        assert Job.objects.get().status == Job.STATUS_SUCCEEDED
+
+    def test_stats(self, child):
+        """--stats는 상태별 작업 수를 출력"""
+        import json
+
+        from jobs.services import enqueue
+
+        enqueue("vaccinations.generate_schedules", {"child_id": child.pk})
+        out = StringIO()
+        call_command("run_worker", "--stats", stdout=out)
+
+        stats = json.loads(out.getvalue())
+        assert stats["counts"]["pending"] == 1
+        assert stats["due"] == 1
+
+
+@pytest.mark.django_db
+class TestSignupEnqueue:
+    """회원가입 시 일정 생성 작업 등록 테스트"""
+
+    def test_signup_enqueues_schedule_job(self):
+        """보호자 가입은 일정을 바로 만들지 않고 작업만 등록"""
+        from accounts.serializers import SignupSerializer
+        from jobs.models import Job
+        from vaccinations.models import VaccinationSchedule
+
+        serializer = SignupSerializer(
+            data={
+                "email": "parent@example.com",
+                "password": "secret123",
+                "confirm_password": "secret123",
+                "name": "보호자",
+                "user_mode": "caregiver",
+                "child_info": {
+                    "name": "아기",
+                    "birth_date": "2024-01-15",
+                    "gender": "female",
+                },
+            }
+        )
+        assert serializer.is_valid(), serializer.errors
+        user = serializer.save()
+
+        job = Job.objects.get()
+        assert job.task == "vaccinations.generate_schedules"
+        assert job.payload == {"child_id": user.children.get().pk}
+        assert not VaccinationSchedule.objects.exists()
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class VaccinationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "vaccinations"
+
+    def ready(self):
+        # 조회 응답 캐시 무효화 신호 등록
+        from vaccinations import signals  # noqa: F401
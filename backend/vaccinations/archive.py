@@ -0,0 +1,149 @@
+"""
+예방접종 알림 보관 (archival)
+
+보존 기간이 지난 발송/읽음 알림을 보관 테이블로 옮겨 원본 테이블과
+dispatcher가 훑는 (notification_date, status) 인덱스를 작게 유지합니다.
+
+배치마다 짧은 트랜잭션에서 보관 테이블 INSERT와 원본 DELETE를 함께
+커밋하므로, 중간에 멈춰도 다시 실행하면 남은 행부터 이어집니다.
+옮긴 알림은 앱에서도 사라지므로 델타 동기화용 삭제 기록을 함께 남깁니다.
+"""
+
+import time
+from datetime import date, timedelta
+from typing import Callable, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from vaccinations.models import (
+    SyncTombstone,
+    VaccinationNotification,
+    VaccinationNotificationArchive,
+)
+
+ARCHIVE_BATCH_SIZE = 1000
+
+# 보관 대상 상태 (대기/발송 중/실패 알림은 남김)
+ARCHIVABLE_STATUSES = ["sent", "read"]
+
+ARCHIVE_FIELDS = [
+    "id",
+    "schedule_id",
+    "notification_date",
+    "status",
+    "sent_at",
+    "read_at",
+]
+
+
+class ArchiveResult(NamedTuple):
+    """알림 보관 결과"""
+
+    moved: int
+    batches: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.moved / max(self.elapsed, 1e-9)
+
+
+def archive_cutoff(retention_days: Optional[int] = None, today: Optional[date] = None):
+    """이 날짜보다 알림일이 이른 알림이 보관 대상"""
+    if retention_days is None:
+        retention_days = settings.NOTIFICATION_RETENTION_DAYS
+    return (today or timezone.localdate()) - timedelta(days=retention_days)
+
+
+def archivable_notifications(cutoff: date):
+    """보관 대상 알림 (PK 순)"""
+    return VaccinationNotification.objects.filter(
+        status__in=ARCHIVABLE_STATUSES, notification_date__lt=cutoff
+    ).order_by("id")
+
+
+def archive_batch(cutoff: date, after_id: int = 0, limit: int = ARCHIVE_BATCH_SIZE):
+    """
+    보관 대상 알림 한 배치를 옮김 (한 트랜잭션)
+
+    Returns:
+        (옮긴 행 수, 마지막 ID) — 더 옮길 행이 없으면 (0, after_id)
+    """
+    with transaction.atomic():
+        rows = archivable_notifications(cutoff).filter(id__gt=after_id)
+        if connection.features.has_select_for_update_skip_locked:
+            # 보호자 조회용 JOIN 대상(일정/아이)까지 잠그지 않도록 of 지정
+            of = ("self",) if connection.features.has_select_for_update_of else ()
+            rows = rows.select_for_update(skip_locked=True, of=of)
+        rows = list(rows.values(*ARCHIVE_FIELDS, "schedule__child__user_id")[:limit])
+        if not rows:
+            return 0, after_id
+
+        # 앱 오프라인 저장소에서도 지워지도록 삭제 기록을 함께 남김
+        SyncTombstone.objects.bulk_create(
+            [
+                SyncTombstone(
+                    user_id=row.pop("schedule__child__user_id"),
+                    kind="notification",
+                    object_id=row["id"],
+                )
+                for row in rows
+            ]
+        )
+        VaccinationNotificationArchive.objects.bulk_create(
+            [VaccinationNotificationArchive(**row) for row in rows],
+            ignore_conflicts=True,
+        )
+        VaccinationNotification.objects.filter(
+            id__in=[row["id"] for row in rows]
+        ).delete()
+    return len(rows), rows[-1]["id"]
+
+
+def archive_notifications(
+    retention_days: Optional[int] = None,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    max_rows_per_second: float = 0,
+    limit: Optional[int] = None,
+    today: Optional[date] = None,
+    on_batch: Optional[Callable[[ArchiveResult], None]] = None,
+) -> ArchiveResult:
+    """
+    보존 기간이 지난 발송/읽음 알림을 배치 단위로 보관 테이블로 이동
+
+    Args:
+        retention_days: 보존 기간(일) (기본: settings.NOTIFICATION_RETENTION_DAYS)
+        batch_size: 트랜잭션당 행 수
+        max_rows_per_second: 초당 최대 이동 행 수 (0이면 제한 없음)
+        limit: 이번 실행에서 옮길 최대 행 수
+        today: 기준일 (기본: 오늘)
+        on_batch: 배치마다 누적 결과를 받는 콜백 (진행 상황 출력용)
+
+    Returns:
+        ArchiveResult
+    """
+    cutoff = archive_cutoff(retention_days, today)
+    started = time.monotonic()
+    moved = batches = 0
+    last_id = 0
+
+    while limit is None or moved < limit:
+        size = batch_size if limit is None else min(batch_size, limit - moved)
+        count, last_id = archive_batch(cutoff, last_id, size)
+        if not count:
+            break
+        moved += count
+        batches += 1
+
+        if on_batch:
+            on_batch(ArchiveResult(moved, batches, time.monotonic() - started))
+
+        if max_rows_per_second:
+            # 목표 속도보다 빠르면 그만큼 쉬어 DB 부하를 제한
+            ahead = moved / max_rows_per_second - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    return ArchiveResult(moved, batches, time.monotonic() - started)
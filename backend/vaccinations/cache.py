@@ -0,0 +1,170 @@
+"""
+예방접종 조회 응답 캐시
+
+아이별 일정 목록/통계/다가오는 접종의 렌더링된 응답(JSON 바이트)과
+가족 캘린더(.ics)를 ETag와 함께 Django 캐시 프레임워크(locmem, 파일,
+memcached, redis 등)에 저장합니다.
+
+캐시 키: (보호자, 아이, 엔드포인트, 쿼리 파라미터, 오늘 날짜, 버전)
+- 보호자 ID가 키에 있으므로 캐시 적중 시 DB에서 소유 확인을 하지 않습니다.
+- 날짜가 키에 있으므로 자정이 지나면 is_overdue/is_upcoming이 새로 계산됩니다.
+- 버전은 아이별 토큰과 전체 토큰으로, 바꾸면 이전 항목은 더 이상 조회되지
+  않고 만료 시간이 지나 사라집니다. 토큰 키가 캐시에서 밀려나도 새 토큰을
+  만들므로 오래된 항목을 다시 읽지 않습니다.
+
+가족 캘린더 키는 버전 대신 아이/일정 데이터에서 만든 ETag를 씁니다
+(calendar_key 참고).
+
+무효화:
+- VaccinationSchedule, Child의 post_save/post_delete 신호 (signals.py)
+- 신호가 없는 bulk 경로(bulk_create, QuerySet.update)는 서비스에서 직접 호출
+"""
+
+import hashlib
+import time
+from datetime import date
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+
+KEY_PREFIX = "vaccinations"
+GLOBAL_VERSION_KEY = f"{KEY_PREFIX}:version"
+COUNTERS = ["hits", "misses", "stores", "invalidations"]
+
+
+def get_cache():
+    return caches[settings.VACCINATION_CACHE_ALIAS]
+
+
+def _child_version_key(child_id: int) -> str:
+    return f"{KEY_PREFIX}:child:{child_id}:version"
+
+
+def _new_token() -> str:
+    return format(time.time_ns(), "x")
+
+
+def _count(name: str, delta: int = 1):
+    """공유 카운터 증가 (캐시 백엔드의 incr, 키가 없으면 생성)"""
+    cache = get_cache()
+    key = f"{KEY_PREFIX}:stats:{name}"
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, delta)
+
+
+def _versions(*child_ids: int) -> str:
+    """전체/아이별 버전 토큰 (없으면 새로 만듦)"""
+    cache = get_cache()
+    keys = [GLOBAL_VERSION_KEY, *(_child_version_key(i) for i in child_ids)]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, _new_token(), timeout=None)
+            found[key] = cache.get(key)
+    return ".".join(str(found[key]) for key in keys)
+
+
+def response_key(
+    user_id: int,
+    child_id: int,
+    endpoint: str,
+    params: dict,
+    today: Optional[date] = None,
+) -> str:
+    """응답 캐시 키"""
+    raw = "&".join(f"{name}={params[name]}" for name in sorted(params))
+    return ":".join(
+        [
+            KEY_PREFIX,
+            "response",
+            str(user_id),
+            str(child_id),
+            endpoint,
+            hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest(),
+            (today or timezone.localdate()).isoformat(),
+            _versions(child_id),
+        ]
+    )
+
+
+def calendar_key(user_id: int, etag: str) -> str:
+    """
+    가족(보호자) 캘린더 캐시 키
+
+    ETag가 아이/일정 데이터에서 만들어지므로 버전 토큰 없이 ETag를 그대로
+    씁니다. 일정이 바뀌면 ETag와 함께 키가 바뀝니다.
+    날짜는 넣지 않습니다 (캘린더 내용은 오늘 날짜와 무관).
+    """
+    return ":".join(
+        [
+            KEY_PREFIX,
+            "calendar",
+            str(user_id),
+            hashlib.md5(etag.encode(), usedforsecurity=False).hexdigest(),
+        ]
+    )
+
+
+def get_response(key: str):
+    """
+    캐시된 (ETag, 본문 바이트, Content-Type)
+
+    Returns:
+        없으면 None
+    """
+    entry = get_cache().get(key)
+    _count("hits" if entry is not None else "misses")
+    return entry
+
+
+def set_response(key: str, etag: str, content: bytes, content_type: str):
+    get_cache().set(
+        key, (etag, content, content_type), settings.VACCINATION_CACHE_TIMEOUT
+    )
+    _count("stores")
+
+
+def _bump(keys: list):
+    get_cache().set_many({key: _new_token() for key in keys}, timeout=None)
+    _count("invalidations", len(keys))
+
+
+def invalidate_children(child_ids: Iterable[int]):
+    """
+    아이들의 캐시 항목 무효화
+
+    즉시 한 번, 트랜잭션 커밋 후 한 번 더 버전을 바꿉니다. 커밋 전에
+    다른 요청이 이전 데이터를 다시 캐시하는 경우를 막기 위함입니다.
+    """
+    keys = [_child_version_key(child_id) for child_id in set(child_ids)]
+    if not keys:
+        return
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+
+def invalidate_all():
+    """모든 아이의 캐시 항목 무효화 (일정 상태 일괄 전환 등)"""
+    _bump([GLOBAL_VERSION_KEY])
+    transaction.on_commit(lambda: _bump([GLOBAL_VERSION_KEY]))
+
+
+def cache_stats() -> dict:
+    """
+    적중/미스/저장/무효화 카운터와 적중률
+
+    백엔드가 용량 때문에 밀어낸 항목 수는 Django 캐시 API로 알 수 없으므로,
+    저장 대비 적중/미스로 가늠합니다.
+    """
+    cache = get_cache()
+    values = cache.get_many([f"{KEY_PREFIX}:stats:{name}" for name in COUNTERS])
+    stats = {name: values.get(f"{KEY_PREFIX}:stats:{name}", 0) for name in COUNTERS}
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
@@ -0,0 +1,455 @@
+"""
+예방접종 알림 발송 (dispatcher)
+
+대기 알림은 행으로 저장하지 않으므로, 일정의 notification_date 인덱스를
+범위 조회해 알림일이 된 일정을 찾고 배치 단위로 발송 백엔드로 보냅니다.
+발송에 실패해 재시도를 기다리는 알림만 pending 행으로 남아 있습니다.
+
+- 점유: 짧은 트랜잭션에서 sending 상태와 점유 토큰을 한 번에 기록
+  (가상 알림은 INSERT ... ON CONFLICT DO NOTHING, 재시도 알림은 상태 조건부
+  UPDATE이며 PostgreSQL은 SKIP LOCKED로 다른 dispatcher가 잡은 행을 건너뜀)
+- 묶음(digest): 같은 사용자/알림일의 알림은 형제 것까지 메시지 한 건으로 발송
+- 발송: 스레드 풀에서 동시에 전송 (DB 연결은 사용하지 않음)
+- 결과: 성공/실패를 각각 UPDATE 한 번으로 기록
+  실패한 알림은 다음 회차에 다시 시도하고, MAX_SEND_ATTEMPTS번 실패하면 failed
+
+발송 중 프로세스가 죽어 sending으로 남은 알림은 release_stale_claims가
+다시 대기 상태로 돌립니다.
+"""
+
+import time as time_module
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from vaccinations.models import (
+    UPCOMING_DAYS,
+    VaccinationNotification,
+    VaccinationSchedule,
+)
+from vaccinations.senders import BaseSender, PushMessage, get_sender
+from vaccinations.services import unstored_notification_schedules
+
+DISPATCH_BATCH_SIZE = 1000
+DISPATCH_CONCURRENCY = 16
+MAX_SEND_ATTEMPTS = 3
+
+# digest로 함께 점유하는 같은 날 알림 수 상한: max(limit, 이 값)
+# (작은 배치에서도 한 사람의 하루치 알림은 나뉘지 않을 만큼)
+DIGEST_EXPANSION_MIN = 100
+
+# sending 상태로 이 시간이 지나면 발송 프로세스가 죽은 것으로 봄
+STALE_CLAIM_AFTER = timedelta(minutes=10)
+
+# 알림일이 이보다 오래 지난 가상 알림은 보내지 않음
+# (알림일은 접종일 1달 전이므로 접종일이 지난 알림은 의미가 없음)
+NOTIFICATION_LOOKBACK_DAYS = UPCOMING_DAYS
+
+
+class DispatchResult(NamedTuple):
+    """알림 발송 결과 (sent/failed는 알림 수, messages는 푸시 수)"""
+
+    claimed: int
+    messages: int
+    sent: int
+    failed: int
+    given_up: int
+    max_lag_seconds: float
+    elapsed: float
+
+    @property
+    def sent_per_second(self) -> float:
+        return self.sent / max(self.elapsed, 1e-9)
+
+
+def due_notifications(today: Optional[date] = None, claimed_before=None):
+    """
+    재시도 대상 알림 (저장된 대기 알림 중 알림일이 오늘 이전인 것, 알림일 순)
+
+    그 사이 접종을 완료한 일정의 알림은 보내지 않습니다.
+
+    Args:
+        today: 기준일 (기본: 오늘)
+        claimed_before: 이 시각 이후에 수정된 알림 제외 (같은 회차 재시도 방지)
+    """
+    queryset = VaccinationNotification.objects.filter(
+        status="pending",
+        notification_date__lte=today or timezone.localdate(),
+        schedule__is_completed=False,
+    )
+    if claimed_before is not None:
+        queryset = queryset.filter(updated_at__lt=claimed_before)
+    return queryset.order_by("notification_date", "id")
+
+
+def _lock_rows(queryset):
+    """SKIP LOCKED를 지원하면 알림 행만 잠금 (조인한 일정/아이 행은 잠그지 않음)"""
+    if not connection.features.has_select_for_update_skip_locked:
+        return queryset
+    if connection.features.has_select_for_update_of:
+        return queryset.select_for_update(skip_locked=True, of=("self",))
+    return queryset.select_for_update(skip_locked=True)
+
+
+def due_virtual_schedules(today: Optional[date] = None):
+    """
+    가상 알림 발송 대상 일정 (알림 행이 없고 알림일이 된 미완료 일정, 알림일 순)
+
+    notification_date 인덱스로 [today - NOTIFICATION_LOOKBACK_DAYS, today]
+    범위만 조회합니다.
+    """
+    today = today or timezone.localdate()
+    return unstored_notification_schedules(
+        VaccinationSchedule.objects.filter(
+            notification_date__gte=today - timedelta(days=NOTIFICATION_LOOKBACK_DAYS),
+            notification_date__lte=today,
+            is_completed=False,
+        )
+    ).order_by("notification_date", "id")
+
+
+def _digest_rows(queryset, user_field: str, rows, exclude, limit: int) -> list:
+    """
+    배치에 들어온 (사용자, 알림일) 쌍의 나머지 알림을 잠가서 반환 (최대 limit건)
+
+    user IN (...) AND notification_date IN (...)는 다른 사용자의 알림일과의
+    조합까지 포함하므로, 인덱스로 후보를 좁힌 뒤 정확한 쌍만 남깁니다.
+
+    Returns:
+        (id, 사용자 ID, 알림일) 리스트
+    """
+    pairs = {(user_id, notification_date) for _, user_id, notification_date in rows}
+    candidates = (
+        queryset.filter(
+            **{f"{user_field}__in": {user_id for user_id, _ in pairs}},
+            notification_date__in={notification_date for _, notification_date in pairs},
+        )
+        .exclude(id__in=exclude)
+        .values_list("id", user_field, "notification_date")
+    )
+    ids = list(
+        islice(
+            (row[0] for row in candidates.iterator() if (row[1], row[2]) in pairs),
+            limit,
+        )
+    )
+    if not ids:
+        return []
+    return list(
+        _lock_rows(queryset.filter(id__in=ids)).values_list(
+            "id", user_field, "notification_date"
+        )
+    )
+
+
+def claim_notifications(
+    limit: int = DISPATCH_BATCH_SIZE,
+    today: Optional[date] = None,
+    claimed_before=None,
+    digest: bool = True,
+) -> List[VaccinationNotification]:
+    """
+    발송할 알림 배치 점유 (재시도 알림 먼저, 남은 자리는 가상 알림)
+
+    같은 알림을 두 dispatcher가 동시에 잡아도 상태 조건부 UPDATE나
+    일정당 유일한 INSERT는 한쪽만 성공하므로, 토큰으로 실제로 점유한 행만
+    다시 읽습니다.
+
+    digest이면 배치에 들어온 (사용자, 알림일)의 나머지 알림도 함께
+    점유해, 같은 날 알림이 배치 경계에서 나뉘어 두 번 발송되지 않게 합니다.
+    함께 점유하는 알림은 max(limit, DIGEST_EXPANSION_MIN)건까지입니다.
+
+    Returns:
+        sending 상태가 된 알림 (schedule, child까지 함께 로드)
+    """
+    token = uuid.uuid4().hex
+    now = timezone.now()
+    with transaction.atomic():
+        # 재시도 알림: 저장된 pending 행을 sending으로
+        due = due_notifications(today, claimed_before)
+        rows = list(
+            _lock_rows(due).values_list(
+                "id", "schedule__child__user_id", "notification_date"
+            )[:limit]
+        )
+        ids = [row[0] for row in rows]
+        expansion = max(limit, DIGEST_EXPANSION_MIN)
+        if digest and rows:
+            ids += [
+                row[0]
+                for row in _digest_rows(
+                    due, "schedule__child__user_id", rows, ids, expansion
+                )
+            ]
+        if ids:
+            VaccinationNotification.objects.filter(id__in=ids, status="pending").update(
+                status="sending", claim_token=token, updated_at=now
+            )
+
+        # 가상 알림: 일정당 한 행을 sending으로 INSERT (충돌하면 건너뜀)
+        schedule_rows = []
+        if len(ids) < limit:
+            virtual = due_virtual_schedules(today)
+            schedule_rows = list(
+                _lock_rows(virtual).values_list(
+                    "id", "child__user_id", "notification_date"
+                )[: limit - len(ids)]
+            )
+            if digest and schedule_rows:
+                schedule_rows += _digest_rows(
+                    virtual,
+                    "child__user_id",
+                    schedule_rows,
+                    [row[0] for row in schedule_rows],
+                    expansion,
+                )
+            VaccinationNotification.objects.bulk_create(
+                [
+                    VaccinationNotification(
+                        schedule_id=schedule_id,
+                        notification_date=notification_date,
+                        status="sending",
+                        claim_token=token,
+                    )
+                    for schedule_id, _, notification_date in schedule_rows
+                ],
+                ignore_conflicts=True,
+            )
+
+    if not ids and not schedule_rows:
+        return []
+    return list(
+        VaccinationNotification.objects.filter(
+            Q(id__in=ids) | Q(schedule_id__in=[row[0] for row in schedule_rows]),
+            claim_token=token,
+        ).select_related("schedule__child")
+    )
+
+
+def _dose_label(notification: VaccinationNotification) -> str:
+    schedule = notification.schedule
+    return f"{schedule.vaccine_name} {schedule.dose_number}차"
+
+
+def build_messages(
+    notifications: List[VaccinationNotification],
+) -> List[PushMessage]:
+    """알림 한 건당 푸시 메시지 한 건"""
+    return [
+        PushMessage(
+            user_id=notification.schedule.child.user_id,
+            title="예방접종 알림",
+            body=(
+                f"{notification.schedule.child.name} {_dose_label(notification)} "
+                f"접종 예정일은 {notification.schedule.vaccination_date}입니다."
+            ),
+            notification_ids=(notification.pk,),
+        )
+        for notification in notifications
+    ]
+
+
+def build_digest_messages(
+    notifications: List[VaccinationNotification],
+) -> List[PushMessage]:
+    """
+    (사용자, 알림일)별로 묶어 메시지 한 건으로 발송
+
+    2/4/6개월처럼 여러 백신이 같은 날 예정이거나 형제가 같은 날 알림을
+    받는 경우 한 번의 푸시로 보냅니다.
+    """
+    groups = {}
+    for notification in notifications:
+        key = (notification.schedule.child.user_id, notification.notification_date)
+        groups.setdefault(key, []).append(notification)
+
+    messages = []
+    for (user_id, _), group in groups.items():
+        if len(group) == 1:
+            messages.extend(build_messages(group))
+            continue
+
+        by_child = {}
+        for notification in sorted(
+            group, key=lambda n: (n.schedule.vaccination_date, n.schedule.vaccine_id)
+        ):
+            by_child.setdefault(notification.schedule.child.name, []).append(
+                _dose_label(notification)
+            )
+        messages.append(
+            PushMessage(
+                user_id=user_id,
+                title=f"예방접종 알림 {len(group)}건",
+                body="\n".join(
+                    f"{name}: {', '.join(doses)}" for name, doses in by_child.items()
+                ),
+                notification_ids=tuple(n.pk for n in group),
+            )
+        )
+    return messages
+
+
+def send_messages(
+    messages: List[PushMessage], sender: BaseSender, executor: ThreadPoolExecutor
+) -> Tuple[List[int], List[int]]:
+    """
+    메시지를 스레드 풀에서 동시에 발송
+
+    Returns:
+        (성공한 알림 ID, 실패한 알림 ID)
+    """
+
+    def send(message):
+        try:
+            sender.send(message)
+        except Exception:
+            return False
+        return True
+
+    sent_ids, failed_ids = [], []
+    for message, ok in zip(messages, executor.map(send, messages)):
+        (sent_ids if ok else failed_ids).extend(message.notification_ids)
+    return sent_ids, failed_ids
+
+
+def record_results(
+    sent_ids: List[int], failed_ids: List[int], max_attempts: int = MAX_SEND_ATTEMPTS
+) -> int:
+    """
+    발송 결과를 상태별 UPDATE로 기록
+
+    발송 중에 사용자가 읽음 처리한 알림은 sending이 아니므로 건드리지 않습니다.
+
+    Returns:
+        재시도를 중단(failed)한 알림 수
+    """
+    now = timezone.now()
+    notifications = VaccinationNotification.objects
+    if sent_ids:
+        notifications.filter(id__in=sent_ids, status="sending").update(
+            status="sent",
+            sent_at=now,
+            attempts=F("attempts") + 1,
+            claim_token="",
+            updated_at=now,
+        )
+
+    given_up = 0
+    if failed_ids:
+        given_up = notifications.filter(
+            id__in=failed_ids, status="sending", attempts__gte=max_attempts - 1
+        ).update(
+            status="failed",
+            attempts=F("attempts") + 1,
+            claim_token="",
+            updated_at=now,
+        )
+        notifications.filter(id__in=failed_ids, status="sending").update(
+            status="pending",
+            attempts=F("attempts") + 1,
+            claim_token="",
+            updated_at=now,
+        )
+    return given_up
+
+
+def release_stale_claims(stale_after: timedelta = STALE_CLAIM_AFTER) -> int:
+    """sending 상태로 오래 남은 알림을 다시 대기 상태로"""
+    now = timezone.now()
+    return VaccinationNotification.objects.filter(
+        status="sending", updated_at__lt=now - stale_after
+    ).update(status="pending", claim_token="", updated_at=now)
+
+
+def _lag_seconds(notification_date: date, now: datetime) -> float:
+    """알림일 0시부터 발송 시점까지 지연(초)"""
+    due_at = timezone.make_aware(datetime.combine(notification_date, time.min))
+    return max((now - due_at).total_seconds(), 0.0)
+
+
+def dispatch_due_notifications(
+    sender: Optional[BaseSender] = None,
+    batch_size: int = DISPATCH_BATCH_SIZE,
+    concurrency: int = DISPATCH_CONCURRENCY,
+    limit: Optional[int] = None,
+    today: Optional[date] = None,
+    digest: bool = True,
+    on_batch: Optional[Callable[[DispatchResult], None]] = None,
+) -> DispatchResult:
+    """
+    발송 대상 알림이 없을 때까지 배치 단위로 점유 → 발송 → 기록
+
+    이번 회차에 실패한 알림은 다음 회차에 다시 시도합니다.
+
+    Args:
+        sender: 발송 백엔드 (기본: settings.NOTIFICATION_SENDER_BACKEND)
+        batch_size: 배치당 점유할 알림 수
+        concurrency: 동시 발송 스레드 수
+        limit: 이번 회차 최대 발송 시도 수
+        today: 기준일 (기본: 오늘)
+        digest: 같은 사용자/알림일의 알림을 메시지 한 건으로 묶을지 여부
+        on_batch: 배치마다 누적 결과를 받는 콜백 (진행 상황 출력용)
+
+    Returns:
+        DispatchResult (누적)
+    """
+    sender = sender or get_sender()
+    started_at = timezone.now()
+    started = time_module.monotonic()
+    claimed = message_count = sent = failed = given_up = 0
+    max_lag = 0.0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while limit is None or claimed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - claimed)
+            notifications = claim_notifications(
+                size, today, claimed_before=started_at, digest=digest
+            )
+            if not notifications:
+                break
+
+            if digest:
+                messages = build_digest_messages(notifications)
+            else:
+                messages = build_messages(notifications)
+            sent_ids, failed_ids = send_messages(messages, sender, executor)
+            given_up += record_results(sent_ids, failed_ids)
+
+            now = timezone.now()
+            claimed += len(notifications)
+            message_count += len(messages)
+            sent += len(sent_ids)
+            failed += len(failed_ids)
+            max_lag = max(
+                [max_lag]
+                + [_lag_seconds(n.notification_date, now) for n in notifications]
+            )
+
+            if on_batch:
+                on_batch(
+                    DispatchResult(
+                        claimed,
+                        message_count,
+                        sent,
+                        failed,
+                        given_up,
+                        max_lag,
+                        time_module.monotonic() - started,
+                    )
+                )
+
+    return DispatchResult(
+        claimed,
+        message_count,
+        sent,
+        failed,
+        given_up,
+        max_lag,
+        time_module.monotonic() - started,
+    )
@@ -0,0 +1,136 @@
+"""
+예방접종 일정 iCalendar(.ics, RFC 5545) 렌더링
+
+보호자의 모든 아이 일정을 종일 일정(VEVENT)으로 만듭니다. 일정은
+.values().iterator()로 읽어 한 건씩 문자열로 내보내므로 일정이 많아도
+모델 인스턴스나 전체 목록을 메모리에 올리지 않습니다.
+"""
+
+from datetime import date, timedelta, timezone
+from typing import Iterator
+
+from django.conf import settings
+
+from vaccinations.models import VaccinationSchedule
+
+CONTENT_TYPE = "text/calendar; charset=utf-8"
+PRODID = "-//mamy//vaccinations//KO"
+UID_DOMAIN = "mamy"
+# 캘린더 앱에 권하는 새로고침 간격 (일정은 자주 바뀌지 않음)
+REFRESH_INTERVAL = "PT12H"
+# RFC 5545: 한 줄은 줄바꿈 제외 75 옥텟 이하
+MAX_LINE_OCTETS = 75
+
+ITERATOR_CHUNK_SIZE = 500
+
+EVENT_FIELDS = [
+    "id",
+    "child__name",
+    "vaccine_name",
+    "disease",
+    "dose_number",
+    "age_description",
+    "vaccination_date",
+    "notification_date",
+    "is_completed",
+    "completed_date",
+    "updated_at",
+]
+
+
+def escape_text(value: str) -> str:
+    """TEXT 값 이스케이프 (\\ ; , 줄바꿈)"""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """
+    75 옥텟을 넘는 줄을 CRLF + 공백으로 접기
+
+    한글은 UTF-8로 3바이트이므로 문자 단위로 세어 멀티바이트 문자를
+    중간에서 자르지 않습니다.
+    """
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts, current, size = [], [], 0
+    for char in line:
+        octets = len(char.encode())
+        # 이어지는 줄은 맨 앞 공백 1옥텟 포함
+        limit = MAX_LINE_OCTETS if not parts else MAX_LINE_OCTETS - 1
+        if size + octets > limit:
+            parts.append("".join(current))
+            current, size = [], 0
+        current.append(char)
+        size += octets
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_date(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+
+def render_event(row: dict) -> str:
+    """일정 한 건 (EVENT_FIELDS의 .values() dict)을 VEVENT로"""
+    start = row["completed_date"] or row["vaccination_date"]
+    summary = f"{row['child__name']} {row['vaccine_name']} {row['dose_number']}차"
+    if row["is_completed"]:
+        summary += " (완료)"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:schedule-{row['id']}@{UID_DOMAIN}",
+        "DTSTAMP:"
+        + row["updated_at"].astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        f"DTSTART;VALUE=DATE:{format_date(start)}",
+        f"DTEND;VALUE=DATE:{format_date(start + timedelta(days=1))}",
+        f"SUMMARY:{escape_text(summary)}",
+        "DESCRIPTION:"
+        + escape_text(
+            f"{row['disease']} 예방접종\n권장 시기: {row['age_description']}"
+        ),
+        "TRANSP:TRANSPARENT",
+    ]
+    # 앱 알림과 같은 날 캘린더 알림
+    days_before = (row["vaccination_date"] - row["notification_date"]).days
+    if not row["is_completed"] and days_before > 0:
+        lines += [
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            f"DESCRIPTION:{escape_text(summary)}",
+            f"TRIGGER:-P{days_before}D",
+            "END:VALARM",
+        ]
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines)
+
+
+def render_calendar(user_id: int) -> Iterator[str]:
+    """보호자의 가족 캘린더를 VCALENDAR 조각 단위로 생성"""
+    yield "".join(
+        fold_line(line)
+        for line in [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            "X-WR-CALNAME:우리 아이 예방접종",
+            f"X-WR-TIMEZONE:{settings.TIME_ZONE}",
+            f"REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}",
+            f"X-PUBLISHED-TTL:{REFRESH_INTERVAL}",
+        ]
+    )
+    rows = (
+        VaccinationSchedule.objects.filter(child__user_id=user_id)
+        .order_by("vaccination_date", "id")
+        .values(*EVENT_FIELDS)
+    )
+    for row in rows.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield render_event(row)
+    yield fold_line("END:VCALENDAR")
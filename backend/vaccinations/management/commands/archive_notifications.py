@@ -0,0 +1,76 @@
+"""
+예방접종 알림 보관 명령
+
+보존 기간이 지난 발송/읽음 알림을 보관 테이블로 옮깁니다.
+이미 옮긴 행은 원본에서 지워지므로 중단 후 다시 실행하면 이어서 진행합니다.
+
+실행 방법:
+    python manage.py archive_notifications
+    python manage.py archive_notifications --older-than 90
+    python manage.py archive_notifications --max-rows-per-second 5000
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.archive import (
+    ARCHIVE_BATCH_SIZE,
+    archive_cutoff,
+    archive_notifications,
+)
+
+
+class Command(BaseCommand):
+    help = "보존 기간이 지난 발송/읽음 알림을 보관 테이블로 옮깁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=None,
+            help="보존 기간(일) (기본: settings.NOTIFICATION_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ARCHIVE_BATCH_SIZE,
+            help="트랜잭션당 행 수",
+        )
+        parser.add_argument(
+            "--max-rows-per-second",
+            type=float,
+            default=0,
+            help="초당 최대 이동 행 수 (0이면 제한 없음)",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=None, help="이번 실행에서 옮길 최대 행 수"
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+        if options["older_than"] is not None and options["older_than"] < 0:
+            raise CommandError("--older-than은 0 이상이어야 합니다.")
+
+        self.verbosity = options["verbosity"]
+        cutoff = archive_cutoff(options["older_than"])
+        self.stdout.write(f"ℹ️  알림일이 {cutoff} 이전인 발송/읽음 알림 보관")
+
+        result = archive_notifications(
+            retention_days=options["older_than"],
+            batch_size=options["batch_size"],
+            max_rows_per_second=options["max_rows_per_second"],
+            limit=options["limit"],
+            on_batch=self._report_batch,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 알림 {result.moved}건 보관 ({result.batches}개 배치, "
+                f"{result.rows_per_second:.1f} rows/s)"
+            )
+        )
+
+    def _report_batch(self, result):
+        if self.verbosity >= 2:
+            self.stdout.write(
+                f"  {result.moved}건 이동 ({result.rows_per_second:.1f} rows/s)"
+            )
@@ -0,0 +1,118 @@
+"""
+일정 목록 직렬화 벤치마크 명령
+
+VaccinationScheduleSerializer(ModelSerializer)와 읽기 전용 경로
+(serialize_schedules: .values() + SQL 주석)의 목록 직렬화 시간을 비교합니다.
+측정용 일정은 트랜잭션 안에서 만들고 끝나면 롤백하므로 DB에 남지 않습니다.
+
+실행 방법:
+    python manage.py benchmark_schedule_serialization
+    python manage.py benchmark_schedule_serialization --rows 10000 --repeat 5
+"""
+
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from children.models import Child
+from vaccinations.models import VaccinationSchedule
+from vaccinations.serializers import (
+    VaccinationScheduleSerializer,
+    serialize_schedules,
+)
+from vaccinations.services import BULK_BATCH_SIZE
+
+# 측정용 아이 한 명당 일정 수 (실제 일정표와 비슷한 규모)
+SCHEDULES_PER_CHILD = 40
+
+
+class Rollback(Exception):
+    """측정 데이터 롤백용"""
+
+
+class Command(BaseCommand):
+    help = "일정 목록 직렬화(ModelSerializer vs .values() 경로) 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=10000, help="측정할 일정 수 (기본 10000)"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)"
+        )
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+        if rows < 1 or repeat < 1:
+            raise CommandError("--rows와 --repeat은 1 이상이어야 합니다.")
+
+        try:
+            with transaction.atomic():
+                queryset = self._create_schedules(rows)
+                model = self._measure(
+                    lambda: (
+                        VaccinationScheduleSerializer(queryset.all(), many=True).data
+                    ),
+                    repeat,
+                )
+                fast = self._measure(lambda: serialize_schedules(queryset), repeat)
+                raise Rollback
+        except Rollback:
+            pass
+
+        self.stdout.write(f"일정 {rows}건, {repeat}회 중 최솟값")
+        self.stdout.write(
+            f"  ModelSerializer: {model * 1000:8.1f} ms ({rows / model:,.0f} rows/s)"
+        )
+        self.stdout.write(
+            f"  .values() 경로:  {fast * 1000:8.1f} ms ({rows / fast:,.0f} rows/s)"
+        )
+        self.stdout.write(self.style.SUCCESS(f"✅ {model / fast:.1f}배 빠름"))
+
+    def _create_schedules(self, rows: int):
+        """측정용 보호자/아이/일정 생성 (일정 QuerySet 반환)"""
+        user = get_user_model().objects.create_user(
+            username="benchmark-schedule-serialization"
+        )
+        children = Child.objects.bulk_create(
+            [
+                Child(
+                    user=user,
+                    name=f"벤치마크{i}",
+                    birth_date=date(2024, 1, 1),
+                    gender="male",
+                )
+                for i in range(-(-rows // SCHEDULES_PER_CHILD))
+            ]
+        )
+        today = timezone.localdate()
+        VaccinationSchedule.objects.bulk_create(
+            [
+                VaccinationSchedule(
+                    child=children[i // SCHEDULES_PER_CHILD],
+                    vaccine_id=i % SCHEDULES_PER_CHILD,
+                    vaccine_name="벤치마크",
+                    disease="벤치마크",
+                    dose_number=1,
+                    age_description="0개월",
+                    vaccination_date=today + timedelta(days=i % 120 - 60),
+                    notification_date=today + timedelta(days=i % 120 - 67),
+                    is_completed=i % 3 == 0,
+                )
+                for i in range(rows)
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
+        return VaccinationSchedule.objects.filter(child__user=user)
+
+    def _measure(self, func, repeat: int) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+        return max(best, 1e-9)
@@ -0,0 +1,66 @@
+"""
+아이별 예방접종 통계 정합성 검사 명령
+
+저장된 ChildVaccinationStats와 일정 테이블 집계를 비교합니다.
+불일치가 있으면 오류로 종료하고, --rebuild를 주면 해당 아이들의 통계를
+다시 집계합니다. --all은 전체 통계를 처음부터 다시 만듭니다.
+
+실행 방법:
+    python manage.py check_vaccination_stats
+    python manage.py check_vaccination_stats --rebuild
+    python manage.py check_vaccination_stats --rebuild --all
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from children.models import Child
+from vaccinations.services import (
+    BULK_BATCH_SIZE,
+    find_inconsistent_child_stats,
+    refresh_child_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "아이별 예방접종 통계와 일정 테이블의 정합성을 검사하고 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="불일치한 아이의 통계를 다시 집계",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="--rebuild와 함께 사용: 모든 아이의 통계를 다시 집계",
+        )
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            if not options["rebuild"]:
+                raise CommandError("--all은 --rebuild와 함께 사용해야 합니다.")
+            child_ids = list(Child.objects.order_by("pk").values_list("pk", flat=True))
+        else:
+            child_ids = find_inconsistent_child_stats()
+            if not child_ids:
+                self.stdout.write(self.style.SUCCESS("✅ 통계가 일정과 일치합니다."))
+                return
+            self.stdout.write(
+                f"⚠️  통계 불일치 {len(child_ids)}명: "
+                + ", ".join(map(str, child_ids[:20]))
+                + (" ..." if len(child_ids) > 20 else "")
+            )
+            if not options["rebuild"]:
+                raise CommandError(
+                    "통계가 일정과 일치하지 않습니다. --rebuild로 복구하세요."
+                )
+
+        for start in range(0, len(child_ids), BULK_BATCH_SIZE):
+            with transaction.atomic():
+                refresh_child_stats(child_ids[start : start + BULK_BATCH_SIZE])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 아이 {len(child_ids)}명의 통계 재생성")
+        )
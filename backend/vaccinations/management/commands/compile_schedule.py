@@ -0,0 +1,74 @@
+"""
+예방접종 일정 JSON 검증 및 컴파일 명령
+
+실행 방법:
+    python manage.py compile_schedule
+    python manage.py compile_schedule --check
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from immunization_calculator import (
+    DEFAULT_SCHEDULE_PATH,
+    ImmunizationScheduleCalculator,
+    ScheduleValidationError,
+    compile_schedule,
+    compiled_path_for,
+    load_compiled_schedule,
+)
+
+
+class Command(BaseCommand):
+    help = "예방접종 일정 JSON을 검증하고 워커 시작용 바이너리 파일로 컴파일합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            default=str(DEFAULT_SCHEDULE_PATH),
+            help="예방접종 일정 JSON 경로",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="출력 경로 (기본: JSON 옆의 .compiled 파일)",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="검증만 수행하고 파일은 쓰지 않음",
+        )
+
+    def handle(self, *args, **options):
+        source = Path(options["source"])
+        if not source.exists():
+            raise CommandError(f"일정 파일을 찾을 수 없습니다: {source}")
+
+        output = Path(options["output"] or compiled_path_for(source))
+
+        try:
+            if options["check"]:
+                ImmunizationScheduleCalculator(
+                    schedule_data=json.loads(source.read_text(encoding="utf-8"))
+                )
+                self.stdout.write(self.style.SUCCESS(f"✅ 검증 통과: {source}"))
+                return
+
+            compile_schedule(source, output)
+        except json.JSONDecodeError as e:
+            raise CommandError(f"JSON 형식 오류: {e}")
+        except ScheduleValidationError as e:
+            raise CommandError(
+                "일정 데이터 검증 실패:\n" + "\n".join(f"  - {err}" for err in e.errors)
+            )
+
+        calculator = load_compiled_schedule(output)
+        dose_count = len(calculator._doses(True))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {output} 생성 완료 "
+                f"(버전 {calculator.version}, 접종 차수 {dose_count}개)"
+            )
+        )
@@ -0,0 +1,124 @@
+"""
+예방접종 알림 발송 명령
+
+알림일이 지난 대기 알림을 배치 단위로 발송합니다. 여러 프로세스를 동시에
+실행해도 같은 알림을 두 번 보내지 않습니다.
+
+실행 방법:
+    python manage.py dispatch_notifications
+    python manage.py dispatch_notifications --batch-size 2000 --concurrency 32
+    python manage.py dispatch_notifications --loop --sleep 30
+"""
+
+import signal
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.dispatch import (
+    DISPATCH_BATCH_SIZE,
+    DISPATCH_CONCURRENCY,
+    dispatch_due_notifications,
+    release_stale_claims,
+)
+from vaccinations.senders import get_sender
+
+
+class Command(BaseCommand):
+    help = "알림일이 지난 예방접종 알림을 발송합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DISPATCH_BATCH_SIZE,
+            help="배치당 점유할 알림 수",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=DISPATCH_CONCURRENCY,
+            help="동시 발송 스레드 수",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=None, help="회차당 최대 발송 시도 수"
+        )
+        parser.add_argument(
+            "--backend",
+            default=None,
+            help="발송 백엔드 경로 (기본: settings.NOTIFICATION_SENDER_BACKEND)",
+        )
+        parser.add_argument(
+            "--no-digest",
+            action="store_true",
+            help="같은 날 알림을 묶지 않고 알림마다 따로 발송",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료 신호를 받을 때까지 반복 실행",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=30.0,
+            help="--loop에서 보낼 알림이 없을 때 대기 시간(초)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--batch-size와 --concurrency는 1 이상이어야 합니다.")
+
+        self.verbosity = options["verbosity"]
+        self.stopping = False
+        if options["loop"]:
+            self._install_signal_handlers()
+
+        sender = get_sender(options["backend"])
+        while True:
+            released = release_stale_claims()
+            if released:
+                self.stdout.write(f"ℹ️  멈춘 알림 {released}건을 다시 대기 상태로 돌림")
+
+            result = dispatch_due_notifications(
+                sender=sender,
+                batch_size=options["batch_size"],
+                concurrency=options["concurrency"],
+                limit=options["limit"],
+                digest=not options["no_digest"],
+                on_batch=self._report_batch,
+            )
+            if result.claimed or not options["loop"]:
+                self._report(result)
+
+            if not options["loop"] or self.stopping:
+                break
+            if not result.claimed:
+                time.sleep(options["sleep"])
+
+    def _report(self, result):
+        style = self.style.SUCCESS if not result.failed else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"{'✅' if not result.failed else '⚠️ '} 알림 {result.sent}건 발송 "
+                f"(푸시 {result.messages}건), "
+                f"실패 {result.failed}건 (재시도 중단 {result.given_up}건) "
+                f"({result.sent_per_second:.1f} sent/s, "
+                f"최대 지연 {result.max_lag_seconds:.0f}초)"
+            )
+        )
+
+    def _report_batch(self, result):
+        if self.verbosity >= 2:
+            self.stdout.write(
+                f"  {result.claimed}건 처리: 발송 {result.sent} "
+                f"(푸시 {result.messages}), 실패 {result.failed} "
+                f"({result.sent_per_second:.1f} sent/s)"
+            )
+
+    def _install_signal_handlers(self):
+        def stop(signum, frame):
+            self.stopping = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
@@ -0,0 +1,37 @@
+"""
+델타 동기화 삭제 기록 정리 명령
+
+보존 기간(settings.SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 삭제 기록을
+지웁니다. 그보다 오래된 cursor로 요청한 앱은 전체 동기화를 받습니다.
+
+실행 방법:
+    python manage.py prune_sync_tombstones
+
+cron 예시:
+    30 3 * * * cd /app/backend && python manage.py prune_sync_tombstones
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.sync import PRUNE_BATCH_SIZE, prune_tombstones, tombstone_cutoff
+
+
+class Command(BaseCommand):
+    help = "보존 기간이 지난 델타 동기화 삭제 기록을 정리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PRUNE_BATCH_SIZE,
+            help="트랜잭션당 행 수",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        self.stdout.write(f"ℹ️  {tombstone_cutoff():%Y-%m-%d %H:%M} 이전 삭제 기록 정리")
+        pruned = prune_tombstones(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"✅ 삭제 기록 {pruned}건 정리"))
@@ -0,0 +1,243 @@
+"""
+전체 아이의 예방접종 일정 재생성 명령
+
+일정표 JSON이 바뀌거나 계산 버그를 고친 뒤 기존 아이들의 일정을
+PK 구간(chunk) 단위로 프로세스 풀에서 다시 생성합니다.
+청크가 끝날 때마다 체크포인트를 기록하므로 중단 후 이어서 실행할 수 있습니다.
+
+실행 방법:
+    python manage.py regenerate_schedules
+    python manage.py regenerate_schedules --workers 4 --writers 2
+    python manage.py regenerate_schedules --dry-run
+    python manage.py regenerate_schedules --reset
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+DEFAULT_CHECKPOINT = Path(settings.BASE_DIR) / ".regenerate_schedules.json"
+
+# 워커 프로세스에서 DB 쓰기 동시 실행 수를 제한하는 세마포어
+_writer_slots = None
+
+
+def _init_worker(writer_slots):
+    """프로세스 풀 워커 초기화 (spawn으로 시작하므로 DB 연결은 워커마다 새로 맺음)"""
+    global _writer_slots
+
+    import django
+
+    django.setup()
+    _writer_slots = writer_slots
+
+
+def _process_chunk(first_pk: int, last_pk: int, dry_run: bool) -> tuple:
+    """
+    PK 구간 [first_pk, last_pk]의 아이들 일정 재생성
+
+    Returns:
+        (last_pk, 처리한 아이 수, 생성한 일정 수)
+    """
+    # 워커 프로세스에서 django.setup() 이후에 모델을 불러옴
+    from children.models import Child
+    from vaccinations.services import (
+        build_vaccination_schedules,
+        sync_vaccination_schedules,
+    )
+
+    children = list(Child.objects.filter(pk__gte=first_pk, pk__lte=last_pk))
+
+    if dry_run:
+        rows = sum(len(build_vaccination_schedules(child)) for child in children)
+    else:
+        with _writer_slots or nullcontext():
+            rows = sync_vaccination_schedules(children).total
+
+    return last_pk, len(children), rows
+
+
+class Command(BaseCommand):
+    help = "모든 아이의 예방접종 일정을 현재 일정표 기준으로 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size", type=int, default=500, help="청크당 아이 수"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="프로세스 수 (0이면 현재 프로세스에서 실행)",
+        )
+        parser.add_argument(
+            "--writers",
+            type=int,
+            default=None,
+            help="동시에 DB에 쓰는 워커 수 (기본: SQLite는 1, 그 외는 workers)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=str(DEFAULT_CHECKPOINT),
+            help="체크포인트 파일 경로",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="체크포인트를 무시하고 처음부터 실행",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="일정을 계산만 하고 DB에는 쓰지 않음",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        chunk_size = options["chunk_size"]
+        workers = options["workers"]
+        dry_run = options["dry_run"]
+        checkpoint_path = Path(options["checkpoint"])
+        if chunk_size < 1 or workers < 0:
+            raise CommandError(
+                "--chunk-size는 1 이상, --workers는 0 이상이어야 합니다."
+            )
+
+        writers = options["writers"]
+        if writers is None:
+            writers = 1 if connection.vendor == "sqlite" else max(workers, 1)
+
+        checkpoint = {} if options["reset"] else self._load_checkpoint(checkpoint_path)
+        start_pk = checkpoint.get("last_pk", 0)
+        if start_pk:
+            self.stdout.write(f"ℹ️  체크포인트에서 이어서 실행 (pk > {start_pk})")
+
+        self.totals = {
+            "children": checkpoint.get("children", 0),
+            "rows": checkpoint.get("rows", 0),
+        }
+        self.started = time.monotonic()
+        self.processed = {"children": 0, "rows": 0}
+
+        chunks = self._iter_chunks(start_pk, chunk_size)
+        if workers == 0:
+            for first_pk, last_pk in chunks:
+                result = _process_chunk(first_pk, last_pk, dry_run)
+                self._chunk_done(result, checkpoint_path, dry_run)
+        else:
+            self._run_pool(chunks, workers, writers, checkpoint_path, dry_run)
+
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {'[dry-run] ' if dry_run else ''}"
+                f"아이 {self.processed['children']}명, "
+                f"일정 {self.processed['rows']}개 처리 "
+                f"({self.processed['children'] / elapsed:.1f} children/s, "
+                f"{self.processed['rows'] / elapsed:.1f} rows/s)"
+            )
+        )
+        if not dry_run and checkpoint_path.exists():
+            # 전체 실행이 끝났으므로 다음 실행은 처음부터
+            checkpoint_path.unlink()
+
+    def _iter_chunks(self, start_pk: int, chunk_size: int):
+        """PK 순서로 (first_pk, last_pk) 구간 생성 (keyset 방식)"""
+        from children.models import Child
+
+        last_pk = start_pk
+        while True:
+            pks = list(
+                Child.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not pks:
+                return
+            last_pk = pks[-1]
+            yield pks[0], last_pk
+
+    def _run_pool(self, chunks, workers, writers, checkpoint_path, dry_run):
+        """프로세스 풀로 청크 실행, 연속 완료된 구간까지만 체크포인트 전진"""
+        # fork로 부모의 DB 연결을 물려받지 않도록 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        writer_slots = context.Semaphore(writers)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(writer_slots,),
+        ) as executor:
+            in_flight = {}  # future -> last_pk
+            submitted = []  # 제출 순서의 last_pk
+            finished = {}  # last_pk -> 결과
+
+            def submit_next():
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return False
+                future = executor.submit(_process_chunk, *chunk, dry_run)
+                in_flight[future] = chunk[1]
+                submitted.append(chunk[1])
+                return True
+
+            for _ in range(workers * 2):
+                if not submit_next():
+                    break
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del in_flight[future]
+                    result = future.result()
+                    finished[result[0]] = result
+
+                # 앞선 청크가 모두 끝난 경우에만 체크포인트 기록
+                while submitted and submitted[0] in finished:
+                    self._chunk_done(
+                        finished.pop(submitted.pop(0)), checkpoint_path, dry_run
+                    )
+
+                for _ in done:
+                    submit_next()
+
+    def _chunk_done(self, result, checkpoint_path, dry_run):
+        last_pk, children, rows = result
+        self.processed["children"] += children
+        self.processed["rows"] += rows
+        self.totals["children"] += children
+        self.totals["rows"] += rows
+
+        if not dry_run:
+            self._save_checkpoint(checkpoint_path, {"last_pk": last_pk, **self.totals})
+
+        if self.verbosity >= 2:
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            self.stdout.write(
+                f"  pk <= {last_pk}: 아이 {self.processed['children']}명, "
+                f"일정 {self.processed['rows']}개 "
+                f"({self.processed['children'] / elapsed:.1f} children/s, "
+                f"{self.processed['rows'] / elapsed:.1f} rows/s)"
+            )
+
+    def _load_checkpoint(self, path: Path) -> dict:
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            raise CommandError(f"체크포인트 파일을 읽을 수 없습니다: {path}")
+
+    def _save_checkpoint(self, path: Path, data: dict):
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -0,0 +1,42 @@
+"""
+예방접종 일정 상태 일일 전환 명령
+
+날짜가 지나며 바뀌는 상태(예정 → 임박 → 지연)를 반영합니다.
+(status, vaccination_date) 인덱스 범위에서 배치 단위로, 배치마다 별도
+트랜잭션으로 UPDATE 합니다.
+
+실행 방법:
+    python manage.py rollover_schedule_statuses
+    python manage.py rollover_schedule_statuses --batch-size 500
+
+cron 예시:
+    1 0 * * * cd /app/backend && python manage.py rollover_schedule_statuses
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.services import BULK_BATCH_SIZE, rollover_schedule_statuses
+
+
+class Command(BaseCommand):
+    help = "날짜가 지나 바뀐 예방접종 일정 상태(임박/지연)를 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help="트랜잭션당 일정 수",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        changed = rollover_schedule_statuses(batch_size=batch_size)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 지연 {changed['overdue']}건, 임박 {changed['due_soon']}건 전환"
+            )
+        )
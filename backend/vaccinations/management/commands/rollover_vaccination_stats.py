@@ -0,0 +1,46 @@
+"""
+아이별 예방접종 통계 일일 갱신 명령
+
+upcoming/overdue는 날짜에 따라 바뀌므로 매일 자정 이후 한 번 실행해
+기준일이 지난 통계를 오늘 기준으로 다시 집계합니다.
+
+실행 방법:
+    python manage.py rollover_vaccination_stats
+    python manage.py rollover_vaccination_stats --batch-size 500
+
+cron 예시:
+    5 0 * * * cd /app/backend && python manage.py rollover_vaccination_stats
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.services import BULK_BATCH_SIZE, rollover_child_stats
+
+
+class Command(BaseCommand):
+    help = "기준일이 지난 아이별 예방접종 통계를 오늘 기준으로 다시 집계합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help="트랜잭션당 아이 수",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        started = time.monotonic()
+        refreshed = rollover_child_stats(batch_size=batch_size)
+        elapsed = max(time.monotonic() - started, 1e-9)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 아이 {refreshed}명의 통계 갱신 "
+                f"({refreshed / elapsed:.1f} children/s)"
+            )
+        )
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:46
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_schedules(apps, schema_editor):
+    """(아이, 백신, 차수)별로 가장 먼저 생성된 일정만 남김"""
+    VaccinationSchedule = apps.get_model("vaccinations", "VaccinationSchedule")
+
+    keep = (
+        VaccinationSchedule.objects.values("child_id", "vaccine_id", "dose_number")
+        .annotate(keep_id=Min("id"))
+        .values_list("keep_id", flat=True)
+    )
+    VaccinationSchedule.objects.exclude(id__in=list(keep)).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("children", "0001_initial"),
+        ("vaccinations", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_schedules, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="vaccinationschedule",
+            constraint=models.UniqueConstraint(
+                fields=("child", "vaccine_id", "dose_number"),
+                name="unique_child_vaccine_dose",
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("children", "0001_initial"),
+        ("vaccinations", "0002_vaccinationschedule_unique_child_vaccine_dose"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChildVaccinationStats",
+            fields=[
+                (
+                    "child",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="vaccination_stats",
+                        serialize=False,
+                        to="children.child",
+                        verbose_name="아이",
+                    ),
+                ),
+                ("total", models.PositiveIntegerField(default=0, verbose_name="전체")),
+                (
+                    "completed",
+                    models.PositiveIntegerField(default=0, verbose_name="완료"),
+                ),
+                (
+                    "upcoming",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="다가오는 접종"
+                    ),
+                ),
+                (
+                    "overdue",
+                    models.PositiveIntegerField(default=0, verbose_name="지연"),
+                ),
+                ("as_of", models.DateField(verbose_name="기준일")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+            ],
+            options={
+                "verbose_name": "아이별 예방접종 통계",
+                "verbose_name_plural": "아이별 예방접종 통계",
+                "db_table": "child_vaccination_stats",
+                "indexes": [
+                    models.Index(fields=["as_of"], name="child_vacci_as_of_c49c0f_idx")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vaccinations", "0003_childvaccinationstats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vaccinationnotification",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0, verbose_name="발송 시도 횟수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="vaccinationnotification",
+            name="claim_token",
+            field=models.CharField(
+                blank=True, default="", max_length=32, verbose_name="발송 점유 토큰"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vaccinationnotification",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "대기"),
+                    ("sending", "발송 중"),
+                    ("sent", "발송됨"),
+                    ("failed", "발송 실패"),
+                    ("read", "읽음"),
+                ],
+                default="pending",
+                max_length=20,
+                verbose_name="상태",
+            ),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:58
+
+from django.db import migrations, models
+from django.db.models import Max
+
+# 한 번에 지우거나 만드는 알림 행 수
+BATCH_SIZE = 5000
+
+
+def reclaim_pending_notifications(apps, schema_editor):
+    """
+    발송 전 대기 알림 행 삭제 (이제 일정의 notification_date에서 계산)
+
+    재시도 중인 알림(attempts > 0)은 발송 상태를 담고 있으므로 남깁니다.
+    배치마다 커밋되므로 중간에 멈춰도 다시 실행하면 이어집니다.
+    """
+    VaccinationNotification = apps.get_model("vaccinations", "VaccinationNotification")
+
+    pending = VaccinationNotification.objects.filter(status="pending", attempts=0)
+    while True:
+        ids = list(pending.order_by("id").values_list("id", flat=True)[:BATCH_SIZE])
+        if not ids:
+            break
+        VaccinationNotification.objects.filter(id__in=ids).delete()
+
+    # 일정당 한 행만 남김 (가장 최근 행)
+    keep = (
+        VaccinationNotification.objects.values("schedule_id")
+        .annotate(keep_id=Max("id"))
+        .values_list("keep_id", flat=True)
+    )
+    VaccinationNotification.objects.exclude(id__in=list(keep)).delete()
+
+
+def restore_pending_notifications(apps, schema_editor):
+    """알림 행이 없는 일정마다 대기 알림 행 복원"""
+    VaccinationNotification = apps.get_model("vaccinations", "VaccinationNotification")
+    VaccinationSchedule = apps.get_model("vaccinations", "VaccinationSchedule")
+
+    schedules = VaccinationSchedule.objects.filter(notifications__isnull=True)
+    while True:
+        rows = list(
+            schedules.order_by("id").values_list("id", "notification_date")[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        VaccinationNotification.objects.bulk_create(
+            [
+                VaccinationNotification(
+                    schedule_id=schedule_id,
+                    notification_date=notification_date,
+                    status="pending",
+                )
+                for schedule_id, notification_date in rows
+            ]
+        )
+
+
+class Migration(migrations.Migration):
+    # 대기 알림 정리를 배치마다 커밋하기 위해 트랜잭션으로 묶지 않음
+    atomic = False
+
+    dependencies = [
+        ("vaccinations", "0004_notification_dispatch"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            reclaim_pending_notifications,
+            reverse_code=restore_pending_notifications,
+        ),
+        migrations.AddConstraint(
+            model_name="vaccinationnotification",
+            constraint=models.UniqueConstraint(
+                fields=("schedule",), name="unique_notification_schedule"
+            ),
+        ),
+    ]
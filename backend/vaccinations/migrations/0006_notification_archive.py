@@ -0,0 +1,50 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vaccinations", "0005_virtual_notifications"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VaccinationNotificationArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(
+                        primary_key=True, serialize=False, verbose_name="원본 알림 ID"
+                    ),
+                ),
+                (
+                    "schedule_id",
+                    models.BigIntegerField(db_index=True, verbose_name="일정 ID"),
+                ),
+                ("notification_date", models.DateField(verbose_name="알림 날짜")),
+                ("status", models.CharField(max_length=20, verbose_name="상태")),
+                (
+                    "sent_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="발송 시간"
+                    ),
+                ),
+                (
+                    "read_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="읽은 시간"
+                    ),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="보관일"),
+                ),
+            ],
+            options={
+                "verbose_name": "보관된 예방접종 알림",
+                "verbose_name_plural": "보관된 예방접종 알림",
+                "db_table": "vaccination_notifications_archive",
+            },
+        ),
+    ]
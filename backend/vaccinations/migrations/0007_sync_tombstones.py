@@ -0,0 +1,76 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("children", "0001_initial"),
+        ("vaccinations", "0006_notification_archive"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("schedule", "일정"), ("notification", "알림")],
+                        max_length=20,
+                        verbose_name="종류",
+                    ),
+                ),
+                ("object_id", models.BigIntegerField(verbose_name="삭제된 행 ID")),
+                (
+                    "deleted_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="삭제일"),
+                ),
+            ],
+            options={
+                "verbose_name": "동기화 삭제 기록",
+                "verbose_name_plural": "동기화 삭제 기록",
+                "db_table": "vaccination_sync_tombstones",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="vaccinationschedule",
+            index=models.Index(
+                fields=["child", "updated_at"], name="vaccination_child_i_593390_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="synctombstone",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="보호자",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="synctombstone",
+            index=models.Index(
+                fields=["user", "deleted_at"], name="vaccination_user_id_df0d6e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="synctombstone",
+            index=models.Index(
+                fields=["deleted_at"], name="vaccination_deleted_b9ec95_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("children", "0001_initial"),
+        ("vaccinations", "0007_sync_tombstones"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="vaccinationschedule",
+            name="vaccination_child_i_f88013_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="vaccinationschedule",
+            name="vaccination_notific_a5cd98_idx",
+        ),
+        migrations.AddIndex(
+            model_name="vaccinationnotification",
+            index=models.Index(
+                fields=["notification_date", "schedule"],
+                name="vaccination_notific_41ae47_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vaccinationschedule",
+            index=models.Index(
+                fields=["child", "vaccination_date", "id"],
+                name="vaccination_child_i_051690_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vaccinationschedule",
+            index=models.Index(
+                fields=["notification_date", "id"],
+                name="vaccination_notific_ca2fa5_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:37
+
+from datetime import date, timedelta
+
+from django.db import migrations, models
+
+# models.UPCOMING_DAYS (마이그레이션은 앱 코드에 의존하지 않도록 복사)
+UPCOMING_DAYS = 30
+
+
+def backfill_status(apps, schema_editor):
+    """기존 일정의 상태를 오늘 기준으로 채움 (상태별 UPDATE 1회씩)"""
+    VaccinationSchedule = apps.get_model("vaccinations", "VaccinationSchedule")
+
+    today = date.today()
+    schedules = VaccinationSchedule.objects.all()
+    schedules.filter(is_completed=True).update(status="completed")
+    pending = schedules.filter(is_completed=False)
+    pending.filter(vaccination_date__lt=today).update(status="overdue")
+    pending.filter(
+        vaccination_date__gte=today,
+        vaccination_date__lte=today + timedelta(days=UPCOMING_DAYS),
+    ).update(status="due_soon")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("children", "0001_initial"),
+        ("vaccinations", "0008_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vaccinationschedule",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("scheduled", "예정"),
+                    ("due_soon", "임박"),
+                    ("overdue", "지연"),
+                    ("completed", "완료"),
+                ],
+                default="scheduled",
+                max_length=20,
+                verbose_name="상태",
+            ),
+        ),
+        migrations.RunPython(backfill_status, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="vaccinationschedule",
+            index=models.Index(
+                fields=["status", "vaccination_date"],
+                name="vaccination_status_922204_idx",
+            ),
+        ),
+    ]
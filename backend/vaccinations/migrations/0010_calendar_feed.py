@@ -0,0 +1,58 @@
+# Generated by Django 5.2.4 on 2026-10-17 08:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+import vaccinations.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vaccinations", "0009_schedule_status"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CalendarFeed",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "token",
+                    models.CharField(
+                        default=vaccinations.models.new_calendar_token,
+                        max_length=64,
+                        unique=True,
+                        verbose_name="토큰",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="발급일"),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vaccination_calendar",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="보호자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "예방접종 캘린더 구독",
+                "verbose_name_plural": "예방접종 캘린더 구독",
+                "db_table": "vaccination_calendar_feeds",
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vaccinations", "0010_calendar_feed"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="vaccinationnotification",
+            index=models.Index(
+                fields=["schedule", "updated_at"], name="vaccination_schedul_c9373e_idx"
+            ),
+        ),
+    ]
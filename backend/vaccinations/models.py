@@ -1 +1,315 @@
-# Create your models here.
+import secrets
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+# 다가오는 접종으로 보는 기간 (알림 시점과 동일하게 1달)
+UPCOMING_DAYS = 30
+
+
+def schedule_status(vaccination_date: date, is_completed: bool, today=None) -> str:
+    """접종 예정일과 완료 여부로 일정 상태 계산 (is_overdue/is_upcoming과 같은 기준)"""
+    if is_completed:
+        return "completed"
+    today = today or timezone.localdate()
+    if vaccination_date < today:
+        return "overdue"
+    if vaccination_date <= today + timedelta(days=UPCOMING_DAYS):
+        return "due_soon"
+    return "scheduled"
+
+
+class VaccinationSchedule(models.Model):
+    """
+    아이별 예방접종 일정
+
+    status는 저장 시점 기준으로 계산해 두는 값이며, 날짜가 지나며 바뀌는
+    예정 → 임박 → 지연 전환은 매일 rollover_schedule_statuses 명령이 반영합니다.
+    """
+
+    STATUS_CHOICES = [
+        ("scheduled", "예정"),
+        ("due_soon", "임박"),
+        ("overdue", "지연"),
+        ("completed", "완료"),
+    ]
+
+    child = models.ForeignKey(
+        "children.Child",
+        on_delete=models.CASCADE,
+        related_name="vaccination_schedules",
+        verbose_name="아이",
+    )
+    vaccine_id = models.IntegerField(verbose_name="백신 ID")
+    vaccine_name = models.CharField(max_length=100, verbose_name="백신명")
+    disease = models.CharField(max_length=100, verbose_name="질병명")
+    dose_number = models.IntegerField(verbose_name="접종 차수")
+    age_description = models.CharField(max_length=50, verbose_name="권장 시기")
+    vaccination_date = models.DateField(verbose_name="접종 예정일")
+    notification_date = models.DateField(verbose_name="알림 날짜")
+    is_completed = models.BooleanField(default=False, verbose_name="접종 완료")
+    completed_date = models.DateField(null=True, blank=True, verbose_name="실제 접종일")
+    is_mandatory = models.BooleanField(default=True, verbose_name="필수 접종")
+    is_annual = models.BooleanField(default=False, verbose_name="매년 접종")
+    notes = models.TextField(blank=True, verbose_name="비고")
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="scheduled", verbose_name="상태"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        db_table = "vaccination_schedules"
+        verbose_name = "예방접종 일정"
+        verbose_name_plural = "예방접종 일정"
+        ordering = ["vaccination_date"]
+        indexes = [
+            # 일정 목록 keyset 페이지 (접종 예정일, id)
+            models.Index(fields=["child", "vaccination_date", "id"]),
+            # 가상 알림 목록 keyset 페이지, 발송 대상 조회
+            models.Index(fields=["notification_date", "id"]),
+            # 델타 동기화에서 아이별 변경분 조회
+            models.Index(fields=["child", "updated_at"]),
+            # 상태별 조회 (전체 지연/임박 일정)와 매일 상태 전환
+            models.Index(fields=["status", "vaccination_date"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["child", "vaccine_id", "dose_number"],
+                name="unique_child_vaccine_dose",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.child.name} - {self.vaccine_name} {self.dose_number}차"
+
+    def save(self, *args, **kwargs):
+        self.refresh_status()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "status" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "status"]
+        super().save(*args, **kwargs)
+
+    def refresh_status(self, today=None):
+        """접종 예정일/완료 여부로 status 갱신 (bulk 저장 전에 호출)"""
+        self.status = schedule_status(self.vaccination_date, self.is_completed, today)
+
+    @property
+    def is_overdue(self):
+        """접종 예정일이 지났는데 완료되지 않은 경우"""
+        return not self.is_completed and self.vaccination_date < timezone.localdate()
+
+    @property
+    def is_upcoming(self):
+        """앞으로 UPCOMING_DAYS일 이내 접종 예정인 경우"""
+        today = timezone.localdate()
+        return (
+            not self.is_completed
+            and today <= self.vaccination_date <= today + timedelta(days=UPCOMING_DAYS)
+        )
+
+
+class VaccinationNotification(models.Model):
+    """
+    예방접종 알림
+
+    대기 중인 알림은 행으로 저장하지 않고 일정의 notification_date에서
+    계산합니다(가상 알림). 발송하거나 읽은 시점에 일정당 한 행이 생깁니다.
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "대기"),
+        ("sending", "발송 중"),
+        ("sent", "발송됨"),
+        ("failed", "발송 실패"),
+        ("read", "읽음"),
+    ]
+
+    schedule = models.ForeignKey(
+        VaccinationSchedule,
+        on_delete=models.CASCADE,
+        related_name="notifications",
+        verbose_name="일정",
+    )
+    notification_date = models.DateField(verbose_name="알림 날짜")
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="pending", verbose_name="상태"
+    )
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="발송 시간")
+    read_at = models.DateTimeField(null=True, blank=True, verbose_name="읽은 시간")
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name="발송 시도 횟수"
+    )
+    claim_token = models.CharField(
+        max_length=32, blank=True, default="", verbose_name="발송 점유 토큰"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        db_table = "vaccination_notifications"
+        verbose_name = "예방접종 알림"
+        verbose_name_plural = "예방접종 알림"
+        ordering = ["-notification_date"]
+        indexes = [
+            models.Index(fields=["notification_date", "status"]),
+            # 알림 목록 keyset 페이지 (알림일, 일정 ID 역순)
+            models.Index(fields=["notification_date", "schedule"]),
+            # 델타 동기화에서 일정별 변경분 조회 (일정의 (child, updated_at)과 짝)
+            models.Index(fields=["schedule", "updated_at"]),
+        ]
+        constraints = [
+            # 가상 알림을 저장하는 INSERT가 곧 점유이므로 일정당 한 행만 허용
+            models.UniqueConstraint(
+                fields=["schedule"], name="unique_notification_schedule"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.schedule} 알림 ({self.get_status_display()})"
+
+
+class ChildVaccinationStats(models.Model):
+    """
+    아이별 예방접종 통계 (비정규화)
+
+    일정이 생성/완료/완료 취소/삭제될 때 같은 트랜잭션에서 갱신합니다.
+    upcoming/overdue는 날짜에 따라 바뀌므로 as_of 기준 값이며,
+    매일 rollover_vaccination_stats 명령이 오늘 기준으로 다시 계산합니다.
+    """
+
+    child = models.OneToOneField(
+        "children.Child",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="vaccination_stats",
+        verbose_name="아이",
+    )
+    total = models.PositiveIntegerField(default=0, verbose_name="전체")
+    completed = models.PositiveIntegerField(default=0, verbose_name="완료")
+    upcoming = models.PositiveIntegerField(default=0, verbose_name="다가오는 접종")
+    overdue = models.PositiveIntegerField(default=0, verbose_name="지연")
+    as_of = models.DateField(verbose_name="기준일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        db_table = "child_vaccination_stats"
+        verbose_name = "아이별 예방접종 통계"
+        verbose_name_plural = "아이별 예방접종 통계"
+        indexes = [
+            # rollover에서 기준일이 지난 행 조회
+            models.Index(fields=["as_of"]),
+        ]
+
+    def __str__(self):
+        return f"{self.child_id} 통계 ({self.as_of})"
+
+    @property
+    def completion_rate(self):
+        """완료율 (%)"""
+        if not self.total:
+            return 0.0
+        return round(self.completed / self.total * 100, 1)
+
+
+class VaccinationNotificationArchive(models.Model):
+    """
+    보관된 예방접종 알림 (발송/읽음 처리 후 보존 기간이 지난 알림)
+
+    원본 테이블을 작게 유지하기 위해 archive_notifications 명령이 옮겨 옵니다.
+    외래키와 부가 인덱스 없이 원본 ID를 그대로 PK로 씁니다.
+    """
+
+    id = models.BigIntegerField(primary_key=True, verbose_name="원본 알림 ID")
+    schedule_id = models.BigIntegerField(db_index=True, verbose_name="일정 ID")
+    notification_date = models.DateField(verbose_name="알림 날짜")
+    status = models.CharField(max_length=20, verbose_name="상태")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="발송 시간")
+    read_at = models.DateTimeField(null=True, blank=True, verbose_name="읽은 시간")
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="보관일")
+
+    class Meta:
+        db_table = "vaccination_notifications_archive"
+        verbose_name = "보관된 예방접종 알림"
+        verbose_name_plural = "보관된 예방접종 알림"
+
+    def __str__(self):
+        return f"{self.schedule_id} 알림 ({self.status}, 보관됨)"
+
+
+class SyncTombstone(models.Model):
+    """
+    삭제 기록 (델타 동기화용)
+
+    일정/알림이 삭제되거나 보관 테이블로 옮겨지면 보호자별로 남겨,
+    앱의 오프라인 저장소가 다음 동기화에서 지울 수 있게 합니다.
+    보존 기간이 지나면 prune_sync_tombstones 명령이 정리합니다.
+    """
+
+    KIND_CHOICES = [
+        ("schedule", "일정"),
+        ("notification", "알림"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="보호자",
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="종류")
+    object_id = models.BigIntegerField(verbose_name="삭제된 행 ID")
+    deleted_at = models.DateTimeField(auto_now_add=True, verbose_name="삭제일")
+
+    class Meta:
+        db_table = "vaccination_sync_tombstones"
+        verbose_name = "동기화 삭제 기록"
+        verbose_name_plural = "동기화 삭제 기록"
+        indexes = [
+            models.Index(fields=["user", "deleted_at"]),
+            # 보존 기간이 지난 기록 정리
+            models.Index(fields=["deleted_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} 삭제 ({self.deleted_at})"
+
+
+def new_calendar_token() -> str:
+    """추측할 수 없는 구독 URL 토큰"""
+    return secrets.token_urlsafe(24)
+
+
+class CalendarFeed(models.Model):
+    """
+    보호자별 예방접종 캘린더(.ics) 구독 토큰
+
+    캘린더 앱은 로그인 없이 URL만으로 구독하므로 토큰이 곧 인증입니다.
+    토큰을 다시 발급하면 이전 구독 URL은 더 이상 동작하지 않습니다.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="vaccination_calendar",
+        verbose_name="보호자",
+    )
+    token = models.CharField(
+        max_length=64, unique=True, default=new_calendar_token, verbose_name="토큰"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="발급일")
+
+    class Meta:
+        db_table = "vaccination_calendar_feeds"
+        verbose_name = "예방접종 캘린더 구독"
+        verbose_name_plural = "예방접종 캘린더 구독"
+
+    def __str__(self):
+        return f"{self.user} 캘린더 구독"
+
+    def rotate(self):
+        """토큰 재발급 (유출 시)"""
+        self.token = new_calendar_token()
+        self.save(update_fields=["token"])
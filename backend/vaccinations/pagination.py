@@ -0,0 +1,216 @@
+"""
+예방접종 목록 keyset(cursor) 페이지네이션
+
+마지막 행의 정렬 키(정렬 필드 + ID)를 cursor로 넘겨 다음 페이지를
+`WHERE (정렬 키) > cursor ORDER BY ... LIMIT n`으로 조회합니다.
+OFFSET이나 COUNT(*)가 없으므로 몇 번째 페이지든 비용이 같습니다.
+
+DRF의 CursorPagination은 첫 정렬 필드만 cursor에 담고 같은 값은
+OFFSET으로 건너뛰므로, 같은 날짜가 많은 일정/알림에는 직접 구현합니다.
+"""
+
+import base64
+import json
+from datetime import date
+from typing import Callable, List, Optional, Sequence
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+Position = List
+
+
+def encode_position(position: Sequence) -> str:
+    """정렬 키를 URL에 넣을 cursor 문자열로"""
+    values = [v.isoformat() if isinstance(v, date) else v for v in position]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_value(value, kind: type):
+    """
+    cursor에 담긴 값 하나를 정렬 필드 타입으로
+
+    Raises:
+        ValueError: 타입이 맞지 않는 경우
+    """
+    if kind is date and isinstance(value, str):
+        return date.fromisoformat(value)
+    # bool은 int의 하위 타입이므로 별도로 거름
+    if kind is int and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"{kind.__name__} 값이 아님: {value!r}")
+
+
+def decode_position(cursor: str, types: Sequence[type]) -> Position:
+    """
+    cursor 문자열을 정렬 키로
+
+    각 값은 types의 같은 위치 타입(date 또는 int)으로 검사/변환하므로
+    조작된 cursor도 쿼리 단계의 500이 아니라 404가 됩니다.
+
+    Raises:
+        NotFound: 형식이 잘못된 경우 (DRF CursorPagination과 같은 응답)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+        if not isinstance(position, list) or len(position) != len(types):
+            raise ValueError("정렬 키 개수가 다름")
+        return [decode_value(value, kind) for value, kind in zip(position, types)]
+    except (ValueError, TypeError):
+        raise NotFound("잘못된 cursor입니다.")
+
+
+def keyset_filter(ordering: Sequence[str], position: Sequence) -> Q:
+    """
+    정렬 순서상 position 다음 행들의 조건
+
+    ("vaccination_date", "id"), (d, i) 이면
+    vaccination_date > d OR (vaccination_date = d AND id > i)
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, position):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def keyset_page(
+    queryset, ordering: Sequence[str], after: Optional[Position], limit: Optional[int]
+):
+    """queryset을 ordering으로 정렬해 after 다음 행부터 limit개"""
+    queryset = queryset.order_by(*ordering)
+    if after is not None:
+        queryset = queryset.filter(keyset_filter(ordering, after))
+    if limit is not None:
+        queryset = queryset[:limit]
+    return queryset
+
+
+def position_of(obj, ordering: Sequence[str]) -> Position:
+    """행의 정렬 키 (모델 인스턴스 또는 .values() dict)"""
+    if isinstance(obj, dict):
+        return [obj[field.lstrip("-")] for field in ordering]
+    return [getattr(obj, field.lstrip("-")) for field in ordering]
+
+
+class KeysetPagination(BasePagination):
+    """
+    정렬 키 + ID 기반 keyset 페이지네이션
+
+    응답: {"next": 다음 페이지 URL 또는 null, "results": [...]}
+
+    Attributes:
+        ordering: 정렬 필드 (마지막은 유일한 필드여야 함)
+        position_types: ordering 필드별 값 타입 (date 또는 int)
+        paginate_by_default: False면 ?cursor= 또는 ?page_size=가 있을 때만
+            페이지로 나눔 (전체 배열을 기대하는 기존 클라이언트 호환)
+    """
+
+    ordering: Sequence[str] = ("-id",)
+    position_types: Sequence[type] = (int,)
+    page_size = 50
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    paginate_by_default = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate(
+            lambda after, limit: list(
+                keyset_page(queryset, self.ordering, after, limit)
+            ),
+            request,
+        )
+
+    def paginate(
+        self,
+        fetch: Callable[[Optional[Position], int], list],
+        request,
+    ) -> Optional[list]:
+        """
+        fetch(after, limit)로 한 페이지 조회
+
+        QuerySet 하나로 표현되지 않는 목록(저장된 알림 + 가상 알림 등)은
+        fetch에서 직접 keyset 조회를 하도록 이 메서드를 씁니다.
+
+        Returns:
+            페이지 행 리스트, 페이지네이션하지 않으면 None
+        """
+        params = request.query_params
+        if not self.paginate_by_default and not (
+            self.cursor_query_param in params or self.page_size_query_param in params
+        ):
+            return None
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        after = None
+        if params.get(self.cursor_query_param):
+            after = decode_position(
+                params[self.cursor_query_param], self.position_types
+            )
+
+        # 한 행 더 읽어 다음 페이지 유무 판단 (COUNT 없음)
+        rows = fetch(after, page_size + 1)
+        self.next_position = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_position = position_of(rows[-1], self.ordering)
+        return rows
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            encode_position(self.next_position),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class SchedulePagination(KeysetPagination):
+    """일정 목록 (접종 예정일순, 요청 시에만 페이지로 나눔)"""
+
+    ordering = ("vaccination_date", "id")
+    position_types = (date, int)
+    paginate_by_default = False
+
+
+class NotificationPagination(KeysetPagination):
+    """
+    알림 목록 (알림일 최신순)
+
+    알림은 일정당 하나이므로 schedule_id가 ID 역할을 합니다
+    (가상 알림은 id가 없음).
+    """
+
+    ordering = ("-notification_date", "-schedule_id")
+    position_types = (date, int)
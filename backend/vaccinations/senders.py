@@ -0,0 +1,80 @@
+"""
+예방접종 알림 발송 백엔드
+
+settings.NOTIFICATION_SENDER_BACKEND에 지정한 클래스로 푸시를 보냅니다.
+새 백엔드는 BaseSender를 상속해 send()를 구현하고, 실패 시 예외를 던집니다.
+send()는 여러 스레드에서 동시에 호출되므로 스레드 안전해야 합니다.
+"""
+
+import threading
+from collections import deque
+from typing import NamedTuple, Tuple
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class PushMessage(NamedTuple):
+    """발송할 푸시 메시지 한 건"""
+
+    user_id: int
+    title: str
+    body: str
+    notification_ids: Tuple[int, ...]
+
+
+class SendError(Exception):
+    """발송 실패"""
+
+
+class BaseSender:
+    """발송 백엔드 기본 클래스"""
+
+    def send(self, message: PushMessage):
+        raise NotImplementedError
+
+
+class UnconfiguredSender(BaseSender):
+    """
+    발송 백엔드를 설정하지 않았을 때의 기본값
+
+    보내지 못한 알림이 발송 완료로 기록되지 않도록 항상 SendError로 실패합니다.
+    """
+
+    def send(self, message: PushMessage):
+        raise SendError(
+            "NOTIFICATION_SENDER_BACKEND에 실제 발송 백엔드를 설정해야 합니다."
+        )
+
+
+class FakePushSender(BaseSender):
+    """
+    실제로 보내지 않고 outbox에 쌓는 백엔드 (테스트용)
+
+    outbox는 최근 OUTBOX_MAXLEN건만 보관합니다.
+    fail_user_ids에 넣은 사용자에게 보내는 메시지는 SendError로 실패합니다.
+    """
+
+    OUTBOX_MAXLEN = 1000
+
+    outbox = deque(maxlen=OUTBOX_MAXLEN)
+    fail_user_ids = set()
+    _lock = threading.Lock()
+
+    def send(self, message: PushMessage):
+        if message.user_id in self.fail_user_ids:
+            raise SendError(f"사용자 {message.user_id}에게 발송 실패")
+        with self._lock:
+            self.outbox.append(message)
+
+    @classmethod
+    def reset(cls):
+        """outbox와 실패 설정 초기화"""
+        with cls._lock:
+            cls.outbox.clear()
+            cls.fail_user_ids.clear()
+
+
+def get_sender(backend: str = None) -> BaseSender:
+    """설정된 발송 백엔드 인스턴스"""
+    return import_string(backend or settings.NOTIFICATION_SENDER_BACKEND)()
@@ -2,12 +2,33 @@
 예방접종 시리얼라이저
 """
 
+from datetime import date, timedelta
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.utils import timezone
 from rest_framework import serializers
 
-from vaccinations.models import VaccinationNotification, VaccinationSchedule
+from children.models import Child
+from vaccinations.models import (
+    UPCOMING_DAYS,
+    VaccinationNotification,
+    VaccinationSchedule,
+)
+
+
+class SparseFieldsMixin:
+    """fields= 인자로 받은 필드만 직렬화 (?fields= 희소 필드셋)"""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
 
-class VaccinationScheduleSerializer(serializers.ModelSerializer):
+class VaccinationScheduleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """예방접종 일정 시리얼라이저"""
 
     is_overdue = serializers.ReadOnlyField()
@@ -30,19 +51,168 @@ class VaccinationScheduleSerializer(serializers.ModelSerializer):
             "is_mandatory",
             "is_annual",
             "notes",
+            "status",
             "is_overdue",
             "is_upcoming",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["created_at", "updated_at"]
+        read_only_fields = ["child", "status", "created_at", "updated_at"]
+
+
+# ============================================
+# 일정 목록 읽기 전용 경로 (.values() + SQL 주석)
+# ============================================
+
+SCHEDULE_FIELDS = VaccinationScheduleSerializer.Meta.fields
+SCHEDULE_FLAG_FIELDS = ["is_overdue", "is_upcoming"]
+# VaccinationScheduleSerializer 필드 중 DB 컬럼 (is_overdue/is_upcoming은 SQL로 계산)
+SCHEDULE_VALUE_FIELDS = [
+    field for field in SCHEDULE_FIELDS if field not in SCHEDULE_FLAG_FIELDS
+]
+SCHEDULE_DATE_FIELDS = ["vaccination_date", "notification_date", "completed_date"]
+SCHEDULE_DATETIME_FIELDS = ["created_at", "updated_at"]
+
+
+def parse_schedule_fields(value: Optional[str]) -> Optional[List[str]]:
+    """
+    ?fields= 값을 일정 필드 목록으로 (희소 필드셋)
+
+    id는 항상 포함합니다. 값이 없으면 None(전체 필드)입니다.
+
+    Raises:
+        serializers.ValidationError: 없는 필드를 요청한 경우
+    """
+    if not value:
+        return None
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = requested - set(SCHEDULE_FIELDS)
+    if unknown:
+        raise serializers.ValidationError(
+            {"fields": f"알 수 없는 필드: {', '.join(sorted(unknown))}"}
+        )
+    return [field for field in SCHEDULE_FIELDS if field in requested or field == "id"]
+
+
+def schedule_only_fields(fields: Iterable[str]) -> List[str]:
+    """
+    직렬화할 일정 필드에 필요한 모델 컬럼 (.only() 인자)
+
+    is_overdue/is_upcoming 프로퍼티는 완료 여부와 접종 예정일을 읽고,
+    가상 알림과 알림 목록 keyset 페이지는 notification_date를 읽습니다.
+    """
+    columns = {"id", "notification_date"}
+    for field in fields:
+        if field in SCHEDULE_FLAG_FIELDS:
+            columns.update(["is_completed", "vaccination_date"])
+        else:
+            columns.add(field)
+    return sorted(columns)
+
+
+def schedule_values(
+    queryset,
+    today: Optional[date] = None,
+    fields: Optional[Iterable[str]] = None,
+    extra: Iterable[str] = (),
+):
+    """
+    일정 QuerySet을 직렬화할 값 dict QuerySet으로
+
+    is_overdue/is_upcoming은 모델 프로퍼티와 같은 조건을 SQL 식으로 계산합니다.
+    정렬/필터/keyset 페이지는 이 QuerySet에 그대로 적용할 수 있습니다.
+
+    Args:
+        fields: 직렬화할 필드 (기본: 전체). 요청한 컬럼만 SELECT 합니다.
+        extra: 표현에는 없어도 읽어야 하는 컬럼 (keyset 정렬 키 등)
+    """
+    today = today or timezone.localdate()
+    fields = SCHEDULE_FIELDS if fields is None else list(fields)
+    flags = {
+        "is_overdue": lambda: Q(is_completed=False, vaccination_date__lt=today),
+        "is_upcoming": lambda: Q(
+            is_completed=False,
+            vaccination_date__gte=today,
+            vaccination_date__lte=today + timedelta(days=UPCOMING_DAYS),
+        ),
+    }
+    return queryset.values(
+        *[f for f in SCHEDULE_VALUE_FIELDS if f in fields or f in extra],
+        **{
+            name: ExpressionWrapper(condition(), output_field=BooleanField())
+            for name, condition in flags.items()
+            if name in fields
+        },
+    )
+
+
+def schedule_representation(
+    rows: Iterable[dict], drop: Iterable[str] = ()
+) -> List[dict]:
+    """
+    schedule_values 행을 VaccinationScheduleSerializer와 같은 표현으로 (한 번 순회)
+
+    날짜는 ISO 문자열, 일시는 현재 시간대 기준 ISO 문자열로 바꿉니다.
+
+    Args:
+        drop: 표현에서 뺄 컬럼 (schedule_values의 extra)
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+    # 현재 시간대와 변환할 컬럼은 행마다 찾지 않고 한 번만 결정
+    tz = timezone.get_current_timezone() if settings.USE_TZ else None
+    dates = [field for field in SCHEDULE_DATE_FIELDS if field in rows[0]]
+    datetimes = [field for field in SCHEDULE_DATETIME_FIELDS if field in rows[0]]
+    drop = [field for field in drop if field in rows[0]]
+    for row in rows:
+        for field in dates:
+            value = row[field]
+            if value is not None:
+                row[field] = value.isoformat()
+        for field in datetimes:
+            # DRF DateTimeField와 같이 현재 시간대로 바꾸고 UTC는 Z로 표기
+            value = row[field]
+            if tz is not None:
+                value = value.astimezone(tz)
+            value = value.isoformat()
+            if value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+            row[field] = value
+        for field in drop:
+            del row[field]
+    return rows
+
+
+def serialize_schedules(
+    queryset, today: Optional[date] = None, fields: Optional[Iterable[str]] = None
+) -> List[dict]:
+    """
+    VaccinationScheduleSerializer(queryset, many=True).data와 같은 결과
+
+    모델 인스턴스와 DRF 필드를 거치지 않으므로 목록 응답용으로 빠릅니다.
+    fields를 주면 그 필드만 SELECT 해서 돌려줍니다.
+    """
+    return schedule_representation(schedule_values(queryset, today, fields))
 
 
 class VaccinationNotificationSerializer(serializers.ModelSerializer):
-    """예방접종 알림 시리얼라이저"""
+    """
+    예방접종 알림 시리얼라이저
+
+    context["schedule_fields"]가 있으면 중첩 일정은 그 필드만 직렬화합니다.
+    """
 
     schedule = VaccinationScheduleSerializer(read_only=True)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        schedule_fields = self.context.get("schedule_fields")
+        if schedule_fields is not None:
+            self.fields["schedule"] = VaccinationScheduleSerializer(
+                read_only=True, fields=schedule_fields
+            )
+
     class Meta:
         model = VaccinationNotification
         fields = [
@@ -58,6 +228,61 @@ class VaccinationNotificationSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at"]
 
 
+class SyncNotificationSerializer(serializers.ModelSerializer):
+    """일정을 ID로만 담는 알림 시리얼라이저 (델타 동기화, compact 목록)"""
+
+    class Meta:
+        model = VaccinationNotification
+        fields = [
+            "id",
+            "schedule",
+            "notification_date",
+            "status",
+            "sent_at",
+            "read_at",
+            "updated_at",
+        ]
+
+
+class ScheduleBulkCompleteSerializer(serializers.Serializer):
+    """일정 일괄 완료 요청 (ids, 또는 child_id + vaccination_date)"""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, max_length=100
+    )
+    child_id = serializers.IntegerField(required=False)
+    vaccination_date = serializers.DateField(required=False)
+    completed_date = serializers.DateField(required=False)
+
+    def validate(self, data):
+        by_child = data.get("child_id") and data.get("vaccination_date")
+        if bool(data.get("ids")) == bool(by_child):
+            raise serializers.ValidationError(
+                "ids 또는 child_id + vaccination_date 중 하나만 필요합니다."
+            )
+        return data
+
+
+class NotificationBulkActionSerializer(serializers.Serializer):
+    """알림 일괄 상태 변경 요청 (ids, schedule_ids, before 중 하나 이상)"""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, max_length=1000
+    )
+    schedule_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, max_length=1000
+    )
+    before = serializers.DateField(required=False)
+    child_id = serializers.IntegerField(required=False)
+
+    def validate(self, data):
+        if not (data.get("ids") or data.get("schedule_ids") or data.get("before")):
+            raise serializers.ValidationError(
+                "ids, schedule_ids, before 중 하나는 필요합니다."
+            )
+        return data
+
+
 class VaccinationStatsSerializer(serializers.Serializer):
     """예방접종 통계 시리얼라이저"""
 
@@ -66,3 +291,15 @@ class VaccinationStatsSerializer(serializers.Serializer):
     upcoming = serializers.IntegerField()
     overdue = serializers.IntegerField()
     completion_rate = serializers.FloatField()
+
+
+class DashboardChildSerializer(serializers.ModelSerializer):
+    """대시보드 아이 시리얼라이저 (get_dashboard_children 결과용)"""
+
+    stats = VaccinationStatsSerializer(source="vaccination_stats")
+    upcoming = VaccinationScheduleSerializer(source="upcoming_schedules", many=True)
+    overdue = VaccinationScheduleSerializer(source="overdue_schedules", many=True)
+
+    class Meta:
+        model = Child
+        fields = ["id", "name", "birth_date", "gender", "stats", "upcoming", "overdue"]
@@ -2,12 +2,620 @@
 예방접종 일정 생성 서비스
 """
 
-from datetime import datetime
+from datetime import date, timedelta
 from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q
+from django.utils import timezone
 
 from children.models import Child
-from immunization_calculator import ImmunizationScheduleCalculator
-from vaccinations.models import VaccinationNotification, VaccinationSchedule
+from immunization_calculator import ImmunizationScheduleCalculator, get_calculator
+from vaccinations.cache import invalidate_all, invalidate_children
+from vaccinations.models import (
+    UPCOMING_DAYS,
+    ChildVaccinationStats,
+    VaccinationNotification,
+    VaccinationNotificationArchive,
+    VaccinationSchedule,
+)
+from vaccinations.pagination import keyset_page
+from vaccinations.sync import record_schedule_deletions
+
+# immunization_schedule_2025.json 경로
+SCHEDULE_JSON_PATH = (
+    Path(__file__).resolve().parent.parent / "immunization_schedule_2025.json"
+)
+
+# bulk_create 한 번에 넣을 최대 행 수 (SQLite 변수 제한은 Django가 추가로 나눔)
+BULK_BATCH_SIZE = 1000
+
+
+def build_vaccination_schedules(
+    child: Child, calculator: Optional[ImmunizationScheduleCalculator] = None
+) -> List[VaccinationSchedule]:
+    """
+    아이의 예방접종 일정 행을 메모리에서 생성 (저장하지 않음)
+
+    Args:
+        child: Child 모델 인스턴스
+        calculator: 사용할 계산기 (기본: 공유 계산기)
+
+    Returns:
+        저장되지 않은 VaccinationSchedule 리스트
+    """
+    # 공유 계산기 조회 (프로세스당 한 번만 로드, 파일 변경 시 자동 리로드)
+    calculator = calculator or get_calculator(SCHEDULE_JSON_PATH)
+
+    # 전체 예방접종 일정 계산 (접종일/알림일은 date 객체)
+    schedules = calculator.iter_child_schedule(
+        birth_date=child.birth_date, gender=child.gender, include_optional=False
+    )
+
+    return [
+        VaccinationSchedule(
+            child=child,
+            vaccine_id=item.dose.vaccine_id,
+            vaccine_name=item.dose.vaccine_name,
+            disease=item.dose.disease,
+            dose_number=item.dose.dose_number,
+            age_description=item.dose.age_description,
+            vaccination_date=item.vaccination_date,
+            notification_date=item.notification_date,
+            is_mandatory=item.dose.is_mandatory,
+            is_annual=item.dose.is_annual,
+            notes=item.dose.notes,
+        )
+        for item in schedules
+    ]
+
+
+def _bulk_insert_schedules(
+    schedules: List[VaccinationSchedule], batch_size: int = BULK_BATCH_SIZE
+):
+    """
+    일정 bulk_create (트랜잭션 안에서 호출)
+
+    알림은 일정의 notification_date에서 계산하므로 여기서 만들지 않습니다.
+    bulk_create는 save()를 거치지 않으므로 상태를 여기서 계산합니다.
+    """
+    today = timezone.localdate()
+    for schedule in schedules:
+        schedule.refresh_status(today)
+    VaccinationSchedule.objects.bulk_create(schedules, batch_size=batch_size)
+    # bulk_create는 post_save 신호를 보내지 않으므로 캐시를 직접 무효화
+    invalidate_children({schedule.child_id for schedule in schedules})
+
+
+def bulk_create_vaccination_schedules(
+    children: Iterable[Child],
+    calculator: Optional[ImmunizationScheduleCalculator] = None,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> int:
+    """
+    여러 아이의 예방접종 일정을 한 트랜잭션에서 일괄 생성
+
+    일정은 bulk_create 한 번(배치 단위)으로 넣고 통계를 갱신합니다.
+    쿼리 수는 접종 차수와 무관합니다.
+
+    Args:
+        children: Child 모델 인스턴스들
+        calculator: 사용할 계산기 (기본: 공유 계산기)
+        batch_size: bulk_create 배치 크기
+
+    Returns:
+        생성된 일정 개수
+    """
+    schedules = [
+        schedule
+        for child in children
+        for schedule in build_vaccination_schedules(child, calculator)
+    ]
+    if not schedules:
+        return 0
+
+    with transaction.atomic():
+        _bulk_insert_schedules(schedules, batch_size)
+        refresh_child_stats({schedule.child_id for schedule in schedules})
+
+    return len(schedules)
+
+
+# 계산 결과로 덮어쓰는 필드 (접종 완료 정보는 보존)
+SYNC_FIELDS = [
+    "vaccine_name",
+    "disease",
+    "age_description",
+    "vaccination_date",
+    "notification_date",
+    "is_mandatory",
+    "is_annual",
+    "notes",
+]
+
+
+class ScheduleSyncResult(NamedTuple):
+    """일정 동기화 결과"""
+
+    created: int
+    updated: int
+    deleted: int
+    unchanged: int
+
+    @property
+    def total(self) -> int:
+        """동기화 후 일정 개수"""
+        return self.created + self.updated + self.unchanged
+
+
+# 한 트랜잭션에서 일정을 동기화하는 아이 수
+# (델타 동기화의 SYNC_OVERLAP 안에 커밋되도록 트랜잭션을 짧게 유지)
+SYNC_TRANSACTION_CHILDREN = 50
+
+
+def sync_vaccination_schedules(
+    children: Iterable[Child],
+    calculator: Optional[ImmunizationScheduleCalculator] = None,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> ScheduleSyncResult:
+    """
+    저장된 일정과 새로 계산한 일정의 차이만 반영 (upsert)
+
+    (아이, vaccine_id, dose_number)를 키로 비교해 추가/수정/삭제를 각각
+    일괄 처리합니다. 접종 완료 정보는 유지하며, 저장된 알림 중에는
+    알림일이 바뀐 재시도 대기 알림만 옮깁니다.
+    출생일/성별이 바뀌거나 일정표 버전이 바뀐 뒤 호출합니다.
+    아이 SYNC_TRANSACTION_CHILDREN명마다 별도 트랜잭션으로 커밋합니다.
+
+    Args:
+        children: Child 모델 인스턴스들
+        calculator: 사용할 계산기 (기본: 공유 계산기)
+        batch_size: bulk 작업 배치 크기
+
+    Returns:
+        ScheduleSyncResult (전체 합계)
+    """
+    children = list(children)
+    total = ScheduleSyncResult(0, 0, 0, 0)
+    for start in range(0, len(children), SYNC_TRANSACTION_CHILDREN):
+        result = _sync_schedules_batch(
+            children[start : start + SYNC_TRANSACTION_CHILDREN], calculator, batch_size
+        )
+        total = ScheduleSyncResult(*(a + b for a, b in zip(total, result)))
+    return total
+
+
+def _sync_schedules_batch(
+    children: List[Child],
+    calculator: Optional[ImmunizationScheduleCalculator],
+    batch_size: int,
+) -> ScheduleSyncResult:
+    """아이 한 묶음의 일정 동기화 (트랜잭션 1개)"""
+    fresh = {
+        (schedule.child_id, schedule.vaccine_id, schedule.dose_number): schedule
+        for child in children
+        for schedule in build_vaccination_schedules(child, calculator)
+    }
+
+    with transaction.atomic():
+        stored = {
+            (schedule.child_id, schedule.vaccine_id, schedule.dose_number): schedule
+            for schedule in VaccinationSchedule.objects.filter(
+                child__in=children
+            ).select_for_update()
+        }
+
+        to_create = [schedule for key, schedule in fresh.items() if key not in stored]
+        to_delete = [
+            schedule.pk for key, schedule in stored.items() if key not in fresh
+        ]
+
+        to_update = []
+        moved_notifications = {}  # schedule_id -> 새 알림일
+        now = timezone.now()
+        for key, schedule in stored.items():
+            new = fresh.get(key)
+            if new is None:
+                continue
+            changed = [
+                field
+                for field in SYNC_FIELDS
+                if getattr(schedule, field) != getattr(new, field)
+            ]
+            if not changed:
+                continue
+            if "notification_date" in changed:
+                moved_notifications[schedule.pk] = new.notification_date
+            for field in changed:
+                setattr(schedule, field, getattr(new, field))
+            # bulk_update는 save()/auto_now를 거치지 않으므로 직접 갱신
+            schedule.refresh_status()
+            schedule.updated_at = now
+            to_update.append(schedule)
+
+        if to_delete:
+            record_schedule_deletions(to_delete)
+            VaccinationSchedule.objects.filter(pk__in=to_delete).delete()
+        if to_update:
+            VaccinationSchedule.objects.bulk_update(
+                to_update,
+                SYNC_FIELDS + ["status", "updated_at"],
+                batch_size=batch_size,
+            )
+        if moved_notifications:
+            notifications = list(
+                VaccinationNotification.objects.filter(
+                    schedule_id__in=moved_notifications, status="pending"
+                )
+            )
+            for notification in notifications:
+                notification.notification_date = moved_notifications[
+                    notification.schedule_id
+                ]
+                notification.updated_at = now
+            VaccinationNotification.objects.bulk_update(
+                notifications,
+                ["notification_date", "updated_at"],
+                batch_size=batch_size,
+            )
+        if to_create:
+            _bulk_insert_schedules(to_create, batch_size)
+        if to_create or to_update or to_delete:
+            refresh_child_stats([child.pk for child in children])
+            # bulk_update는 신호를 보내지 않으므로 캐시를 직접 무효화
+            invalidate_children([child.pk for child in children])
+
+    return ScheduleSyncResult(
+        created=len(to_create),
+        updated=len(to_update),
+        deleted=len(to_delete),
+        unchanged=len(stored) - len(to_delete) - len(to_update),
+    )
+
+
+# ============================================
+# 아이별 통계 (ChildVaccinationStats)
+# ============================================
+
+STATS_FIELDS = ["total", "completed", "upcoming", "overdue"]
+
+# 일정 한 건의 통계 관련 상태: (접종 예정일, 완료 여부)
+ScheduleState = Tuple[date, bool]
+
+
+def schedule_state(schedule: VaccinationSchedule) -> ScheduleState:
+    """통계 증감 계산에 쓰는 일정 상태"""
+    return schedule.vaccination_date, schedule.is_completed
+
+
+def _state_counts(state: Optional[ScheduleState], today: date) -> dict:
+    """일정 한 건이 각 통계 항목에 기여하는 값 (0 또는 1)"""
+    if state is None:
+        return dict.fromkeys(STATS_FIELDS, 0)
+    vaccination_date, is_completed = state
+    return {
+        "total": 1,
+        "completed": int(is_completed),
+        "upcoming": int(
+            not is_completed
+            and today <= vaccination_date <= today + timedelta(days=UPCOMING_DAYS)
+        ),
+        "overdue": int(not is_completed and vaccination_date < today),
+    }
+
+
+def compute_child_stats(child_ids: Iterable[int], today: Optional[date] = None):
+    """
+    일정 테이블에서 아이별 통계를 직접 집계 (GROUP BY 쿼리 1회)
+
+    Returns:
+        {child_id: {"total": ..., "completed": ..., "upcoming": ..., "overdue": ...}}
+        일정이 없는 아이는 모두 0
+    """
+    today = today or timezone.localdate()
+    child_ids = list(child_ids)
+    stats = {child_id: dict.fromkeys(STATS_FIELDS, 0) for child_id in child_ids}
+    rows = (
+        VaccinationSchedule.objects.filter(child_id__in=child_ids)
+        .order_by()
+        .values("child_id")
+        .annotate(
+            total=Count("id"),
+            completed=Count("id", filter=Q(is_completed=True)),
+            upcoming=Count(
+                "id",
+                filter=Q(
+                    is_completed=False,
+                    vaccination_date__gte=today,
+                    vaccination_date__lte=today + timedelta(days=UPCOMING_DAYS),
+                ),
+            ),
+            overdue=Count(
+                "id", filter=Q(is_completed=False, vaccination_date__lt=today)
+            ),
+        )
+    )
+    for row in rows:
+        stats[row.pop("child_id")] = row
+    return stats
+
+
+def refresh_child_stats(
+    child_ids: Iterable[int], today: Optional[date] = None
+) -> List[ChildVaccinationStats]:
+    """
+    아이들의 통계를 다시 집계해 저장 (집계 1회 + upsert 1회)
+
+    일정을 바꾼 트랜잭션 안에서 호출해야 통계와 일정이 함께 커밋됩니다.
+    """
+    today = today or timezone.localdate()
+    rows = [
+        ChildVaccinationStats(child_id=child_id, as_of=today, **counts)
+        for child_id, counts in compute_child_stats(child_ids, today).items()
+    ]
+    if rows:
+        ChildVaccinationStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["child"],
+            update_fields=STATS_FIELDS + ["as_of", "updated_at"],
+        )
+    return rows
+
+
+def update_child_stats(
+    child_id: int,
+    before: Optional[ScheduleState],
+    after: Optional[ScheduleState],
+    today: Optional[date] = None,
+):
+    """
+    일정 한 건의 변경을 통계에 증감으로 반영 (UPDATE 1회)
+
+    통계 행이 없거나 기준일이 오늘이 아니면 증감 대신 다시 집계합니다.
+
+    Args:
+        child_id: 아이 ID
+        before: 변경 전 상태 (새로 생긴 일정이면 None)
+        after: 변경 후 상태 (삭제된 일정이면 None)
+    """
+    today = today or timezone.localdate()
+    old = _state_counts(before, today)
+    new = _state_counts(after, today)
+    delta = {field: new[field] - old[field] for field in STATS_FIELDS}
+    if not any(delta.values()):
+        return
+
+    updated = ChildVaccinationStats.objects.filter(
+        child_id=child_id, as_of=today
+    ).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in delta.items() if value},
+    )
+    if not updated:
+        refresh_child_stats([child_id], today)
+
+
+def set_schedule_completed(
+    schedule: VaccinationSchedule,
+    is_completed: bool,
+    completed_date: Optional[date] = None,
+) -> VaccinationSchedule:
+    """
+    일정 완료/완료 취소 후 통계 반영 (한 트랜잭션)
+
+    Args:
+        schedule: 변경할 일정
+        is_completed: 완료 여부
+        completed_date: 실제 접종일 (완료 시, 기본: 오늘)
+    """
+    with transaction.atomic():
+        before = schedule_state(schedule)
+        schedule.is_completed = is_completed
+        schedule.completed_date = (
+            (completed_date or timezone.localdate()) if is_completed else None
+        )
+        schedule.save(update_fields=["is_completed", "completed_date", "updated_at"])
+        update_child_stats(schedule.child_id, before, schedule_state(schedule))
+    return schedule
+
+
+def complete_schedules(
+    user,
+    ids: Optional[Iterable[int]] = None,
+    child: Optional[Child] = None,
+    vaccination_date: Optional[date] = None,
+    completed_date: Optional[date] = None,
+    today: Optional[date] = None,
+) -> List[int]:
+    """
+    여러 일정을 한 번에 완료 처리 (한 방문에 여러 백신을 맞은 경우)
+
+    한 트랜잭션에서 소유 확인 조회 1회, 일정 UPDATE 1회, 통계 재집계 1회를
+    실행합니다. 알림은 일정에서 계산하며 완료된 일정은 발송 대상에서
+    빠지므로 따로 갱신하지 않습니다.
+
+    Args:
+        user: 보호자 (이 사용자의 일정만 처리)
+        ids: 일정 ID 목록
+        child, vaccination_date: ids 대신 아이의 해당 접종 예정일 일정 전체
+        completed_date: 실제 접종일 (기본: 오늘)
+
+    Returns:
+        완료 처리한 일정 ID 목록
+
+    Raises:
+        VaccinationSchedule.DoesNotExist: ids 중 사용자의 일정이 아닌 것이 있는 경우
+    """
+    today = today or timezone.localdate()
+    queryset = VaccinationSchedule.objects.filter(child__user=user)
+    if ids is not None:
+        ids = set(ids)
+        queryset = queryset.filter(pk__in=ids)
+    if child is not None:
+        queryset = queryset.filter(child=child, vaccination_date=vaccination_date)
+
+    with transaction.atomic():
+        rows = list(queryset.values_list("pk", "child_id"))
+        if ids is not None and len(rows) != len(ids):
+            missing = ids - {pk for pk, _ in rows}
+            raise VaccinationSchedule.DoesNotExist(
+                f"일정을 찾을 수 없습니다: {sorted(missing)}"
+            )
+        if not rows:
+            return []
+
+        schedule_ids = [pk for pk, _ in rows]
+        # QuerySet.update는 save()를 거치지 않으므로 status/updated_at도 직접 갱신
+        VaccinationSchedule.objects.filter(pk__in=schedule_ids).update(
+            is_completed=True,
+            completed_date=completed_date or today,
+            status="completed",
+            updated_at=timezone.now(),
+        )
+        refresh_child_stats({child_id for _, child_id in rows}, today)
+        invalidate_children({child_id for _, child_id in rows})
+    return schedule_ids
+
+
+def delete_schedule(schedule: VaccinationSchedule):
+    """일정 삭제 후 통계 반영 (한 트랜잭션, 동기화용 삭제 기록 포함)"""
+    with transaction.atomic():
+        child_id, before = schedule.child_id, schedule_state(schedule)
+        record_schedule_deletions([schedule.pk])
+        schedule.delete()
+        update_child_stats(child_id, before, None)
+
+
+def get_child_stats(child: Child) -> ChildVaccinationStats:
+    """
+    아이 통계 조회
+
+    행이 없거나 rollover 전이라 기준일이 지났으면 그 자리에서 다시 집계합니다.
+    """
+    today = timezone.localdate()
+    stats = ChildVaccinationStats.objects.filter(child_id=child.pk).first()
+    if stats is None or stats.as_of != today:
+        with transaction.atomic():
+            stats = refresh_child_stats([child.pk], today)[0]
+    return stats
+
+
+def get_dashboard_children(
+    user, upcoming_limit: int = 5, today: Optional[date] = None
+) -> List[Child]:
+    """
+    대시보드용 아이 목록 (통계, 다가오는 접종 N건, 지연 접종 포함)
+
+    아이 수와 관계없이 쿼리 3회로 조회합니다.
+    (아이 + 통계 JOIN 1회, 다가오는/지연 일정 prefetch 각 1회)
+    통계가 없거나 rollover 전인 아이가 있으면 한 번에 다시 집계합니다.
+
+    Returns:
+        child.vaccination_stats, child.upcoming_schedules,
+        child.overdue_schedules가 채워진 Child 리스트
+    """
+    today = today or timezone.localdate()
+    pending = VaccinationSchedule.objects.filter(is_completed=False)
+    children = list(
+        Child.objects.filter(user=user)
+        .select_related("vaccination_stats")
+        .prefetch_related(
+            Prefetch(
+                "vaccination_schedules",
+                queryset=pending.filter(vaccination_date__gte=today).order_by(
+                    "vaccination_date", "id"
+                )[:upcoming_limit],
+                to_attr="upcoming_schedules",
+            ),
+            Prefetch(
+                "vaccination_schedules",
+                queryset=pending.filter(vaccination_date__lt=today).order_by(
+                    "vaccination_date", "id"
+                ),
+                to_attr="overdue_schedules",
+            ),
+        )
+    )
+
+    stale = [
+        child
+        for child in children
+        if getattr(child, "vaccination_stats", None) is None
+        or child.vaccination_stats.as_of != today
+    ]
+    if stale:
+        with transaction.atomic():
+            refreshed = {
+                stats.child_id: stats
+                for stats in refresh_child_stats([child.pk for child in stale], today)
+            }
+        for child in stale:
+            child.vaccination_stats = refreshed[child.pk]
+    return children
+
+
+def rollover_child_stats(
+    today: Optional[date] = None, batch_size: int = BULK_BATCH_SIZE
+) -> int:
+    """
+    기준일이 지난 통계를 오늘 기준으로 다시 집계 (매일 실행)
+
+    배치마다 별도 트랜잭션으로 처리하므로 중간에 멈춰도 다시 실행하면
+    남은 행부터 이어집니다.
+
+    Returns:
+        갱신한 아이 수
+    """
+    today = today or timezone.localdate()
+    refreshed = 0
+    while True:
+        child_ids = list(
+            ChildVaccinationStats.objects.filter(as_of__lt=today)
+            .order_by("child_id")
+            .values_list("child_id", flat=True)[:batch_size]
+        )
+        if not child_ids:
+            return refreshed
+        with transaction.atomic():
+            refresh_child_stats(child_ids, today)
+        refreshed += len(child_ids)
+
+
+def find_inconsistent_child_stats(
+    today: Optional[date] = None, batch_size: int = BULK_BATCH_SIZE
+) -> List[int]:
+    """
+    저장된 통계와 일정 테이블 집계가 다른 아이 ID 목록 (행이 없는 경우 포함)
+
+    기준일이 오늘이 아닌 행은 rollover 대상이므로 불일치로 보지 않습니다.
+    """
+    today = today or timezone.localdate()
+    mismatched = []
+    last_pk = 0
+    while True:
+        child_ids = list(
+            Child.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not child_ids:
+            return mismatched
+        last_pk = child_ids[-1]
+
+        stored = {
+            stats.child_id: stats
+            for stats in ChildVaccinationStats.objects.filter(child_id__in=child_ids)
+        }
+        for child_id, counts in compute_child_stats(child_ids, today).items():
+            stats = stored.get(child_id)
+            if stats is None:
+                mismatched.append(child_id)
+            elif stats.as_of == today and any(
+                getattr(stats, field) != value for field, value in counts.items()
+            ):
+                mismatched.append(child_id)
 
 
 def create_vaccination_schedules(child: Child) -> int:
@@ -20,53 +628,218 @@ def create_vaccination_schedules(child: Child) -> int:
     Returns:
         생성된 일정 개수
     """
-    # immunization_schedule_2025.json 경로
-    base_dir = Path(__file__).resolve().parent.parent
-    schedule_json_path = base_dir / "immunization_schedule_2025.json"
+    return bulk_create_vaccination_schedules([child])
+
+
+# ============================================
+# 가상 알림
+# ============================================
+
 
-    # 계산기 초기화
-    calculator = ImmunizationScheduleCalculator(str(schedule_json_path))
+def unstored_notification_schedules(queryset=None):
+    """
+    알림 행이 아직 없는 일정 (가상 알림의 원본)
 
-    # 출생일을 datetime 객체로 변환
-    birth_datetime = datetime.combine(child.birth_date, datetime.min.time())
+    보관 테이블로 옮긴 알림도 이미 처리된 것으로 봅니다.
 
-    # 전체 예방접종 일정 계산
-    schedules = calculator.get_child_schedule(
-        birth_date=birth_datetime, gender=child.gender, include_optional=False
+    Args:
+        queryset: 대상 일정 QuerySet (기본: 전체)
+    """
+    if queryset is None:
+        queryset = VaccinationSchedule.objects.all()
+    return queryset.filter(
+        ~Exists(VaccinationNotification.objects.filter(schedule=OuterRef("pk"))),
+        ~Exists(
+            VaccinationNotificationArchive.objects.filter(schedule_id=OuterRef("pk"))
+        ),
     )
 
-    created_count = 0
 
-    for schedule_item in schedules:
-        # VaccinationSchedule 생성
-        vaccination_schedule = VaccinationSchedule.objects.create(
-            child=child,
-            vaccine_id=schedule_item["vaccine_id"],
-            vaccine_name=schedule_item["vaccine_name"],
-            disease=schedule_item["disease"],
-            dose_number=schedule_item["dose_number"],
-            age_description=schedule_item["age_description"],
-            vaccination_date=datetime.strptime(
-                schedule_item["vaccination_date"], "%Y-%m-%d"
-            ).date(),
-            notification_date=datetime.strptime(
-                schedule_item["notification_date"], "%Y-%m-%d"
-            ).date(),
-            is_mandatory=schedule_item["is_mandatory"],
-            is_annual=schedule_item["is_annual"],
-            notes=schedule_item.get("notes", ""),
-        )
+def virtual_notification(schedule: VaccinationSchedule) -> VaccinationNotification:
+    """일정에서 계산한 대기 알림 (저장하지 않음, id는 None)"""
+    return VaccinationNotification(
+        schedule=schedule,
+        notification_date=schedule.notification_date,
+        status="pending",
+    )
 
-        # 알림 생성 (1달 전)
-        VaccinationNotification.objects.create(
-            schedule=vaccination_schedule,
-            notification_date=vaccination_schedule.notification_date,
-            status="pending",
+
+# 알림 목록에서 읽는 알림 컬럼 (일정 컬럼을 .only()로 줄일 때 함께 지정)
+NOTIFICATION_LIST_FIELDS = [
+    "schedule",
+    "notification_date",
+    "status",
+    "sent_at",
+    "read_at",
+    "created_at",
+    "updated_at",
+]
+
+
+def list_notifications(
+    user,
+    child: Optional[Child] = None,
+    status: Optional[str] = None,
+    after: Optional[Sequence] = None,
+    limit: Optional[int] = None,
+    schedule_only: Optional[Sequence[str]] = None,
+) -> List[VaccinationNotification]:
+    """
+    저장된 알림과 가상 알림을 합친 목록 (알림일 최신순, 같으면 일정 ID 역순)
+
+    Args:
+        user: 보호자
+        child: 특정 아이만 조회
+        status: 상태 필터 (pending이면 재시도 대기 알림 + 가상 알림)
+        after: 이 (notification_date, schedule_id) 다음부터 (keyset 페이지)
+        limit: 최대 개수 (저장된/가상 알림을 각각 limit개만 읽어 합침)
+        schedule_only: 읽을 일정 컬럼 (.only(), 기본: 전체)
+    """
+    stored = VaccinationNotification.objects.filter(
+        schedule__child__user=user
+    ).select_related("schedule")
+    schedules = VaccinationSchedule.objects.filter(child__user=user)
+    if child is not None:
+        stored = stored.filter(schedule__child=child)
+        schedules = schedules.filter(child=child)
+    if status:
+        stored = stored.filter(status=status)
+    if schedule_only is not None:
+        stored = stored.only(
+            *NOTIFICATION_LIST_FIELDS,
+            *(f"schedule__{field}" for field in schedule_only),
         )
+        schedules = schedules.only(*schedule_only)
+
+    notifications = list(
+        keyset_page(stored, ("-notification_date", "-schedule_id"), after, limit)
+    )
+    if status in (None, "", "pending"):
+        notifications += [
+            virtual_notification(schedule)
+            for schedule in keyset_page(
+                unstored_notification_schedules(schedules),
+                ("-notification_date", "-id"),
+                after,
+                limit,
+            )
+        ]
+    notifications.sort(key=lambda n: (n.notification_date, n.schedule_id), reverse=True)
+    return notifications[:limit]
+
+
+def mark_notification_read(schedule: VaccinationSchedule) -> VaccinationNotification:
+    """
+    일정의 알림을 읽음 처리 (가상 알림이면 이때 행을 저장)
+    """
+    now = timezone.now()
+    notification, created = VaccinationNotification.objects.get_or_create(
+        schedule=schedule,
+        defaults={
+            "notification_date": schedule.notification_date,
+            "status": "read",
+            "read_at": now,
+        },
+    )
+    if not created and notification.status != "read":
+        notification.status = "read"
+        notification.read_at = now
+        notification.save(update_fields=["status", "read_at", "updated_at"])
+    return notification
+
+
+# 일괄 변경 시 상태별로 바꿀 수 있는 이전 상태 (읽음을 발송됨으로 되돌리지 않음)
+BULK_STATUS_TRANSITIONS = {
+    "read": ["pending", "sending", "sent", "failed"],
+    "sent": ["pending", "sending", "failed"],
+}
+
+
+def bulk_mark_notifications(
+    user,
+    status: str,
+    ids: Optional[Iterable[int]] = None,
+    schedule_ids: Optional[Iterable[int]] = None,
+    before: Optional[date] = None,
+    child: Optional[Child] = None,
+) -> int:
+    """
+    알림 상태 일괄 변경 (read/sent)
+
+    주어진 조건 중 하나라도 맞는 사용자의 알림을 바꿉니다. 저장된 알림은
+    소유자 조건을 포함한 UPDATE 한 번으로, 가상 알림은 조회 1회 + INSERT +
+    실제로 저장된 수 확인으로 처리하므로 알림 수와 관계없이 쿼리 수가
+    (BULK_BATCH_SIZE건마다) 일정합니다.
+
+    Args:
+        user: 보호자 (이 사용자의 아이 알림만 변경)
+        status: "read" 또는 "sent"
+        ids: 저장된 알림 ID
+        schedule_ids: 일정 ID (가상 알림 포함)
+        before: 알림일이 이 날짜 이하인 모든 알림 (가상 알림 포함)
+        child: 특정 아이로 제한
+
+    Returns:
+        변경(저장)된 알림 수
+    """
+    stamp_field = {"read": "read_at", "sent": "sent_at"}[status]
+    ids, schedule_ids = list(ids or []), list(schedule_ids or [])
 
-        created_count += 1
+    schedule_match = Q()  # 일정 조건 (가상 알림 저장용)
+    stored_match = Q()  # 저장된 알림 조건
+    if schedule_ids:
+        schedule_match |= Q(id__in=schedule_ids)
+        stored_match |= Q(schedule_id__in=schedule_ids)
+    if before is not None:
+        schedule_match |= Q(notification_date__lte=before)
+        stored_match |= Q(notification_date__lte=before)
+    if ids:
+        stored_match |= Q(id__in=ids)
+    if not stored_match:
+        return 0
 
-    return created_count
+    stored = VaccinationNotification.objects.filter(
+        stored_match,
+        schedule__child__user=user,
+        status__in=BULK_STATUS_TRANSITIONS[status],
+    )
+    schedules = VaccinationSchedule.objects.filter(child__user=user)
+    if child is not None:
+        stored = stored.filter(schedule__child=child)
+        schedules = schedules.filter(child=child)
+
+    now = timezone.now()
+    with transaction.atomic():
+        changed = stored.update(status=status, updated_at=now, **{stamp_field: now})
+        if schedule_match:
+            rows = list(
+                unstored_notification_schedules(
+                    schedules.filter(schedule_match)
+                ).values_list("id", "notification_date")
+            )
+            VaccinationNotification.objects.bulk_create(
+                [
+                    VaccinationNotification(
+                        schedule_id=schedule_id,
+                        notification_date=notification_date,
+                        status=status,
+                        **{stamp_field: now},
+                    )
+                    for schedule_id, notification_date in rows
+                ],
+                batch_size=BULK_BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            # 그 사이 다른 요청(발송, 읽음)이 먼저 저장한 일정은 INSERT가
+            # 건너뛰므로, 이번 시각으로 저장된 행만 다시 세어 더함
+            schedule_ids = [schedule_id for schedule_id, _ in rows]
+            for start in range(0, len(schedule_ids), BULK_BATCH_SIZE):
+                changed += VaccinationNotification.objects.filter(
+                    schedule_id__in=schedule_ids[start : start + BULK_BATCH_SIZE],
+                    status=status,
+                    **{stamp_field: now},
+                ).count()
+    return changed
 
 
 def get_upcoming_schedules(child: Child, days_ahead: int = 60):
@@ -80,9 +853,82 @@ def get_upcoming_schedules(child: Child, days_ahead: int = 60):
     Returns:
         다가오는 일정 QuerySet
     """
+    today = timezone.localdate()
     return VaccinationSchedule.objects.filter(
-        child=child, is_completed=False
-    ).select_related("child")[:days_ahead]
+        child=child,
+        is_completed=False,
+        vaccination_date__gte=today,
+        vaccination_date__lte=today + timedelta(days=days_ahead),
+    ).select_related("child")
+
+
+# ============================================
+# 일정 상태 (status) 전환
+# ============================================
+
+# 매일 전환: (이전 상태들, 새 상태, 접종 예정일 상한 계산)
+STATUS_ROLLOVERS = [
+    (
+        ["scheduled", "due_soon"],
+        "overdue",
+        lambda today: {"vaccination_date__lt": today},
+    ),
+    (
+        ["scheduled"],
+        "due_soon",
+        lambda today: {"vaccination_date__lte": today + timedelta(days=UPCOMING_DAYS)},
+    ),
+]
+
+
+def overdue_q(today: Optional[date] = None) -> Q:
+    """
+    지연 일정 조건 (status 인덱스 조회)
+
+    rollover 전이라 아직 전환되지 않은 행도 (status, vaccination_date)
+    인덱스 범위로 함께 찾으므로 실행 시각과 관계없이 정확합니다.
+    """
+    today = today or timezone.localdate()
+    return Q(status="overdue") | Q(
+        status__in=["scheduled", "due_soon"], vaccination_date__lt=today
+    )
+
+
+def rollover_schedule_statuses(
+    today: Optional[date] = None, batch_size: int = BULK_BATCH_SIZE
+) -> dict:
+    """
+    날짜가 지나 바뀐 일정 상태 반영 (매일 실행)
+
+    전환마다 (status, vaccination_date) 인덱스 범위에서 batch_size건씩
+    ID를 읽어 UPDATE하며, 배치마다 별도 트랜잭션과 새 시각(updated_at)을
+    씁니다. 행 잠금을 짧게 유지하고 델타 동기화의 SYNC_OVERLAP 안에
+    커밋되게 하기 위함이며, 중간에 멈춰도 다시 실행하면 남은 행부터 이어집니다.
+
+    Returns:
+        {새 상태: 전환된 일정 수}
+    """
+    today = today or timezone.localdate()
+    changed = {}
+    for old_statuses, new_status, bound in STATUS_ROLLOVERS:
+        pending = VaccinationSchedule.objects.filter(
+            status__in=old_statuses, **bound(today)
+        )
+        changed[new_status] = 0
+        while True:
+            ids = list(
+                pending.order_by("vaccination_date", "id").values_list("id", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                changed[new_status] += pending.filter(id__in=ids).update(
+                    status=new_status, updated_at=timezone.now()
+                )
+                invalidate_all()
+    return changed
 
 
 def get_overdue_schedules(child: Child):
@@ -95,11 +941,6 @@ def get_overdue_schedules(child: Child):
     Returns:
         지연된 일정 QuerySet
     """
-    from datetime import date
-
     return VaccinationSchedule.objects.filter(
-        child=child,
-        is_completed=False,
-        is_mandatory=True,
-        vaccination_date__lt=date.today(),
+        overdue_q(), child=child, is_mandatory=True
     ).select_related("child")
@@ -0,0 +1,24 @@
+"""
+예방접종 신호 처리 (조회 응답 캐시 무효화)
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from children.models import Child
+from vaccinations.cache import invalidate_children
+from vaccinations.models import VaccinationSchedule
+
+
+@receiver(post_save, sender=VaccinationSchedule)
+@receiver(post_delete, sender=VaccinationSchedule)
+def invalidate_schedule_child(sender, instance, **kwargs):
+    """일정이 바뀌면 그 아이의 캐시 무효화"""
+    invalidate_children([instance.child_id])
+
+
+@receiver(post_save, sender=Child)
+@receiver(post_delete, sender=Child)
+def invalidate_child(sender, instance, **kwargs):
+    """아이 정보가 바뀌거나 삭제되면 그 아이의 캐시 무효화"""
+    invalidate_children([instance.pk])
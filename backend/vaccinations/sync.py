@@ -0,0 +1,181 @@
+"""
+예방접종 델타 동기화
+
+앱은 일정/알림을 오프라인 저장소에 두고, 마지막으로 받은 cursor 이후
+생성/수정/삭제된 행만 받아 반영합니다.
+
+- 생성/수정: 각 테이블의 updated_at으로 찾습니다.
+- 삭제: 삭제 시점에 SyncTombstone 행을 남겨 찾습니다.
+- 대기 중인 가상 알림은 행이 없으므로 앱이 일정의 notification_date로
+  계산합니다. 발송/읽음 처리되어 저장되는 순간 변경분에 포함됩니다.
+- 보관 테이블로 옮긴 알림은 삭제 기록과 함께 그 일정 ID를
+  archived_schedules로 알려 줍니다. 앱은 이 일정들로 가상 알림을 만들지
+  않습니다 (서버의 unnotified_schedules와 같은 기준).
+
+cursor는 조회를 시작한 서버 시각(ISO 8601)입니다. updated_at/deleted_at은
+행을 쓰는 시점에 찍히지만 트랜잭션이 커밋된 뒤에야 보이므로, 조회할 때
+SYNC_OVERLAP만큼 겹쳐서 읽고 앱은 ID 기준 upsert로 중복을 흡수합니다.
+
+제약: 일정/알림/삭제 기록을 쓰는 트랜잭션은 SYNC_OVERLAP 안에 커밋되어야
+합니다. 더 늦게 커밋된 행은 그 사이 동기화한 앱이 놓칩니다. 많은 행을
+바꾸는 작업은 짧은 트랜잭션 여러 개로 나누고, 트랜잭션마다 시각을 새로
+잡습니다 (sync_vaccination_schedules, rollover_schedule_statuses,
+archive_notifications 참고).
+"""
+
+from datetime import datetime, timedelta
+from typing import Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from vaccinations.models import (
+    SyncTombstone,
+    VaccinationNotification,
+    VaccinationNotificationArchive,
+    VaccinationSchedule,
+)
+
+# 직전 cursor보다 이만큼 앞서서부터 조회 (늦게 커밋된 트랜잭션 대비)
+# 동기화 대상 테이블에 쓰는 트랜잭션의 최대 길이이기도 합니다 (모듈 설명 참고).
+SYNC_OVERLAP = timedelta(seconds=30)
+
+PRUNE_BATCH_SIZE = 1000
+
+
+class SyncResult(NamedTuple):
+    """델타 동기화 결과"""
+
+    cursor: str
+    reset: bool  # True면 전체 목록이므로 앱이 저장소를 비우고 다시 채움
+    schedules: List[VaccinationSchedule]
+    notifications: List[VaccinationNotification]
+    deleted_schedules: List[int]
+    deleted_notifications: List[int]
+    archived_schedules: List[int]  # 알림이 보관되어 가상 알림을 만들지 않을 일정
+
+
+def encode_cursor(moment: datetime) -> str:
+    """서버 시각을 cursor 문자열로"""
+    return moment.isoformat()
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """
+    cursor 문자열을 서버 시각으로
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    moment = parse_datetime(cursor)
+    if moment is None:
+        raise ValueError(f"잘못된 cursor: {cursor}")
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def tombstone_cutoff(now: Optional[datetime] = None) -> datetime:
+    """이 시각보다 오래된 삭제 기록은 정리 대상 (그 전 cursor는 전체 동기화)"""
+    return (now or timezone.now()) - timedelta(
+        days=settings.SYNC_TOMBSTONE_RETENTION_DAYS
+    )
+
+
+def record_schedule_deletions(schedule_ids: Iterable[int]) -> int:
+    """
+    지우기 직전 일정과 함께 지워질 알림의 삭제 기록
+
+    일정을 지우는 트랜잭션 안에서 삭제보다 먼저 호출합니다.
+
+    Returns:
+        남긴 기록 수
+    """
+    schedule_ids = list(schedule_ids)
+    if not schedule_ids:
+        return 0
+    tombstones = [
+        SyncTombstone(user_id=user_id, kind="schedule", object_id=pk)
+        for pk, user_id in VaccinationSchedule.objects.filter(
+            pk__in=schedule_ids
+        ).values_list("pk", "child__user_id")
+    ]
+    tombstones += [
+        SyncTombstone(user_id=user_id, kind="notification", object_id=pk)
+        for pk, user_id in VaccinationNotification.objects.filter(
+            schedule_id__in=schedule_ids
+        ).values_list("pk", "schedule__child__user_id")
+    ]
+    SyncTombstone.objects.bulk_create(tombstones)
+    return len(tombstones)
+
+
+def changes_since(
+    user, since: Optional[datetime] = None, now: Optional[datetime] = None
+) -> SyncResult:
+    """
+    cursor 이후 사용자의 일정/알림 변경분
+
+    since가 없거나 삭제 기록 보존 기간보다 오래됐으면 전체 목록을
+    reset=True로 돌려줍니다.
+
+    Args:
+        user: 보호자
+        since: 직전 응답의 cursor를 decode_cursor로 푼 값
+        now: 기준 시각 (기본: 현재)
+    """
+    now = now or timezone.now()
+    schedules = VaccinationSchedule.objects.filter(child__user=user).order_by("id")
+    notifications = VaccinationNotification.objects.filter(
+        schedule__child__user=user
+    ).order_by("id")
+    archived = VaccinationNotificationArchive.objects.filter(
+        schedule_id__in=VaccinationSchedule.objects.filter(child__user=user).values(
+            "id"
+        )
+    )
+    deleted = {"schedule": [], "notification": []}
+
+    reset = since is None or since < tombstone_cutoff(now)
+    if not reset:
+        after = since - SYNC_OVERLAP
+        schedules = schedules.filter(updated_at__gte=after)
+        notifications = notifications.filter(updated_at__gte=after)
+        archived = archived.filter(archived_at__gte=after)
+        for kind, object_id in SyncTombstone.objects.filter(
+            user=user, deleted_at__gte=after
+        ).values_list("kind", "object_id"):
+            deleted[kind].append(object_id)
+
+    return SyncResult(
+        cursor=encode_cursor(now),
+        reset=reset,
+        schedules=list(schedules),
+        notifications=list(notifications),
+        deleted_schedules=deleted["schedule"],
+        deleted_notifications=deleted["notification"],
+        archived_schedules=sorted(set(archived.values_list("schedule_id", flat=True))),
+    )
+
+
+def prune_tombstones(
+    now: Optional[datetime] = None, batch_size: int = PRUNE_BATCH_SIZE
+) -> int:
+    """
+    보존 기간이 지난 삭제 기록을 배치 단위로 정리
+
+    Returns:
+        지운 기록 수
+    """
+    cutoff = tombstone_cutoff(now)
+    pruned = 0
+    while True:
+        ids = list(
+            SyncTombstone.objects.filter(deleted_at__lt=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return pruned
+        pruned += SyncTombstone.objects.filter(id__in=ids).delete()[0]
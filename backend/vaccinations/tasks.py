@@ -0,0 +1,37 @@
+"""
+예방접종 백그라운드 작업 (jobs 앱의 run_worker가 실행)
+"""
+
+from children.models import Child
+from jobs.services import task
+from vaccinations.services import (
+    rollover_child_stats,
+    rollover_schedule_statuses,
+    sync_vaccination_schedules,
+)
+
+
+@task("vaccinations.generate_schedules")
+def generate_schedules(child_id: int):
+    """
+    아이의 예방접종 일정 생성
+
+    일정이 이미 있으면 차이만 반영하므로 재시도해도 중복되지 않습니다.
+    아이가 그 사이 삭제되었으면 아무것도 하지 않습니다.
+    """
+    child = Child.objects.filter(pk=child_id).first()
+    if child is None:
+        return
+    sync_vaccination_schedules([child])
+
+
+@task("vaccinations.rollover_stats", atomic=False)
+def rollover_stats():
+    """기준일이 지난 아이별 통계를 오늘 기준으로 다시 집계 (매일 실행, 배치마다 커밋)"""
+    rollover_child_stats()
+
+
+@task("vaccinations.rollover_schedule_statuses", atomic=False)
+def rollover_statuses():
+    """날짜가 지나 바뀐 일정 상태(임박/지연) 반영 (매일 실행, 배치마다 커밋)"""
+    rollover_schedule_statuses()
@@ -6,7 +6,11 @@ Vaccinations 앱 테스트
     pytest vaccinations/tests.py::TestVaccineModel
 """
 
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+
 import pytest
+from django.utils import timezone
 
 # ============================================
 # 기본 테스트 (모델 만들기 전)
@@ -349,3 +353,2626 @@ class TestVaccinationHelpers:
     def test_placeholder_for_future_helpers(self):
         """나중에 추가할 헬퍼 함수들을 위한 자리"""
         assert True
+
+
+# ============================================
+# 예방접종 일정 계산기 테스트
+# ============================================
+
+
+@pytest.fixture
+def schedule_json(tmp_path):
+    """
+    테스트용 일정 JSON 파일 (실제 2025 일정 복사본)
+    """
+    from immunization_calculator import DEFAULT_SCHEDULE_PATH
+
+    path = tmp_path / "schedule.json"
+    path.write_bytes(DEFAULT_SCHEDULE_PATH.read_bytes())
+    return path
+
+
+class TestScheduleRegistry:
+    """프로세스 전역 계산기 레지스트리 테스트"""
+
+    def test_loads_once(self, schedule_json):
+        """같은 경로는 한 번만 파싱"""
+        from immunization_calculator import ScheduleRegistry
+
+        registry = ScheduleRegistry(check_interval=0)
+        first = registry.get(schedule_json)
+        second = registry.get(str(schedule_json))
+
+        assert first is second
+        assert registry.load_count == 1
+        assert registry.reload_count == 0
+        assert registry.stats()["schedules"] == {str(schedule_json): "2025"}
+
+    def test_reloads_on_change(self, schedule_json):
+        """파일 내용이 바뀌면 새 계산기로 교체"""
+        import json
+        import os
+
+        from immunization_calculator import ScheduleRegistry
+
+        registry = ScheduleRegistry(check_interval=0)
+        old = registry.get(schedule_json)
+
+        data = json.loads(schedule_json.read_text(encoding="utf-8"))
+        data["metadata"]["version"] = "2026"
+        schedule_json.write_text(json.dumps(data), encoding="utf-8")
+        stat = schedule_json.stat()
+        os.utime(schedule_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        new = registry.get(schedule_json)
+
+        assert new is not old
+        assert new.version == "2026"
+        assert registry.load_count == 1
+        assert registry.reload_count == 1
+
+    def test_touch_without_change_keeps_calculator(self, schedule_json):
+        """mtime만 바뀌고 내용이 같으면 다시 파싱하지 않음"""
+        import os
+
+        from immunization_calculator import ScheduleRegistry
+
+        registry = ScheduleRegistry(check_interval=0)
+        old = registry.get(schedule_json)
+
+        stat = schedule_json.stat()
+        os.utime(schedule_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert registry.get(schedule_json) is old
+        assert registry.reload_count == 0
+
+    def test_check_interval_skips_stat(self, schedule_json):
+        """확인 간격 이내에는 파일을 다시 확인하지 않음"""
+        from immunization_calculator import ScheduleRegistry
+
+        registry = ScheduleRegistry(check_interval=3600)
+        old = registry.get(schedule_json)
+        schedule_json.write_text("{}", encoding="utf-8")
+
+        assert registry.get(schedule_json) is old
+
+
+class TestBulkSchedule:
+    """여러 아이 일괄 일정 계산 테스트"""
+
+    BIRTH_DATES = [
+        date(2024, 1, 15),
+        date(2024, 1, 31),  # 월말 보정
+        date(2024, 2, 29),  # 윤일
+        date(2023, 8, 31),
+        date(2023, 12, 31),
+        date(2025, 3, 1),
+    ]
+
+    @pytest.mark.parametrize("include_optional", [False, True])
+    def test_matches_scalar_schedule(self, include_optional):
+        """일괄 계산 결과가 get_child_schedule과 정확히 일치"""
+        from immunization_calculator import DEFAULT_SCHEDULE_PATH, get_calculator
+
+        calculator = get_calculator(DEFAULT_SCHEDULE_PATH)
+        genders = ["male", "female", None, "female", "male", None]
+
+        bulk = calculator.get_schedules_bulk(
+            self.BIRTH_DATES, genders, include_optional=include_optional
+        )
+
+        for child_index, (birth_date, gender) in enumerate(
+            zip(self.BIRTH_DATES, genders)
+        ):
+            expected = calculator.get_child_schedule(
+                datetime.combine(birth_date, datetime.min.time()),
+                gender=gender,
+                include_optional=include_optional,
+            )
+            rows = bulk["child_index"] == child_index
+
+            assert rows.sum() == len(expected)
+            assert [
+                (item["vaccine_id"], item["dose_number"]) for item in expected
+            ] == list(zip(bulk["vaccine_id"][rows], bulk["dose_number"][rows]))
+            assert [item["vaccination_date"] for item in expected] == [
+                str(d) for d in bulk["vaccination_date"][rows]
+            ]
+            assert [item["notification_date"] for item in expected] == [
+                str(d) for d in bulk["notification_date"][rows]
+            ]
+            assert [item["is_overdue"] for item in expected] == list(
+                bulk["is_overdue"][rows]
+            )
+            assert [item["is_mandatory"] for item in expected] == list(
+                bulk["is_mandatory"][rows]
+            )
+
+    def test_empty_input(self):
+        """빈 입력은 빈 배열 반환"""
+        from immunization_calculator import get_calculator
+
+        bulk = get_calculator().get_schedules_bulk([])
+
+        assert len(bulk["child_index"]) == 0
+        assert len(bulk["vaccination_date"]) == 0
+
+
+class TestScheduleItem:
+    """타입이 있는 일정 항목(ScheduleItem) 테스트"""
+
+    def test_items_carry_dates(self):
+        """접종일/알림일이 date 객체로 제공됨"""
+        from immunization_calculator import get_calculator
+
+        items = list(get_calculator().iter_child_schedule(date(2024, 1, 31), "male"))
+
+        assert all(isinstance(item.vaccination_date, date) for item in items)
+        assert [item.vaccination_date for item in items] == sorted(
+            item.vaccination_date for item in items
+        )
+        # 1월 31일 출생 → 생후 1개월은 2월 말일
+        hep_b_2 = next(
+            item
+            for item in items
+            if item.dose.vaccine_id == 2 and item.dose.dose_number == 2
+        )
+        assert hep_b_2.vaccination_date == date(2024, 2, 29)
+        assert hep_b_2.notification_date == date(2024, 1, 30)
+
+    def test_metadata_is_shared(self):
+        """아이가 달라도 같은 차수의 메타데이터 객체를 공유"""
+        from immunization_calculator import get_calculator
+
+        calculator = get_calculator()
+        first = list(calculator.iter_child_schedule(date(2024, 1, 15)))
+        second = list(calculator.iter_child_schedule(date(2020, 6, 1)))
+
+        first_doses = {id(item.dose) for item in first}
+        assert first_doses == {id(item.dose) for item in second}
+
+    def test_dict_adapter(self):
+        """to_dict가 기존 get_child_schedule 형식과 일치"""
+        from immunization_calculator import get_calculator
+
+        calculator = get_calculator()
+        birth = datetime(2024, 1, 15)
+        now = datetime.now()
+
+        items = calculator.iter_child_schedule(birth, "female")
+
+        assert [item.to_dict(now) for item in items] == (
+            calculator.get_child_schedule(birth, "female")
+        )
+
+
+class TestScheduleIndex:
+    """인덱스 기반 다가오는/지연 접종 조회 테스트"""
+
+    @pytest.mark.parametrize(
+        "now",
+        [
+            datetime(2024, 3, 15, 0, 0),  # 자정
+            datetime(2024, 3, 15, 9, 30),
+            datetime(2025, 1, 1, 23, 59),
+        ],
+    )
+    def test_windows_match_full_scan(self, now):
+        """이진 탐색 결과가 전체 일정 필터링 결과와 일치"""
+        from immunization_calculator import get_calculator
+
+        calculator = get_calculator()
+        birth = date(2024, 1, 15)
+        items = list(calculator.iter_child_schedule(birth, "male"))
+        cutoff = now + timedelta(days=60)
+
+        expected_upcoming = [
+            item
+            for item in items
+            if now <= datetime.combine(item.vaccination_date, time.min) <= cutoff
+        ]
+        expected_overdue = [
+            item for item in items if item.dose.is_mandatory and item.is_overdue(now)
+        ]
+
+        assert list(calculator.get_upcoming_items(birth, "male", 60, now)) == (
+            expected_upcoming
+        )
+        assert list(calculator.get_overdue_items(birth, "male", now)) == (
+            expected_overdue
+        )
+
+    def test_index_is_cached(self):
+        """같은 (출생일, 성별) 조회는 캐시된 인덱스 재사용"""
+        from immunization_calculator import (
+            ImmunizationScheduleCalculator,
+            get_calculator,
+        )
+
+        calculator = ImmunizationScheduleCalculator(
+            schedule_data=get_calculator().schedule_data, index_cache_size=2
+        )
+        first = calculator.get_schedule_index(datetime(2024, 1, 15, 10), "male")
+        second = calculator.get_schedule_index(date(2024, 1, 15), "male")
+
+        assert first is second
+        assert calculator._schedule_index.cache_info().hits == 1
+
+        # 캐시 크기 제한
+        calculator.get_schedule_index(date(2024, 1, 16), "male")
+        calculator.get_schedule_index(date(2024, 1, 17), "male")
+        assert calculator._schedule_index.cache_info().currsize == 2
+
+
+class TestCompiledSchedule:
+    """일정 검증 및 컴파일 파일 테스트"""
+
+    def test_real_schedule_is_valid(self):
+        """배포되는 2025 일정은 스키마 검증 통과"""
+        from immunization_calculator import get_calculator, validate_schedule_data
+
+        assert validate_schedule_data(get_calculator().schedule_data) == []
+
+    def test_missing_field_is_rejected(self, schedule_json):
+        """age_in_months 누락 시 로드 단계에서 실패"""
+        import json
+
+        from immunization_calculator import (
+            ImmunizationScheduleCalculator,
+            ScheduleValidationError,
+        )
+
+        data = json.loads(schedule_json.read_text(encoding="utf-8"))
+        del data["vaccinations"][2]["schedules"][1]["age_in_months"]
+
+        with pytest.raises(ScheduleValidationError) as exc_info:
+            ImmunizationScheduleCalculator(schedule_data=data)
+
+        assert "vaccinations[2].schedules[1]" in str(exc_info.value)
+        assert "age_in_months" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "notification_settings",
+        [[30], "30", {"default_advance_days": True}, {"default_advance_days": -1}],
+    )
+    def test_invalid_notification_settings_are_reported(self, notification_settings):
+        """notification_settings 형식 오류는 예외 대신 오류 메시지"""
+        from immunization_calculator import get_calculator, validate_schedule_data
+
+        data = dict(get_calculator().schedule_data)
+        data["notification_settings"] = notification_settings
+
+        assert any(
+            "default_advance_days" in error for error in validate_schedule_data(data)
+        )
+
+    def test_command_reports_malformed_settings(self, schedule_json):
+        """compile_schedule --check는 트레이스백 대신 CommandError"""
+        import json
+
+        from django.core.management import CommandError, call_command
+
+        data = json.loads(schedule_json.read_text(encoding="utf-8"))
+        data["notification_settings"] = [30]
+        schedule_json.write_text(json.dumps(data), encoding="utf-8")
+
+        with pytest.raises(CommandError, match="default_advance_days"):
+            call_command("compile_schedule", source=str(schedule_json), check=True)
+
+    def test_compiled_matches_json(self, schedule_json):
+        """컴파일 파일로 만든 계산기가 JSON 계산기와 같은 일정 생성"""
+        from immunization_calculator import (
+            ImmunizationScheduleCalculator,
+            compile_schedule,
+            load_compiled_schedule,
+        )
+
+        output = compile_schedule(schedule_json)
+        compiled = load_compiled_schedule(output)
+        original = ImmunizationScheduleCalculator(str(schedule_json))
+
+        assert output == schedule_json.with_suffix(".compiled")
+        assert compiled.compiled_path == output
+        for include_optional in (False, True):
+            assert compiled.get_child_schedule(
+                datetime(2024, 1, 31), "female", include_optional
+            ) == original.get_child_schedule(
+                datetime(2024, 1, 31), "female", include_optional
+            )
+
+    def test_registry_uses_fresh_compiled_file(self, schedule_json):
+        """원본 해시가 같을 때만 레지스트리가 컴파일 파일 사용"""
+        import os
+
+        from immunization_calculator import ScheduleRegistry, compile_schedule
+
+        compile_schedule(schedule_json)
+        registry = ScheduleRegistry(check_interval=0)
+        assert registry.get(schedule_json).compiled_path is not None
+
+        # 원본이 바뀌면 오래된 컴파일 파일은 무시
+        schedule_json.write_bytes(schedule_json.read_bytes() + b"\n")
+        stat = schedule_json.stat()
+        os.utime(schedule_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert registry.get(schedule_json).compiled_path is None
+        assert registry.reload_count == 1
+
+    def test_corrupt_compiled_file_falls_back_to_json(self, schedule_json):
+        """잘린 컴파일 파일은 무시하고 JSON으로 로드"""
+        from immunization_calculator import (
+            ScheduleRegistry,
+            compile_schedule,
+            load_compiled_schedule,
+        )
+
+        output = compile_schedule(schedule_json)
+        output.write_bytes(output.read_bytes()[:-100])
+
+        assert load_compiled_schedule(output) is None
+        calculator = ScheduleRegistry(check_interval=0).get(schedule_json)
+        assert calculator.compiled_path is None
+        assert calculator.get_child_schedule(datetime(2024, 1, 31), "female")
+
+    def test_compiled_rows_of_other_shape_are_ignored(self, schedule_json):
+        """DoseInfo 필드 수가 다른 행은 TypeError 대신 None"""
+        import hashlib
+        import json
+        import pickle
+
+        from immunization_calculator import (
+            COMPILED_FORMAT,
+            COMPILED_MAGIC,
+            load_compiled_schedule,
+        )
+
+        raw = schedule_json.read_bytes()
+        payload = {
+            "schedule_data": json.loads(raw),
+            "doses": {False: [(1, "BCG")], True: []},
+        }
+        output = schedule_json.with_suffix(".compiled")
+        output.write_bytes(
+            COMPILED_MAGIC
+            + COMPILED_FORMAT
+            + hashlib.sha256(raw).digest()
+            + pickle.dumps(payload)
+        )
+
+        assert load_compiled_schedule(output) is None
+
+    def test_command_rejects_invalid_schedule(self, schedule_json):
+        """잘못된 일정은 compile_schedule 명령에서 실패"""
+        import json
+
+        from django.core.management import CommandError, call_command
+
+        data = json.loads(schedule_json.read_text(encoding="utf-8"))
+        data["vaccinations"][0]["vaccine_type"] = "필수"
+        schedule_json.write_text(json.dumps(data), encoding="utf-8")
+
+        with pytest.raises(CommandError, match="vaccine_type"):
+            call_command("compile_schedule", source=str(schedule_json))
+        assert not schedule_json.with_suffix(".compiled").exists()
+
+    def test_command_writes_artifact(self, schedule_json):
+        """compile_schedule 명령이 컴파일 파일 생성"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command("compile_schedule", source=str(schedule_json), stdout=out)
+
+        assert schedule_json.with_suffix(".compiled").exists()
+        assert "2025" in out.getvalue()
+
+
+# ============================================
+# 예방접종 일정 생성 서비스 테스트
+# ============================================
+
+
+@pytest.mark.django_db
+class TestCreateVaccinationSchedules:
+    """일정 일괄 생성 테스트"""
+
+    def test_creates_schedules_without_notification_rows(self, child):
+        """계산기 일정과 같은 행이 생성되고 알림은 가상 알림으로 계산"""
+        from immunization_calculator import get_calculator
+        from vaccinations.models import VaccinationNotification, VaccinationSchedule
+        from vaccinations.services import create_vaccination_schedules
+
+        expected = list(get_calculator().iter_child_schedule(child.birth_date, "male"))
+
+        created = create_vaccination_schedules(child)
+
+        schedules = VaccinationSchedule.objects.filter(child=child).order_by("pk")
+        assert created == len(expected) == schedules.count()
+        assert [
+            (s.vaccine_id, s.dose_number, s.vaccination_date) for s in schedules
+        ] == [
+            (i.dose.vaccine_id, i.dose.dose_number, i.vaccination_date)
+            for i in expected
+        ]
+        assert not VaccinationNotification.objects.exists()
+
+    def test_query_count_does_not_scale_with_doses(
+        self, child, django_assert_max_num_queries
+    ):
+        """접종 차수가 많아도 일정 INSERT 쿼리는 1회"""
+        from vaccinations.services import create_vaccination_schedules
+
+        # SAVEPOINT/RELEASE, 통계 집계/upsert 포함
+        with django_assert_max_num_queries(5):
+            created = create_vaccination_schedules(child)
+
+        assert created > 30
+
+    def test_bulk_for_many_children(self, user):
+        """여러 아이를 한 번에 생성"""
+        from children.models import Child
+        from vaccinations.services import bulk_create_vaccination_schedules
+
+        children = [
+            Child.objects.create(
+                user=user, name=f"아이{i}", birth_date=date(2024, 1, i + 1), gender=g
+            )
+            for i, g in enumerate(["male", "female", "female"])
+        ]
+
+        created = bulk_create_vaccination_schedules(children)
+
+        # HPV(여아 전용 2회) 때문에 여아가 2개씩 더 많음
+        counts = [c.vaccination_schedules.count() for c in children]
+        assert counts[1] == counts[2] == counts[0] + 2
+        assert created == sum(counts)
+
+
+@pytest.mark.django_db
+class TestRegenerateSchedules:
+    """일정 재생성 서비스/명령 테스트"""
+
+    def test_regenerate_keeps_completion(self, child):
+        """재생성해도 같은 차수의 접종 완료 정보 유지"""
+        from vaccinations.models import VaccinationSchedule
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            sync_vaccination_schedules,
+        )
+
+        created = create_vaccination_schedules(child)
+        VaccinationSchedule.objects.filter(
+            child=child, vaccine_id=2, dose_number=1
+        ).update(is_completed=True, completed_date=date(2024, 1, 16))
+
+        assert sync_vaccination_schedules([child]).total == created
+
+        schedules = VaccinationSchedule.objects.filter(child=child)
+        assert schedules.count() == created
+        completed = schedules.get(is_completed=True)
+        assert (completed.vaccine_id, completed.dose_number) == (2, 1)
+        assert completed.completed_date == date(2024, 1, 16)
+
+    def test_sync_commits_per_child_group(self, user, monkeypatch):
+        """아이 SYNC_TRANSACTION_CHILDREN명마다 트랜잭션을 나누고 결과는 합산"""
+        from children.models import Child
+        from vaccinations import services
+
+        children = [
+            Child.objects.create(
+                user=user, name=f"아이{i}", birth_date=date(2024, 1, 1), gender="male"
+            )
+            for i in range(3)
+        ]
+        batches = []
+        original = services._sync_schedules_batch
+
+        def record(group, *args):
+            batches.append(len(group))
+            return original(group, *args)
+
+        monkeypatch.setattr(services, "SYNC_TRANSACTION_CHILDREN", 2)
+        monkeypatch.setattr(services, "_sync_schedules_batch", record)
+
+        result = services.sync_vaccination_schedules(children)
+
+        assert batches == [2, 1]
+        assert result.created == result.total > 0
+        assert result.total == services.VaccinationSchedule.objects.count()
+
+    def test_command_resumes_from_checkpoint(self, user, tmp_path):
+        """체크포인트 이후의 아이만 처리하고, 끝나면 체크포인트 삭제"""
+        import json
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from children.models import Child
+
+        children = [
+            Child.objects.create(
+                user=user, name=f"아이{i}", birth_date=date(2024, 1, 1), gender="male"
+            )
+            for i in range(3)
+        ]
+        checkpoint = tmp_path / "checkpoint.json"
+        checkpoint.write_text(json.dumps({"last_pk": children[0].pk}))
+
+        out = StringIO()
+        call_command(
+            "regenerate_schedules",
+            workers=0,
+            chunk_size=1,
+            checkpoint=str(checkpoint),
+            stdout=out,
+        )
+
+        assert children[0].vaccination_schedules.count() == 0
+        assert children[1].vaccination_schedules.count() > 0
+        assert children[2].vaccination_schedules.count() > 0
+        assert "아이 2명" in out.getvalue()
+        assert not checkpoint.exists()
+
+    def test_command_dry_run_writes_nothing(self, child, tmp_path):
+        """dry-run은 일정 수만 계산"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from vaccinations.models import VaccinationSchedule
+
+        out = StringIO()
+        call_command(
+            "regenerate_schedules",
+            workers=0,
+            dry_run=True,
+            checkpoint=str(tmp_path / "checkpoint.json"),
+            stdout=out,
+        )
+
+        assert VaccinationSchedule.objects.count() == 0
+        assert "[dry-run] 아이 1명" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestSyncVaccinationSchedules:
+    """차이 기반 일정 동기화(upsert) 테스트"""
+
+    def test_unchanged_child_is_noop(self, child, django_assert_max_num_queries):
+        """변경이 없으면 조회만 하고 쓰지 않음"""
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            sync_vaccination_schedules,
+        )
+
+        created = create_vaccination_schedules(child)
+
+        with django_assert_max_num_queries(3):  # SAVEPOINT + SELECT + RELEASE
+            result = sync_vaccination_schedules([child])
+
+        assert result == (0, 0, 0, created)
+
+    def test_birth_date_change_updates_in_place(self, child):
+        """출생일 변경 시 같은 행을 수정하고 완료 정보와 PK 유지"""
+        from vaccinations.models import VaccinationNotification, VaccinationSchedule
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            sync_vaccination_schedules,
+        )
+
+        created = create_vaccination_schedules(child)
+        hep_b = VaccinationSchedule.objects.get(
+            child=child, vaccine_id=2, dose_number=1
+        )
+        hep_b.is_completed = True
+        hep_b.completed_date = date(2024, 1, 15)
+        hep_b.save()
+        pks_before = set(
+            VaccinationSchedule.objects.filter(child=child).values_list("pk", flat=True)
+        )
+        schedules = list(VaccinationSchedule.objects.filter(child=child)[:2])
+        sent = VaccinationNotification.objects.create(
+            schedule=schedules[0],
+            notification_date=schedules[0].notification_date,
+            status="sent",
+        )
+        retry = VaccinationNotification.objects.create(
+            schedule=schedules[1],
+            notification_date=schedules[1].notification_date,
+            status="pending",
+            attempts=1,
+        )
+
+        child.birth_date = date(2024, 1, 20)
+        child.save()
+        result = sync_vaccination_schedules([child])
+
+        assert result.created == result.deleted == 0
+        assert result.updated == created
+        schedules = VaccinationSchedule.objects.filter(child=child)
+        assert set(schedules.values_list("pk", flat=True)) == pks_before
+        hep_b.refresh_from_db()
+        assert hep_b.vaccination_date == date(2024, 1, 20)
+        assert hep_b.is_completed is True
+        assert hep_b.completed_date == date(2024, 1, 15)
+
+        # 재시도 대기 알림만 새 알림일로 이동
+        retry.refresh_from_db()
+        assert retry.notification_date == retry.schedule.notification_date
+        sent_date = sent.notification_date
+        sent.refresh_from_db()
+        assert sent.notification_date == sent_date
+
+    def test_gender_change_inserts_and_deletes(self, child):
+        """성별 변경 시 HPV 차수만 추가/삭제"""
+        from vaccinations.models import VaccinationSchedule
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            sync_vaccination_schedules,
+        )
+
+        created = create_vaccination_schedules(child)
+
+        child.gender = "female"
+        child.save()
+        result = sync_vaccination_schedules([child])
+
+        assert (result.created, result.updated, result.deleted) == (2, 0, 0)
+        assert (
+            VaccinationSchedule.objects.filter(child=child, vaccine_id=13).count() == 2
+        )
+        assert child.vaccination_schedules.count() == created + 2
+
+        child.gender = "male"
+        child.save()
+        result = sync_vaccination_schedules([child])
+
+        assert (result.created, result.updated, result.deleted) == (0, 0, 2)
+        assert not VaccinationSchedule.objects.filter(child=child, vaccine_id=13)
+
+    def test_duplicate_dose_is_rejected(self, child):
+        """(아이, 백신, 차수) 유일성 제약"""
+        from django.db import IntegrityError
+
+        from vaccinations.models import VaccinationSchedule
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        existing = VaccinationSchedule.objects.filter(child=child).first()
+
+        with pytest.raises(IntegrityError):
+            existing.pk = None
+            existing.save()
+
+
+@pytest.mark.django_db
+class TestChildVaccinationStats:
+    """아이별 비정규화 통계 테스트"""
+
+    def assert_consistent(self, child, today=None):
+        from vaccinations.models import ChildVaccinationStats
+        from vaccinations.services import compute_child_stats
+
+        stats = ChildVaccinationStats.objects.get(child=child)
+        expected = compute_child_stats([child.pk], today)[child.pk]
+        assert {field: getattr(stats, field) for field in expected} == expected
+        return stats
+
+    def test_created_with_schedules(self, child):
+        """일정 생성과 함께 통계 행 생성"""
+        from vaccinations.services import create_vaccination_schedules
+
+        created = create_vaccination_schedules(child)
+
+        stats = self.assert_consistent(child)
+        assert stats.total == created
+        assert stats.as_of == timezone.localdate()
+
+    def test_complete_and_uncomplete(self, child):
+        """완료/완료 취소는 증감으로 반영"""
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            set_schedule_completed,
+        )
+
+        create_vaccination_schedules(child)
+        schedule = child.vaccination_schedules.filter(
+            vaccination_date__lt=timezone.localdate()
+        ).first()
+
+        set_schedule_completed(schedule, True, date(2024, 3, 1))
+        stats = self.assert_consistent(child)
+        assert stats.completed == 1
+
+        set_schedule_completed(schedule, False)
+        stats = self.assert_consistent(child)
+        assert stats.completed == 0
+        assert schedule.completed_date is None
+
+    def test_delete(self, child):
+        """일정 삭제 반영"""
+        from vaccinations.services import create_vaccination_schedules, delete_schedule
+
+        created = create_vaccination_schedules(child)
+        delete_schedule(child.vaccination_schedules.first())
+
+        assert self.assert_consistent(child).total == created - 1
+
+    def test_stale_row_is_recomputed_on_change(self, child):
+        """기준일이 지난 행은 증감 대신 다시 집계"""
+        from vaccinations.models import ChildVaccinationStats
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            set_schedule_completed,
+        )
+
+        create_vaccination_schedules(child)
+        ChildVaccinationStats.objects.filter(child=child).update(
+            as_of=timezone.localdate() - timedelta(days=1), overdue=0
+        )
+
+        set_schedule_completed(child.vaccination_schedules.first(), True)
+
+        stats = self.assert_consistent(child)
+        assert stats.as_of == timezone.localdate()
+
+    def test_rollover(self, child):
+        """rollover는 기준일이 지난 행만 다시 집계"""
+        from vaccinations.models import ChildVaccinationStats
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            rollover_child_stats,
+        )
+
+        create_vaccination_schedules(child)
+        assert rollover_child_stats() == 0
+
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        assert rollover_child_stats(today=tomorrow) == 1
+        assert ChildVaccinationStats.objects.get(child=child).as_of == tomorrow
+        self.assert_consistent(child, tomorrow)
+
+    def test_check_command_rebuilds(self, child):
+        """정합성 검사 명령은 불일치를 찾고 --rebuild로 복구"""
+        from io import StringIO
+
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+
+        from vaccinations.models import ChildVaccinationStats
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        ChildVaccinationStats.objects.filter(child=child).update(total=0)
+
+        with pytest.raises(CommandError):
+            call_command("check_vaccination_stats", stdout=StringIO())
+
+        call_command("check_vaccination_stats", "--rebuild", stdout=StringIO())
+        self.assert_consistent(child)
+
+        out = StringIO()
+        call_command("check_vaccination_stats", stdout=out)
+        assert "일치합니다" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestVaccinationAPI:
+    """예방접종 API 테스트"""
+
+    def test_stats_is_single_query(
+        self, authenticated_client, child, django_assert_num_queries
+    ):
+        """통계 API는 통계 테이블 조회 1회"""
+        from vaccinations.services import create_vaccination_schedules
+
+        created = create_vaccination_schedules(child)
+
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(
+                f"/api/vaccinations/stats/?child_id={child.pk}"
+            )
+
+        assert response.status_code == 200
+        assert response.data["total"] == created
+        assert set(response.data) == {
+            "total",
+            "completed",
+            "upcoming",
+            "overdue",
+            "completion_rate",
+        }
+
+    def test_upcoming_days_ahead_is_clamped(self, authenticated_client, child):
+        """days_ahead가 너무 크거나 음수여도 500 없이 범위 안으로"""
+        url = f"/api/vaccinations/upcoming/?child_id={child.pk}&days_ahead="
+
+        assert authenticated_client.get(url + "9999999").status_code == 200
+        assert authenticated_client.get(url + "-5").status_code == 200
+        assert authenticated_client.get(url + "abc").status_code == 400
+
+    def test_stats_of_other_users_child(self, authenticated_client, child):
+        """다른 사용자의 아이 통계는 404"""
+        from django.contrib.auth import get_user_model
+
+        from children.models import Child
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        other_child = Child.objects.create(
+            user=other, name="남의 아이", birth_date=date(2024, 1, 1), gender="male"
+        )
+
+        response = authenticated_client.get(
+            f"/api/vaccinations/stats/?child_id={other_child.pk}"
+        )
+        assert response.status_code == 404
+
+    def test_complete_updates_stats(self, authenticated_client, child):
+        """완료 처리 API가 통계에 반영"""
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        schedule = child.vaccination_schedules.first()
+
+        response = authenticated_client.post(
+            f"/api/vaccinations/schedules/{schedule.pk}/complete/",
+            {"completed_date": "2024-03-01"},
+            format="json",
+        )
+        assert response.status_code == 200
+        assert response.data["is_completed"] is True
+
+        response = authenticated_client.get(
+            f"/api/vaccinations/stats/?child_id={child.pk}"
+        )
+        assert response.data["completed"] == 1
+
+    def test_dashboard_query_count_is_constant(
+        self, authenticated_client, user, child, django_assert_num_queries
+    ):
+        """대시보드는 아이 수와 관계없이 쿼리 4회 (ETag 집계 + 조회 3회)"""
+        from children.models import Child
+        from vaccinations.services import create_vaccination_schedules
+
+        children = [child] + [
+            Child.objects.create(
+                user=user, name=f"아이{i}", birth_date=date(2025, 6, 1), gender="female"
+            )
+            for i in range(3)
+        ]
+        for each in children:
+            create_vaccination_schedules(each)
+
+        with django_assert_num_queries(4):
+            response = authenticated_client.get(
+                "/api/vaccinations/dashboard/?upcoming_limit=2"
+            )
+
+        assert response.status_code == 200
+        assert len(response.data["children"]) == len(children)
+        for item in response.data["children"]:
+            assert set(item) == {
+                "id",
+                "name",
+                "birth_date",
+                "gender",
+                "stats",
+                "upcoming",
+                "overdue",
+            }
+            assert len(item["upcoming"]) <= 2
+            assert len(item["overdue"]) == item["stats"]["overdue"]
+            dates = [row["vaccination_date"] for row in item["upcoming"]]
+            assert dates == sorted(dates)
+            assert all(row["is_overdue"] for row in item["overdue"])
+
+    def test_dashboard_refreshes_missing_stats(self, authenticated_client, child):
+        """통계 행이 없는 아이는 대시보드에서 다시 집계"""
+        from vaccinations.models import ChildVaccinationStats
+        from vaccinations.services import create_vaccination_schedules
+
+        created = create_vaccination_schedules(child)
+        ChildVaccinationStats.objects.all().delete()
+
+        response = authenticated_client.get("/api/vaccinations/dashboard/")
+
+        assert response.status_code == 200
+        assert response.data["children"][0]["stats"]["total"] == created
+        assert ChildVaccinationStats.objects.filter(pk=child.pk).exists()
+
+    def test_dashboard_only_own_children(self, authenticated_client, child):
+        """다른 사용자의 아이는 대시보드에 나오지 않음"""
+        from django.contrib.auth import get_user_model
+
+        from children.models import Child
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        Child.objects.create(
+            user=other, name="남의 아이", birth_date=date(2024, 1, 1), gender="male"
+        )
+
+        response = authenticated_client.get("/api/vaccinations/dashboard/")
+        assert [item["id"] for item in response.data["children"]] == [child.pk]
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """ETag / If-None-Match 테스트"""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/vaccinations/schedules/?child_id={child}",
+            "/api/vaccinations/stats/?child_id={child}",
+            "/api/vaccinations/dashboard/",
+        ],
+    )
+    def test_not_modified_with_matching_etag(
+        self, authenticated_client, child, schedules, url
+    ):
+        """같은 ETag로 다시 요청하면 본문 없는 304"""
+        url = url.format(child=child.pk)
+        response = authenticated_client.get(url)
+        assert response.status_code == 200
+        etag = response["ETag"]
+        assert etag.startswith('"')  # 강한 ETag
+        assert "private" in response["Cache-Control"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert not response.content
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/vaccinations/schedules/?child_id={child}",
+            "/api/vaccinations/stats/?child_id={child}",
+            "/api/vaccinations/dashboard/",
+        ],
+    )
+    def test_etag_changes_after_completion(
+        self, authenticated_client, child, schedules, url
+    ):
+        """일정 완료 처리 후에는 ETag가 바뀌어 200"""
+        url = url.format(child=child.pk)
+        etag = authenticated_client.get(url)["ETag"]
+
+        authenticated_client.post(
+            f"/api/vaccinations/schedules/{schedules.first().pk}/complete/"
+        )
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_schedule_etag_changes_after_delete(
+        self, authenticated_client, child, schedules
+    ):
+        """일정 삭제 후에는 ETag가 바뀜"""
+        url = f"/api/vaccinations/schedules/?child_id={child.pk}"
+        etag = authenticated_client.get(url)["ETag"]
+
+        authenticated_client.delete(
+            f"/api/vaccinations/schedules/{schedules.last().pk}/"
+        )
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_not_modified_skips_serialization(
+        self, authenticated_client, child, schedules, django_assert_num_queries
+    ):
+        """304 응답은 ETag 쿼리 1회만 실행 (응답 캐시 미스)"""
+        from django.core.cache import cache
+
+        url = f"/api/vaccinations/schedules/?child_id={child.pk}"
+        etag = authenticated_client.get(url)["ETag"]
+        cache.clear()
+
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+    def test_schedule_list_of_other_users_child(self, authenticated_client):
+        """다른 사용자의 아이 일정 목록은 404"""
+        from django.contrib.auth import get_user_model
+
+        from children.models import Child
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        other_child = Child.objects.create(
+            user=other, name="남의 아이", birth_date=date(2024, 1, 1), gender="male"
+        )
+
+        response = authenticated_client.get(
+            f"/api/vaccinations/schedules/?child_id={other_child.pk}"
+        )
+        assert response.status_code == 404
+
+
+@pytest.fixture
+def fake_sender():
+    """가짜 푸시 백엔드 (테스트마다 outbox 초기화)"""
+    from vaccinations.senders import FakePushSender
+
+    FakePushSender.reset()
+    yield FakePushSender()
+    FakePushSender.reset()
+
+
+@pytest.mark.django_db
+class TestNotificationDispatch:
+    """예방접종 알림 발송 테스트"""
+
+    # 2024-01-15생 기준 2개월 접종 알림일(2024-02-14)이 조회 범위에 들어오는 날
+    today = date(2024, 3, 1)
+
+    def due_schedule_ids(self, today=None):
+        from vaccinations.dispatch import due_virtual_schedules
+
+        return set(
+            due_virtual_schedules(today or self.today).values_list("id", flat=True)
+        )
+
+    def test_sends_only_due_notifications(self, child, fake_sender):
+        """알림일이 된 미완료 일정만 발송하고 sent 행으로 저장"""
+        from vaccinations.dispatch import (
+            NOTIFICATION_LOOKBACK_DAYS,
+            dispatch_due_notifications,
+        )
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        due = self.due_schedule_ids()
+        schedules = child.vaccination_schedules.all()
+        assert due == set(
+            schedules.filter(
+                notification_date__gte=self.today
+                - timedelta(days=NOTIFICATION_LOOKBACK_DAYS),
+                notification_date__lte=self.today,
+            ).values_list("id", flat=True)
+        )
+
+        result = dispatch_due_notifications(
+            sender=fake_sender, batch_size=2, concurrency=2, today=self.today
+        )
+
+        assert result.sent == result.claimed == len(due) > 0
+        assert result.failed == 0
+        stored = VaccinationNotification.objects.all()
+        assert set(stored.values_list("schedule_id", flat=True)) == due
+        assert all(n.status == "sent" and n.sent_at for n in stored)
+        assert {nid for m in fake_sender.outbox for nid in m.notification_ids} == set(
+            stored.values_list("id", flat=True)
+        )
+        assert self.due_schedule_ids() == set()
+
+    def test_completed_schedules_are_skipped(self, child, fake_sender):
+        """이미 접종한 일정은 알림을 보내지 않음"""
+        from vaccinations.dispatch import dispatch_due_notifications
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        child.vaccination_schedules.filter(id__in=self.due_schedule_ids()).update(
+            is_completed=True
+        )
+
+        result = dispatch_due_notifications(sender=fake_sender, today=self.today)
+        assert result.claimed == 0
+
+    def test_claimed_rows_are_not_claimed_again(self, child):
+        """이미 점유한 알림은 다른 dispatcher가 가져가지 않음"""
+        from vaccinations.dispatch import claim_notifications
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+
+        first = claim_notifications(limit=2, today=self.today, digest=False)
+        second = claim_notifications(limit=100, today=self.today, digest=False)
+
+        assert len(first) == 2
+        assert all(n.status == "sending" and n.pk for n in first)
+        assert not {n.schedule_id for n in first} & {n.schedule_id for n in second}
+
+    def test_failures_are_retried_then_given_up(self, child, fake_sender):
+        """실패는 pending 행으로 남아 재시도하고 MAX_SEND_ATTEMPTS번 후 failed"""
+        from vaccinations.dispatch import MAX_SEND_ATTEMPTS, dispatch_due_notifications
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        due = self.due_schedule_ids()
+        fake_sender.fail_user_ids.add(child.user_id)
+
+        result = dispatch_due_notifications(sender=fake_sender, today=self.today)
+        stored = VaccinationNotification.objects.all()
+        assert result.failed == len(due) == stored.count()
+        assert set(stored.values_list("status", flat=True)) == {"pending"}
+
+        for _ in range(MAX_SEND_ATTEMPTS - 1):
+            result = dispatch_due_notifications(sender=fake_sender, today=self.today)
+
+        assert result.given_up == len(due)
+        assert set(stored.values_list("status", flat=True)) == {"failed"}
+        assert not fake_sender.outbox
+
+    def test_unconfigured_sender_does_not_mark_sent(self, child):
+        """기본 발송 백엔드는 실패하므로 보내지 않은 알림이 sent가 되지 않음"""
+        from vaccinations.dispatch import dispatch_due_notifications
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.senders import UnconfiguredSender
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+
+        result = dispatch_due_notifications(
+            sender=UnconfiguredSender(), today=self.today
+        )
+
+        assert result.sent == 0
+        assert result.failed == result.claimed > 0
+        assert not VaccinationNotification.objects.filter(status="sent").exists()
+
+    def test_fake_outbox_is_bounded(self, fake_sender):
+        """가짜 백엔드 outbox는 최근 OUTBOX_MAXLEN건만 보관"""
+        from vaccinations.senders import PushMessage
+
+        for i in range(fake_sender.OUTBOX_MAXLEN + 5):
+            fake_sender.send(PushMessage(i, "제목", "내용", (i,)))
+
+        assert len(fake_sender.outbox) == fake_sender.OUTBOX_MAXLEN
+        assert fake_sender.outbox[0].user_id == 5
+
+    def test_release_stale_claims(self, child):
+        """오래 sending으로 남은 알림은 다시 대기 상태"""
+        from vaccinations.dispatch import claim_notifications, release_stale_claims
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        claimed = claim_notifications(limit=1, today=self.today, digest=False)
+
+        assert release_stale_claims(stale_after=timedelta(hours=1)) == 0
+        assert release_stale_claims(stale_after=timedelta(0)) == 1
+        claimed[0].refresh_from_db()
+        assert claimed[0].status == "pending"
+
+    def test_command_reports_metrics(self, user, fake_sender):
+        """발송 명령은 발송 수와 처리량을 출력"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from children.models import Child
+        from vaccinations.services import create_vaccination_schedules
+
+        # 오늘 기준으로 2개월 접종 알림일이 지난 아이
+        newborn = Child.objects.create(
+            user=user,
+            name="신생아",
+            birth_date=timezone.localdate() - timedelta(days=40),
+            gender="male",
+        )
+        create_vaccination_schedules(newborn)
+        out = StringIO()
+        call_command("dispatch_notifications", stdout=out)
+
+        assert "sent/s" in out.getvalue()
+        assert len(fake_sender.outbox) > 0
+
+
+@pytest.mark.django_db
+class TestNotificationDigest:
+    """같은 날 알림 묶음(digest) 발송 테스트"""
+
+    today = date(2024, 3, 1)
+
+    @pytest.fixture
+    def siblings(self, user, child):
+        """같은 날 태어난 형제 (알림일이 모두 겹침)"""
+        from children.models import Child
+        from vaccinations.services import bulk_create_vaccination_schedules
+
+        sibling = Child.objects.create(
+            user=user, name="홍길순", birth_date=child.birth_date, gender="female"
+        )
+        bulk_create_vaccination_schedules([child, sibling])
+        return child, sibling
+
+    def test_one_message_per_user_and_day(self, siblings, fake_sender):
+        """사용자/알림일별로 메시지 한 건, 형제 알림도 함께 묶음"""
+        from vaccinations.dispatch import (
+            dispatch_due_notifications,
+            due_virtual_schedules,
+        )
+
+        due = due_virtual_schedules(self.today)
+        count = due.count()
+        days = set(due.values_list("notification_date", flat=True))
+
+        # 배치를 작게 잡아도 같은 날 알림은 한 배치로 점유
+        result = dispatch_due_notifications(
+            sender=fake_sender, batch_size=1, today=self.today
+        )
+
+        assert result.sent == count
+        assert result.messages == len(days) < result.sent
+        assert len(fake_sender.outbox) == len(days)
+        message = fake_sender.outbox[0]
+        assert "홍길동:" in message.body and "홍길순:" in message.body
+
+    def test_no_digest(self, siblings, fake_sender):
+        """digest=False면 알림마다 메시지 한 건"""
+        from vaccinations.dispatch import dispatch_due_notifications
+
+        result = dispatch_due_notifications(
+            sender=fake_sender, today=self.today, digest=False
+        )
+
+        assert result.messages == result.sent == len(fake_sender.outbox) > 0
+
+    def _schedule(self, child, vaccine_id, notification_date):
+        from vaccinations.models import VaccinationSchedule
+
+        return VaccinationSchedule.objects.create(
+            child=child,
+            vaccine_id=vaccine_id,
+            vaccine_name="테스트",
+            disease="테스트",
+            dose_number=1,
+            age_description="0개월",
+            vaccination_date=notification_date + timedelta(days=7),
+            notification_date=notification_date,
+        )
+
+    def test_digest_claims_exact_user_and_day_pairs(self, child):
+        """다른 사용자의 알림일과 겹치는 내 알림은 함께 점유하지 않음"""
+        from django.contrib.auth import get_user_model
+
+        from children.models import Child
+        from vaccinations.dispatch import claim_notifications
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        other_child = Child.objects.create(
+            user=other, name="남의 아이", birth_date=child.birth_date, gender="male"
+        )
+        day1, day2 = date(2024, 2, 1), date(2024, 2, 2)
+        mine_day1 = self._schedule(child, 1, day1)
+        other_day2 = self._schedule(other_child, 1, day2)
+        mine_day2 = self._schedule(child, 2, day2)
+
+        claimed = claim_notifications(limit=2, today=self.today)
+
+        assert {n.schedule_id for n in claimed} == {mine_day1.pk, other_day2.pk}
+        assert mine_day2.pk not in {n.schedule_id for n in claimed}
+
+    def test_digest_expansion_is_capped(self, child, monkeypatch):
+        """같은 날 알림은 max(limit, DIGEST_EXPANSION_MIN)건까지만 더 점유"""
+        from vaccinations import dispatch
+
+        monkeypatch.setattr(dispatch, "DIGEST_EXPANSION_MIN", 2)
+        for vaccine_id in range(5):
+            self._schedule(child, vaccine_id, date(2024, 2, 1))
+
+        assert len(dispatch.claim_notifications(limit=1, today=self.today)) == 3
+
+    def test_failed_digest_marks_whole_group(self, siblings, fake_sender):
+        """묶음 발송이 실패하면 묶인 알림 모두 재시도 대상"""
+        from vaccinations.dispatch import dispatch_due_notifications
+        from vaccinations.models import VaccinationNotification
+
+        child, _ = siblings
+        fake_sender.fail_user_ids.add(child.user_id)
+
+        result = dispatch_due_notifications(sender=fake_sender, today=self.today)
+
+        stored = VaccinationNotification.objects.all()
+        assert result.failed == stored.count() > 0
+        assert set(stored.values_list("status", flat=True)) == {"pending"}
+
+
+@pytest.mark.django_db
+class TestVirtualNotifications:
+    """가상 알림 목록/읽음 처리 테스트"""
+
+    def test_list_merges_stored_and_virtual(self, authenticated_client, child):
+        """목록은 저장된 알림과 가상 알림을 합쳐 일정마다 한 건"""
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import create_vaccination_schedules
+
+        created = create_vaccination_schedules(child)
+        schedule = child.vaccination_schedules.first()
+        VaccinationNotification.objects.create(
+            schedule=schedule,
+            notification_date=schedule.notification_date,
+            status="sent",
+        )
+
+        response = authenticated_client.get("/api/vaccinations/notifications/")
+
+        assert response.status_code == 200
+        assert response.data["next"] is None
+        results = response.data["results"]
+        assert len(results) == created
+        stored = [n for n in results if n["id"] is not None]
+        assert [(n["status"], n["schedule"]["id"]) for n in stored] == [
+            ("sent", schedule.pk)
+        ]
+        dates = [n["notification_date"] for n in results]
+        assert dates == sorted(dates, reverse=True)
+
+        response = authenticated_client.get(
+            "/api/vaccinations/notifications/?status=sent"
+        )
+        assert len(response.data["results"]) == 1
+
+    def test_read_stores_virtual_notification(self, authenticated_client, child):
+        """가상 알림을 읽으면 read 행으로 저장"""
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        schedule = child.vaccination_schedules.first()
+
+        response = authenticated_client.post(
+            "/api/vaccinations/notifications/read/",
+            {"schedule_id": schedule.pk},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        notification = VaccinationNotification.objects.get(schedule=schedule)
+        assert notification.status == "read" and notification.read_at
+        assert response.data["id"] == notification.pk
+
+    def test_migration_reclaims_pending_rows(self, child):
+        """마이그레이션은 발송 전 대기 행만 지우고 일정당 한 행을 남김"""
+        import importlib
+
+        from django.apps import apps
+
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import create_vaccination_schedules
+
+        migration = importlib.import_module(
+            "vaccinations.migrations.0005_virtual_notifications"
+        )
+        create_vaccination_schedules(child)
+        schedules = list(child.vaccination_schedules.all()[:3])
+        VaccinationNotification.objects.bulk_create(
+            [
+                VaccinationNotification(
+                    schedule=s,
+                    notification_date=s.notification_date,
+                    status=status,
+                    attempts=attempts,
+                )
+                for s, status, attempts in zip(
+                    schedules, ["pending", "pending", "sent"], [0, 1, 1]
+                )
+            ]
+        )
+
+        migration.reclaim_pending_notifications(apps, None)
+
+        assert set(
+            VaccinationNotification.objects.values_list("schedule_id", "status")
+        ) == {(schedules[1].pk, "pending"), (schedules[2].pk, "sent")}
+
+
+@pytest.mark.django_db
+class TestBulkNotificationActions:
+    """알림 일괄 읽음/발송됨 처리 테스트"""
+
+    @pytest.fixture
+    def stored(self, child):
+        """발송된 알림 3건 (나머지 일정은 가상 알림)"""
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        return VaccinationNotification.objects.bulk_create(
+            [
+                VaccinationNotification(
+                    schedule=s, notification_date=s.notification_date, status="sent"
+                )
+                for s in child.vaccination_schedules.order_by("notification_date")[:3]
+            ]
+        )
+
+    def test_mark_read_by_ids_is_one_update(
+        self, authenticated_client, stored, django_assert_max_num_queries
+    ):
+        """ids로 읽음 처리는 UPDATE 한 번"""
+        from vaccinations.models import VaccinationNotification
+
+        ids = [n.pk for n in stored]
+        with django_assert_max_num_queries(3):  # SAVEPOINT + UPDATE + RELEASE
+            response = authenticated_client.post(
+                "/api/vaccinations/notifications/mark-read/",
+                {"ids": ids},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert response.data == {"updated": 3}
+        assert set(
+            VaccinationNotification.objects.values_list("status", flat=True)
+        ) == {"read"}
+
+        # 이미 읽은 알림은 다시 세지 않음
+        response = authenticated_client.post(
+            "/api/vaccinations/notifications/mark-read/", {"ids": ids}, format="json"
+        )
+        assert response.data == {"updated": 0}
+
+    def test_mark_read_before_includes_virtual(
+        self, authenticated_client, child, stored
+    ):
+        """before 조건은 가상 알림까지 읽음 행으로 저장"""
+        from vaccinations.models import VaccinationNotification
+
+        before = date(2024, 6, 30)
+        expected = child.vaccination_schedules.filter(
+            notification_date__lte=before
+        ).count()
+
+        response = authenticated_client.post(
+            "/api/vaccinations/notifications/mark-read/",
+            {"before": before.isoformat()},
+            format="json",
+        )
+
+        assert response.data == {"updated": expected}
+        read = VaccinationNotification.objects.filter(status="read")
+        assert read.count() == expected
+        assert all(n.read_at for n in read)
+
+    def test_rows_stored_concurrently_are_not_counted(self, child, stored, monkeypatch):
+        """조회 후 다른 요청이 먼저 저장한 알림은 INSERT가 건너뛰므로 세지 않음"""
+        from vaccinations import services
+
+        VaccinationNotification = services.VaccinationNotification
+        VaccinationNotification.objects.filter(pk=stored[0].pk).update(status="read")
+        # 가상 알림 조회 이후에 stored[0]이 저장된 상황
+        monkeypatch.setattr(
+            services, "unstored_notification_schedules", lambda queryset: queryset
+        )
+        schedule_ids = [
+            stored[0].schedule_id,
+            *child.vaccination_schedules.exclude(
+                pk__in=[n.schedule_id for n in stored]
+            ).values_list("pk", flat=True)[:2],
+        ]
+
+        changed = services.bulk_mark_notifications(
+            child.user, "read", schedule_ids=schedule_ids
+        )
+
+        assert changed == 2
+        assert VaccinationNotification.objects.filter(status="read").count() == 3
+
+    def test_mark_sent_does_not_downgrade_read(self, authenticated_client, stored):
+        """읽은 알림은 발송됨으로 되돌리지 않음"""
+        from vaccinations.models import VaccinationNotification
+
+        VaccinationNotification.objects.filter(pk=stored[0].pk).update(status="read")
+        VaccinationNotification.objects.filter(pk=stored[1].pk).update(status="failed")
+
+        response = authenticated_client.post(
+            "/api/vaccinations/notifications/mark-sent/",
+            {"ids": [n.pk for n in stored]},
+            format="json",
+        )
+
+        assert response.data == {"updated": 1}
+        assert VaccinationNotification.objects.get(pk=stored[0].pk).status == "read"
+
+    def test_other_users_notifications_are_untouched(self, api_client, stored):
+        """다른 사용자의 알림은 바뀌지 않음"""
+        from django.contrib.auth import get_user_model
+
+        from vaccinations.models import VaccinationNotification
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        api_client.force_authenticate(user=other)
+
+        response = api_client.post(
+            "/api/vaccinations/notifications/mark-read/",
+            {"ids": [n.pk for n in stored], "before": "2030-01-01"},
+            format="json",
+        )
+
+        assert response.data == {"updated": 0}
+        assert not VaccinationNotification.objects.filter(status="read").exists()
+
+    def test_requires_a_selector(self, authenticated_client):
+        """조건이 없으면 400"""
+        response = authenticated_client.post(
+            "/api/vaccinations/notifications/mark-read/", {}, format="json"
+        )
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestArchiveNotifications:
+    """알림 보관 테스트"""
+
+    @pytest.fixture
+    def notifications(self, child):
+        """오래된 발송/읽음/실패 알림과 최근 발송 알림"""
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        schedules = list(child.vaccination_schedules.order_by("notification_date"))
+        statuses = ["sent", "read", "failed", "sent"]
+        dates = [date(2023, 1, 1)] * 3 + [date(2024, 12, 1)]
+        return VaccinationNotification.objects.bulk_create(
+            [
+                VaccinationNotification(
+                    schedule=s, notification_date=d, status=st, attempts=1
+                )
+                for s, st, d in zip(schedules, statuses, dates)
+            ]
+        )
+
+    def test_moves_only_old_sent_and_read(self, notifications):
+        """보존 기간이 지난 발송/읽음 알림만 보관 테이블로 이동"""
+        from vaccinations.archive import archive_notifications
+        from vaccinations.models import (
+            VaccinationNotification,
+            VaccinationNotificationArchive,
+        )
+
+        result = archive_notifications(
+            retention_days=180, batch_size=1, today=date(2025, 1, 1)
+        )
+
+        assert (result.moved, result.batches) == (2, 2)
+        assert set(
+            VaccinationNotificationArchive.objects.values_list("id", "status")
+        ) == {
+            (notifications[0].pk, "sent"),
+            (notifications[1].pk, "read"),
+        }
+        assert set(VaccinationNotification.objects.values_list("id", flat=True)) == {
+            notifications[2].pk,
+            notifications[3].pk,
+        }
+
+        # 다시 실행하면 옮길 행이 없음
+        assert (
+            archive_notifications(retention_days=180, today=date(2025, 1, 1)).moved == 0
+        )
+
+    def test_archived_schedules_are_not_virtual_again(self, child, notifications):
+        """보관된 알림의 일정은 가상 알림으로 다시 나타나지 않음"""
+        from vaccinations.archive import archive_notifications
+        from vaccinations.services import list_notifications
+
+        before = len(list_notifications(child.user))
+        archive_notifications(retention_days=180, today=date(2025, 1, 1))
+
+        listed = list_notifications(child.user)
+        assert len(listed) == before - 2
+        assert {n.schedule_id for n in listed}.isdisjoint(
+            {notifications[0].schedule_id, notifications[1].schedule_id}
+        )
+
+    def test_command_reports_throughput(self, notifications):
+        """보관 명령은 이동 건수와 처리량을 출력"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command(
+            "archive_notifications",
+            "--older-than",
+            str((timezone.localdate() - date(2024, 1, 1)).days),
+            stdout=out,
+        )
+
+        assert "알림 2건 보관" in out.getvalue()
+        assert "rows/s" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestDeltaSync:
+    """델타 동기화 테스트"""
+
+    URL = "/api/vaccinations/sync/"
+
+    def test_without_cursor_returns_everything(
+        self, authenticated_client, child, schedules
+    ):
+        """cursor 없이 요청하면 전체 목록과 reset"""
+        response = authenticated_client.get(self.URL)
+
+        assert response.status_code == 200
+        assert response.data["reset"] is True
+        assert len(response.data["schedules"]) == schedules.count()
+        assert response.data["cursor"]
+
+    def test_unchanged_since_cursor_is_empty(
+        self, authenticated_client, child, schedules
+    ):
+        """변경이 없으면 빈 변경분 (겹쳐 조회하는 구간 밖)"""
+        from django.utils import timezone
+
+        schedules.update(updated_at=timezone.now() - timedelta(hours=1))
+        cursor = authenticated_client.get(self.URL).data["cursor"]
+
+        response = authenticated_client.get(self.URL, {"since": cursor})
+
+        assert response.data["reset"] is False
+        assert response.data["schedules"] == []
+        assert response.data["notifications"] == []
+        assert response.data["deleted"] == {"schedules": [], "notifications": []}
+
+    def test_returns_changed_and_deleted_rows(
+        self, authenticated_client, child, schedules
+    ):
+        """cursor 이후 수정/읽음/삭제된 행만 반환"""
+        from django.utils import timezone
+
+        first, second, last = schedules[0], schedules[1], schedules.last()
+        # 기존 일정은 한 시간 전에 받아 간 것으로 둠
+        now = timezone.now()
+        schedules.update(updated_at=now - timedelta(hours=1))
+        cursor = (now - timedelta(minutes=30)).isoformat()
+
+        authenticated_client.post(f"/api/vaccinations/schedules/{first.pk}/complete/")
+        authenticated_client.post(
+            "/api/vaccinations/notifications/read/",
+            {"schedule_id": second.pk},
+            format="json",
+        )
+        authenticated_client.delete(f"/api/vaccinations/schedules/{last.pk}/")
+
+        response = authenticated_client.get(self.URL, {"since": cursor})
+
+        assert response.data["reset"] is False
+        assert [row["id"] for row in response.data["schedules"]] == [first.pk]
+        assert [
+            (row["schedule"], row["status"]) for row in response.data["notifications"]
+        ] == [(second.pk, "read")]
+        assert response.data["deleted"]["schedules"] == [last.pk]
+
+    def test_resync_deletes_record_notification_tombstones(self, child, schedules):
+        """일정 재생성으로 지워진 일정과 알림도 삭제 기록을 남김"""
+        from vaccinations.models import SyncTombstone, VaccinationNotification
+        from vaccinations.services import sync_vaccination_schedules
+
+        removed = schedules.last()
+        notification = VaccinationNotification.objects.create(
+            schedule=removed, notification_date=removed.notification_date
+        )
+        # 일정표에 없는 일정으로 바꿔 재동기화에서 지워지게 함
+        removed.vaccine_id = 9999
+        removed.save()
+
+        sync_vaccination_schedules([child])
+
+        assert set(SyncTombstone.objects.values_list("kind", "object_id")) == {
+            ("schedule", removed.pk),
+            ("notification", notification.pk),
+        }
+
+    def test_archived_notifications_are_deleted(
+        self, authenticated_client, child, schedules
+    ):
+        """보관한 알림은 지우되 그 일정으로 가상 알림을 다시 만들지 않게 알림"""
+        from vaccinations.archive import archive_notifications
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import list_notifications
+
+        schedule = schedules.first()
+        notification = VaccinationNotification.objects.create(
+            schedule=schedule,
+            notification_date=date(2023, 1, 1),
+            status="sent",
+        )
+        cursor = authenticated_client.get(self.URL).data["cursor"]
+
+        archive_notifications(retention_days=180, today=date(2025, 1, 1))
+
+        delta = authenticated_client.get(self.URL, {"since": cursor}).data
+        assert delta["deleted"]["notifications"] == [notification.pk]
+        assert delta["archived_schedules"] == [schedule.pk]
+
+        # 전체 동기화 후 앱이 계산하는 대기 알림 == 서버 알림 목록의 대기 알림
+        full = authenticated_client.get(self.URL).data
+        stored = {n["schedule"] for n in full["notifications"]}
+        app_pending = (
+            {s["id"] for s in full["schedules"] if not s["is_completed"]}
+            - stored
+            - set(full["archived_schedules"])
+        )
+        assert schedule.pk not in app_pending
+        assert app_pending == {
+            n.schedule_id for n in list_notifications(child.user) if n.pk is None
+        }
+
+    def test_old_cursor_resets(self, authenticated_client, child, schedules):
+        """삭제 기록 보존 기간보다 오래된 cursor는 전체 동기화"""
+        from vaccinations.sync import tombstone_cutoff
+
+        cursor = (tombstone_cutoff() - timedelta(days=1)).isoformat()
+        response = authenticated_client.get(self.URL, {"since": cursor})
+
+        assert response.data["reset"] is True
+        assert len(response.data["schedules"]) == schedules.count()
+
+    def test_invalid_cursor(self, authenticated_client):
+        """형식이 잘못된 cursor는 400"""
+        response = authenticated_client.get(self.URL, {"since": "어제"})
+        assert response.status_code == 400
+
+    def test_only_own_rows(self, authenticated_client, user, schedules):
+        """다른 사용자의 일정은 포함하지 않음"""
+        from django.contrib.auth import get_user_model
+
+        from children.models import Child
+        from vaccinations.services import create_vaccination_schedules
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        create_vaccination_schedules(
+            Child.objects.create(
+                user=other, name="남의 아이", birth_date=date(2024, 1, 1), gender="male"
+            )
+        )
+
+        response = authenticated_client.get(self.URL)
+        assert {row["child"] for row in response.data["schedules"]} == {
+            schedules.first().child_id
+        }
+
+    def test_prune_tombstones(self, child):
+        """보존 기간이 지난 삭제 기록만 정리"""
+        from vaccinations.models import SyncTombstone
+        from vaccinations.sync import prune_tombstones, tombstone_cutoff
+
+        old = SyncTombstone.objects.create(
+            user=child.user, kind="schedule", object_id=1
+        )
+        recent = SyncTombstone.objects.create(
+            user=child.user, kind="schedule", object_id=2
+        )
+        SyncTombstone.objects.filter(pk=old.pk).update(
+            deleted_at=tombstone_cutoff() - timedelta(days=1)
+        )
+
+        assert prune_tombstones(batch_size=1) == 1
+        assert list(SyncTombstone.objects.values_list("pk", flat=True)) == [recent.pk]
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """keyset 페이지네이션 테스트"""
+
+    def _walk(self, client, url):
+        """next 링크를 따라가며 모든 페이지의 결과 수집"""
+        pages = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            pages.append(response.data["results"])
+            url = response.data["next"]
+        return pages
+
+    def test_schedule_list_is_unpaginated_by_default(
+        self, authenticated_client, child, schedules
+    ):
+        """cursor/page_size 없이 요청하면 기존처럼 전체 배열"""
+        response = authenticated_client.get(
+            f"/api/vaccinations/schedules/?child_id={child.pk}"
+        )
+        assert isinstance(response.data, list)
+        assert len(response.data) == schedules.count()
+
+    def test_schedule_pages_cover_every_row_once(
+        self, authenticated_client, child, schedules
+    ):
+        """같은 접종일이 많아도 id로 이어져 빠짐/중복 없이 순회"""
+        pages = self._walk(
+            authenticated_client,
+            f"/api/vaccinations/schedules/?child_id={child.pk}&page_size=4",
+        )
+
+        assert all(len(page) <= 4 for page in pages)
+        ids = [row["id"] for page in pages for row in page]
+        assert ids == list(schedules.values_list("id", flat=True))
+
+    def test_notification_pages_merge_stored_and_virtual(
+        self, authenticated_client, child, schedules
+    ):
+        """저장된 알림과 가상 알림을 합친 순서 그대로 페이지로 나눔"""
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import list_notifications
+
+        for schedule in schedules[::3]:
+            VaccinationNotification.objects.create(
+                schedule=schedule,
+                notification_date=schedule.notification_date,
+                status="sent",
+            )
+
+        pages = self._walk(
+            authenticated_client, "/api/vaccinations/notifications/?page_size=5"
+        )
+
+        keys = [(row["id"], row["schedule"]["id"]) for page in pages for row in page]
+        assert keys == [(n.pk, n.schedule_id) for n in list_notifications(child.user)]
+
+    def test_page_query_count_is_constant(
+        self, authenticated_client, child, schedules, django_assert_num_queries
+    ):
+        """깊은 페이지도 COUNT 없이 같은 쿼리 수"""
+        url = "/api/vaccinations/notifications/?page_size=3"
+        first = authenticated_client.get(url).data
+        deep = self._walk(authenticated_client, url)
+        assert len(deep) > 3
+
+        next_url = authenticated_client.get(first["next"]).data["next"]
+        with django_assert_num_queries(2):  # 저장된 알림 + 가상 알림
+            authenticated_client.get(next_url)
+
+    def test_invalid_cursor(self, authenticated_client):
+        """잘못된 cursor는 404"""
+        response = authenticated_client.get(
+            "/api/vaccinations/notifications/?cursor=broken"
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize(
+        "position",
+        [
+            ["abc", 1],
+            [{"a": 1}, 1],
+            ["2024-01-01", "1"],
+            ["2024-01-01", True],
+            [None, None],
+            {"a": 1},
+        ],
+    )
+    def test_tampered_cursor_values(self, authenticated_client, child, position):
+        """형식은 맞지만 값 타입이 틀린 cursor도 500이 아니라 404"""
+        from vaccinations.pagination import encode_position
+
+        cursor = encode_position(position)
+        for url in [
+            f"/api/vaccinations/schedules/?child_id={child.pk}&cursor={cursor}",
+            f"/api/vaccinations/notifications/?cursor={cursor}",
+        ]:
+            assert authenticated_client.get(url).status_code == 404
+
+    def test_keyset_filter(self):
+        """정렬 방향에 맞는 keyset 조건"""
+        from vaccinations.pagination import keyset_filter
+
+        condition = keyset_filter(("-notification_date", "-schedule_id"), ["d", 7])
+        assert str(condition) == (
+            "(OR: ('notification_date__lt', 'd'), "
+            "(AND: ('notification_date', 'd'), ('schedule_id__lt', 7)))"
+        )
+
+
+@pytest.mark.django_db
+class TestScheduleReadPath:
+    """일정 목록 읽기 전용 직렬화 테스트"""
+
+    def test_matches_model_serializer(self, child):
+        """serialize_schedules 결과가 ModelSerializer와 같음"""
+        from vaccinations.serializers import (
+            VaccinationScheduleSerializer,
+            serialize_schedules,
+        )
+        from vaccinations.services import (
+            create_vaccination_schedules,
+            set_schedule_completed,
+        )
+
+        create_vaccination_schedules(child)
+        set_schedule_completed(
+            child.vaccination_schedules.first(), True, date(2024, 1, 15)
+        )
+        queryset = child.vaccination_schedules.all()
+
+        fast = serialize_schedules(queryset)
+        expected = VaccinationScheduleSerializer(queryset, many=True).data
+
+        assert fast == [dict(row) for row in expected]
+        assert any(row["is_overdue"] for row in fast)
+        assert any(row["is_completed"] for row in fast)
+
+    @pytest.mark.parametrize(
+        "offset, overdue, upcoming",
+        [(-1, True, False), (0, False, True), (30, False, True), (31, False, False)],
+    )
+    def test_flags_match_properties(self, child, offset, overdue, upcoming):
+        """SQL로 계산한 is_overdue/is_upcoming 경계가 모델 프로퍼티와 같음"""
+        from vaccinations.models import VaccinationSchedule
+        from vaccinations.serializers import serialize_schedules
+
+        today = timezone.localdate()
+        schedule = VaccinationSchedule.objects.create(
+            child=child,
+            vaccine_id=1,
+            vaccine_name="BCG",
+            disease="결핵",
+            dose_number=1,
+            age_description="0개월",
+            vaccination_date=today + timedelta(days=offset),
+            notification_date=today,
+        )
+
+        (row,) = serialize_schedules(VaccinationSchedule.objects.all())
+        assert (row["is_overdue"], row["is_upcoming"]) == (overdue, upcoming)
+        assert (schedule.is_overdue, schedule.is_upcoming) == (overdue, upcoming)
+
+    def test_benchmark_command(self):
+        """벤치마크 명령은 측정 데이터를 남기지 않음"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from vaccinations.models import VaccinationSchedule
+
+        out = StringIO()
+        call_command("benchmark_schedule_serialization", rows=100, repeat=1, stdout=out)
+
+        assert "배 빠름" in out.getvalue()
+        assert not VaccinationSchedule.objects.exists()
+
+
+@pytest.mark.django_db
+class TestScheduleStatus:
+    """저장된 일정 상태 (status) 테스트"""
+
+    def _schedule(self, child, days, **kwargs):
+        from vaccinations.models import VaccinationSchedule
+
+        vaccination_date = timezone.localdate() + timedelta(days=days)
+        return VaccinationSchedule.objects.create(
+            child=child,
+            vaccine_id=days + 1000,
+            vaccine_name="BCG",
+            disease="결핵",
+            dose_number=1,
+            age_description="0개월",
+            vaccination_date=vaccination_date,
+            notification_date=vaccination_date,
+            **kwargs,
+        )
+
+    @pytest.mark.parametrize(
+        "days, status",
+        [(-1, "overdue"), (0, "due_soon"), (30, "due_soon"), (31, "scheduled")],
+    )
+    def test_status_on_save(self, child, days, status):
+        """저장 시 접종 예정일 기준으로 상태 계산"""
+        assert self._schedule(child, days).status == status
+
+    def test_today_is_local_date(self):
+        """상태와 보관 기준일 모두 TIME_ZONE(서울) 날짜를 오늘로 사용"""
+        from unittest import mock
+
+        from vaccinations.archive import archive_cutoff
+        from vaccinations.models import schedule_status
+
+        # UTC로는 3월 1일, 서울로는 3월 2일 01시
+        now = datetime(2024, 3, 1, 16, 0, tzinfo=dt_timezone.utc)
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            assert timezone.localdate() == date(2024, 3, 2)
+            assert schedule_status(date(2024, 3, 1), False) == "overdue"
+            assert archive_cutoff(retention_days=0) == date(2024, 3, 2)
+
+    def test_bulk_created_schedules_have_status(self, child):
+        """bulk_create로 만든 일정도 상태가 채워짐"""
+        from vaccinations.models import schedule_status
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+
+        for schedule in child.vaccination_schedules.all():
+            assert schedule.status == schedule_status(
+                schedule.vaccination_date, schedule.is_completed
+            )
+
+    def test_completion_updates_status(self, child):
+        """완료/완료 취소가 상태에 반영"""
+        from vaccinations.services import set_schedule_completed
+
+        schedule = self._schedule(child, -10)
+        set_schedule_completed(schedule, True)
+        schedule.refresh_from_db()
+        assert schedule.status == "completed"
+
+        set_schedule_completed(schedule, False)
+        schedule.refresh_from_db()
+        assert schedule.status == "overdue"
+
+    def test_rollover_advances_statuses(self, child):
+        """날짜가 지나면 rollover가 예정 → 임박 → 지연으로 전환"""
+        from vaccinations.services import rollover_schedule_statuses
+
+        due_soon = self._schedule(child, 0)
+        scheduled = self._schedule(child, 40)
+        completed = self._schedule(child, -5, is_completed=True)
+
+        changed = rollover_schedule_statuses(timezone.localdate() + timedelta(days=20))
+
+        assert changed == {"overdue": 1, "due_soon": 1}
+        for schedule, status in [
+            (due_soon, "overdue"),
+            (scheduled, "due_soon"),
+            (completed, "completed"),
+        ]:
+            schedule.refresh_from_db()
+            assert schedule.status == status
+
+        # 같은 날 다시 실행하면 전환할 행 없음
+        assert rollover_schedule_statuses(
+            timezone.localdate() + timedelta(days=20)
+        ) == {
+            "overdue": 0,
+            "due_soon": 0,
+        }
+
+    def test_rollover_runs_in_batches(self, child):
+        """batch_size건씩 나눠 UPDATE하고 모든 행을 전환"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from vaccinations.models import VaccinationSchedule
+        from vaccinations.services import rollover_schedule_statuses
+
+        for days in range(5):
+            self._schedule(child, days)
+
+        with CaptureQueriesContext(connection) as queries:
+            changed = rollover_schedule_statuses(
+                timezone.localdate() + timedelta(days=10), batch_size=2
+            )
+
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        assert changed == {"overdue": 5, "due_soon": 0}
+        assert len(updates) == 3
+        assert set(VaccinationSchedule.objects.values_list("status", flat=True)) == {
+            "overdue"
+        }
+
+    def test_overdue_query_before_rollover(self, child):
+        """rollover 전이어도 지연 일정 조회는 정확"""
+        from vaccinations.models import VaccinationSchedule
+        from vaccinations.services import overdue_q
+
+        stale = self._schedule(child, 3)  # 저장 당시 임박
+        already = self._schedule(child, -3)
+
+        later = timezone.localdate() + timedelta(days=5)
+        overdue = VaccinationSchedule.objects.filter(overdue_q(later))
+        assert set(overdue) == {stale, already}
+
+    def test_command(self, child):
+        """rollover 명령 출력"""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        self._schedule(child, 5)
+        out = StringIO()
+        call_command("rollover_schedule_statuses", stdout=out)
+        assert "지연 0건, 임박 0건" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestSparseFields:
+    """?fields= 희소 필드셋과 compact 알림 목록 테스트"""
+
+    @pytest.fixture
+    def schedules(self, schedules):
+        """첫 일정은 발송된 알림이 저장된 상태"""
+        from vaccinations.models import VaccinationNotification
+
+        first = schedules.first()
+        VaccinationNotification.objects.create(
+            schedule=first, notification_date=first.notification_date, status="sent"
+        )
+        return schedules
+
+    FIELDS = "vaccine_name,dose_number,vaccination_date,is_overdue"
+
+    def test_schedule_list_fields(self, authenticated_client, child, schedules):
+        """일정 목록은 요청한 필드(+id)만"""
+        response = authenticated_client.get(
+            f"/api/vaccinations/schedules/?child_id={child.pk}&fields={self.FIELDS}"
+        )
+
+        assert response.status_code == 200
+        assert len(response.data) == schedules.count()
+        assert set(response.data[0]) == {
+            "id",
+            "vaccine_name",
+            "dose_number",
+            "vaccination_date",
+            "is_overdue",
+        }
+
+    def test_paginated_schedule_list_fields(
+        self, authenticated_client, child, schedules
+    ):
+        """페이지 조회도 정렬 키를 요청하지 않으면 표현에서 빠짐"""
+        url = (
+            f"/api/vaccinations/schedules/?child_id={child.pk}"
+            "&fields=vaccine_name&page_size=5"
+        )
+        first = authenticated_client.get(url).data
+        assert all(set(row) == {"id", "vaccine_name"} for row in first["results"])
+
+        second = authenticated_client.get(first["next"]).data
+        ids = [row["id"] for row in first["results"] + second["results"]]
+        assert ids == list(schedules.values_list("id", flat=True)[:10])
+
+    def test_unknown_field(self, authenticated_client, child, schedules):
+        """없는 필드는 400"""
+        response = authenticated_client.get(
+            f"/api/vaccinations/schedules/?child_id={child.pk}&fields=password"
+        )
+        assert response.status_code == 400
+
+    def test_notification_fields_narrow_select(
+        self, authenticated_client, schedules, django_assert_num_queries
+    ):
+        """알림 목록의 중첩 일정도 요청한 필드만, 지연 로딩 없이"""
+        with django_assert_num_queries(2):  # 저장된 알림 + 가상 알림
+            response = authenticated_client.get(
+                f"/api/vaccinations/notifications/?fields={self.FIELDS}"
+            )
+
+        nested = response.data["results"][0]["schedule"]
+        assert set(nested) == {
+            "id",
+            "vaccine_name",
+            "dose_number",
+            "vaccination_date",
+            "is_overdue",
+        }
+
+    def test_compact_notifications(
+        self, authenticated_client, schedules, django_assert_num_queries
+    ):
+        """compact 목록은 일정 ID와 일정 사전"""
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(
+                f"/api/vaccinations/notifications/?compact=1&fields={self.FIELDS}"
+            )
+
+        results = response.data["results"]
+        assert len(results) == schedules.count()
+        assert all(isinstance(row["schedule"], int) for row in results)
+        assert set(response.data["schedules"]) == {row["schedule"] for row in results}
+        sent = next(row for row in results if row["status"] == "sent")
+        assert response.data["schedules"][sent["schedule"]]["vaccine_name"] == (
+            schedules.first().vaccine_name
+        )
+
+    def test_compact_payload_is_smaller(self, authenticated_client, schedules):
+        """compact + fields 응답이 기본 응답보다 작음"""
+        full = authenticated_client.get("/api/vaccinations/notifications/")
+        compact = authenticated_client.get(
+            f"/api/vaccinations/notifications/?compact=1&fields={self.FIELDS}"
+        )
+        assert len(compact.content) < len(full.content) / 2
+
+
+@pytest.mark.django_db
+class TestBulkComplete:
+    """일정 일괄 완료 테스트"""
+
+    URL = "/api/vaccinations/schedules/complete-bulk/"
+
+    @pytest.fixture
+    def visit(self, child):
+        """같은 날 맞는 접종이 가장 많은 방문"""
+        from django.db.models import Count
+
+        from vaccinations.services import create_vaccination_schedules
+
+        create_vaccination_schedules(child)
+        visit_date = (
+            child.vaccination_schedules.values("vaccination_date")
+            .annotate(doses=Count("id"))
+            .order_by("-doses", "vaccination_date")[0]["vaccination_date"]
+        )
+        schedules = child.vaccination_schedules.filter(vaccination_date=visit_date)
+        assert schedules.count() > 1
+        return schedules
+
+    def test_complete_by_ids(
+        self, authenticated_client, child, visit, django_assert_max_num_queries
+    ):
+        """ids로 여러 일정을 완료하고 통계는 한 번만 재집계"""
+        from vaccinations.models import ChildVaccinationStats
+
+        ids = list(visit.values_list("id", flat=True))
+        # 소유 확인 + UPDATE + 통계(집계/upsert) + 응답 조회 + 트랜잭션
+        with django_assert_max_num_queries(7):
+            response = authenticated_client.post(
+                self.URL, {"ids": ids, "completed_date": "2024-03-15"}, format="json"
+            )
+
+        assert response.status_code == 200
+        assert response.data["updated"] == len(ids)
+        assert {row["id"] for row in response.data["schedules"]} == set(ids)
+        assert all(row["status"] == "completed" for row in response.data["schedules"])
+        assert set(visit.values_list("completed_date", flat=True)) == {
+            date(2024, 3, 15)
+        }
+        assert ChildVaccinationStats.objects.get(pk=child.pk).completed == len(ids)
+
+    def test_complete_by_child_and_date(self, authenticated_client, child, visit):
+        """child_id + vaccination_date로 그날 일정 전체 완료"""
+        response = authenticated_client.post(
+            self.URL,
+            {
+                "child_id": child.pk,
+                "vaccination_date": visit.first().vaccination_date.isoformat(),
+            },
+            format="json",
+        )
+
+        assert response.data["updated"] == visit.count()
+        assert all(visit.values_list("is_completed", flat=True))
+        assert not child.vaccination_schedules.exclude(
+            pk__in=visit.values("pk")
+        ).filter(is_completed=True)
+
+    def test_other_users_schedule_rejects_whole_request(
+        self, authenticated_client, child, visit
+    ):
+        """다른 사용자의 일정이 섞이면 404이고 아무것도 바뀌지 않음"""
+        from django.contrib.auth import get_user_model
+
+        from children.models import Child
+        from vaccinations.services import create_vaccination_schedules
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        other_child = Child.objects.create(
+            user=other, name="남의 아이", birth_date=date(2024, 1, 1), gender="male"
+        )
+        create_vaccination_schedules(other_child)
+
+        ids = list(visit.values_list("id", flat=True))
+        ids.append(other_child.vaccination_schedules.first().pk)
+        response = authenticated_client.post(self.URL, {"ids": ids}, format="json")
+
+        assert response.status_code == 404
+        assert not visit.filter(is_completed=True).exists()
+
+    def test_requires_one_selector(self, authenticated_client, child):
+        """ids와 child_id + vaccination_date 중 하나만"""
+        assert authenticated_client.post(self.URL, {}, format="json").status_code == 400
+        response = authenticated_client.post(
+            self.URL,
+            {"ids": [1], "child_id": child.pk, "vaccination_date": "2024-03-15"},
+            format="json",
+        )
+        assert response.status_code == 400
+
+    def test_completed_schedule_retry_is_not_sent(self, child, visit, fake_sender):
+        """완료한 일정의 재시도 대기 알림은 발송하지 않음"""
+        from vaccinations.dispatch import due_notifications
+        from vaccinations.models import VaccinationNotification
+        from vaccinations.services import complete_schedules
+
+        schedule = visit.first()
+        VaccinationNotification.objects.create(
+            schedule=schedule,
+            notification_date=schedule.notification_date,
+            status="pending",
+            attempts=1,
+        )
+        assert due_notifications(date(2030, 1, 1)).exists()
+
+        complete_schedules(child.user, ids=[schedule.pk])
+        assert not due_notifications(date(2030, 1, 1)).exists()
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    """조회 응답 캐시 테스트"""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/vaccinations/schedules/?child_id={child}",
+            "/api/vaccinations/stats/?child_id={child}",
+            "/api/vaccinations/upcoming/?child_id={child}",
+        ],
+    )
+    def test_second_request_hits_cache(
+        self, authenticated_client, child, schedules, url, django_assert_num_queries
+    ):
+        """두 번째 요청은 DB 조회 없이 같은 본문과 ETag"""
+        url = url.format(child=child.pk)
+        first = authenticated_client.get(url)
+
+        with django_assert_num_queries(0):
+            second = authenticated_client.get(url)
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second["ETag"] == first["ETag"]
+
+        with django_assert_num_queries(0):
+            response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert response.status_code == 304
+
+    def test_query_params_are_part_of_key(self, authenticated_client, child, schedules):
+        """파라미터가 다르면 다른 항목"""
+        url = f"/api/vaccinations/schedules/?child_id={child.pk}"
+        full = authenticated_client.get(url).json()
+        sparse = authenticated_client.get(f"{url}&fields=id").json()
+
+        assert set(full[0]) != set(sparse[0])
+        assert set(sparse[0]) == {"id"}
+
+    def test_complete_invalidates(self, authenticated_client, child, schedules):
+        """일정 완료(save 신호) 후에는 새 응답"""
+        url = f"/api/vaccinations/schedules/?child_id={child.pk}"
+        schedule = schedules.first()
+        authenticated_client.get(url)
+
+        authenticated_client.post(
+            f"/api/vaccinations/schedules/{schedule.pk}/complete/"
+        )
+        rows = {row["id"]: row for row in authenticated_client.get(url).json()}
+        assert rows[schedule.pk]["is_completed"] is True
+
+    def test_bulk_complete_invalidates(self, authenticated_client, child, schedules):
+        """신호가 없는 일괄 UPDATE 경로도 무효화"""
+        url = f"/api/vaccinations/stats/?child_id={child.pk}"
+        before = authenticated_client.get(url).json()
+
+        ids = list(schedules.values_list("id", flat=True)[:3])
+        authenticated_client.post(
+            "/api/vaccinations/schedules/complete-bulk/", {"ids": ids}, format="json"
+        )
+        after = authenticated_client.get(url).json()
+        assert after["completed"] == before["completed"] + 3
+
+    def test_rollover_invalidates_everything(self, child, schedules):
+        """일정 상태 일괄 전환은 전체 버전을 바꿈"""
+        from vaccinations.cache import response_key
+        from vaccinations.services import rollover_schedule_statuses
+
+        key = response_key(1, child.pk, "schedules", {})
+        rollover_schedule_statuses(date(2100, 1, 1))
+        assert response_key(1, child.pk, "schedules", {}) != key
+
+    def test_child_save_invalidates(self, authenticated_client, child, schedules):
+        """아이 정보 수정 후에는 새 응답"""
+        from vaccinations.cache import response_key
+
+        key = response_key(child.user_id, child.pk, "schedules", {})
+        child.name = "김철수"
+        child.save()
+        assert response_key(child.user_id, child.pk, "schedules", {}) != key
+
+    def test_invalidation_reaches_other_processes(self, settings, tmp_path, child):
+        """
+        다른 프로세스(run_worker, cron 명령)의 무효화가 웹 프로세스에 보임
+
+        같은 디렉터리를 쓰는 FileBasedCache 인스턴스 둘로 두 프로세스를
+        흉내 냅니다.
+        """
+        from vaccinations.cache import invalidate_all, response_key
+
+        location = str(tmp_path / "cache")
+        backend = "django.core.cache.backends.filebased.FileBasedCache"
+        settings.CACHES = {
+            "default": {"BACKEND": backend, "LOCATION": location},
+            "worker": {"BACKEND": backend, "LOCATION": location},
+        }
+        key = response_key(1, child.pk, "schedules", {})
+
+        settings.VACCINATION_CACHE_ALIAS = "worker"
+        invalidate_all()
+        settings.VACCINATION_CACHE_ALIAS = "default"
+
+        assert response_key(1, child.pk, "schedules", {}) != key
+
+    def test_date_is_part_of_key(self, child):
+        """날짜가 바뀌면 다른 항목 (is_overdue/is_upcoming 재계산)"""
+        from vaccinations.cache import response_key
+
+        assert response_key(1, child.pk, "stats", {}, date(2025, 1, 1)) != (
+            response_key(1, child.pk, "stats", {}, date(2025, 1, 2))
+        )
+
+    def test_other_users_child_not_served_from_cache(
+        self, authenticated_client, api_client, child, schedules
+    ):
+        """다른 보호자는 캐시된 응답을 받지 못함"""
+        from django.contrib.auth import get_user_model
+
+        url = f"/api/vaccinations/schedules/?child_id={child.pk}"
+        assert authenticated_client.get(url).status_code == 200
+
+        other = get_user_model().objects.create_user(username="other", password="x")
+        api_client.force_authenticate(user=other)
+        assert api_client.get(url).status_code == 404
+
+    def test_error_responses_are_not_cached(self, authenticated_client):
+        """404 등 오류 응답은 저장하지 않음"""
+        from vaccinations.cache import cache_stats
+
+        url = "/api/vaccinations/stats/?child_id=999999"
+        assert authenticated_client.get(url).status_code == 404
+        assert authenticated_client.get(url).status_code == 404
+        assert cache_stats()["stores"] == 0
+
+    def test_stats_endpoint(self, authenticated_client, api_client, child, schedules):
+        """관리자만 적중/미스 카운터 조회"""
+        from django.contrib.auth import get_user_model
+
+        url = f"/api/vaccinations/upcoming/?child_id={child.pk}"
+        authenticated_client.get(url)
+        authenticated_client.get(url)
+        assert (
+            authenticated_client.get("/api/vaccinations/cache-stats/").status_code
+            == 403
+        )
+
+        admin = get_user_model().objects.create_user(
+            username="admin", password="x", is_staff=True
+        )
+        api_client.force_authenticate(user=admin)
+        stats = api_client.get("/api/vaccinations/cache-stats/").json()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.django_db
+class TestCalendarFeed:
+    """가족 예방접종 캘린더(.ics) 구독 테스트"""
+
+    @pytest.fixture
+    def feed_url(self, authenticated_client):
+        return authenticated_client.get("/api/vaccinations/calendar/").data["url"]
+
+    def test_subscription_url(self, authenticated_client):
+        """구독 URL은 다시 조회해도 같고, POST로 재발급하면 바뀜"""
+        first = authenticated_client.get("/api/vaccinations/calendar/").data
+        assert first["url"].endswith(f"/api/vaccinations/calendar/{first['token']}.ics")
+        assert first["webcal_url"].startswith("webcal://")
+        assert authenticated_client.get("/api/vaccinations/calendar/").data == first
+
+        rotated = authenticated_client.post("/api/vaccinations/calendar/").data
+        assert rotated["token"] != first["token"]
+        assert authenticated_client.get(first["url"]).status_code == 404
+
+    def test_feed_streams_all_children(
+        self, api_client, authenticated_client, user, child, schedules, feed_url
+    ):
+        """로그인 없이 모든 아이의 일정을 VEVENT로 스트리밍"""
+        from children.models import Child
+        from vaccinations.services import create_vaccination_schedules
+
+        sibling = Child.objects.create(
+            user=user, name="홍길순", birth_date=date(2025, 1, 1), gender="female"
+        )
+        create_vaccination_schedules(sibling)
+        api_client.force_authenticate(user=None)
+
+        response = api_client.get(feed_url, HTTP_ACCEPT="text/calendar")
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "text/calendar; charset=utf-8"
+        body = b"".join(response.streaming_content).decode()
+
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        total = schedules.count() + sibling.vaccination_schedules.count()
+        assert body.count("BEGIN:VEVENT") == total
+        assert f"UID:schedule-{schedules.first().pk}@" in body
+        assert "홍길순" in body
+
+    def test_lines_are_folded(self, api_client, schedules, feed_url):
+        """75옥텟을 넘는 줄은 접고 한글을 중간에서 자르지 않음"""
+        body = b"".join(api_client.get(feed_url).streaming_content)
+
+        for line in body.split(b"\r\n"):
+            assert len(line) <= 75
+            line.decode()
+
+    def test_completed_schedule_has_no_alarm(self, child, schedules):
+        """완료 일정은 실제 접종일에 표시하고 알림은 없음"""
+        from vaccinations.ical import render_calendar
+
+        schedule = schedules.first()
+        schedule.is_completed = True
+        schedule.completed_date = date(2024, 3, 15)
+        schedule.save()
+
+        events = "".join(render_calendar(child.user_id)).split("BEGIN:VEVENT")[1:]
+        event = next(e for e in events if f"schedule-{schedule.pk}@" in e)
+        assert "DTSTART;VALUE=DATE:20240315" in event
+        assert "(완료)" in event
+        assert "VALARM" not in event
+
+    def test_escape_and_fold(self):
+        """TEXT 이스케이프와 줄 접기"""
+        from vaccinations.ical import escape_text, fold_line
+
+        assert escape_text("a,b;c\\d\ne") == r"a\,b\;c\\d\ne"
+        folded = fold_line("SUMMARY:" + "가" * 40)
+        assert folded.endswith("\r\n")
+        assert all(len(part.encode()) <= 75 for part in folded.split("\r\n"))
+        assert folded.replace("\r\n ", "") == "SUMMARY:" + "가" * 40 + "\r\n"
+
+    def test_cached_feed_and_not_modified(
+        self, api_client, schedules, feed_url, django_assert_num_queries
+    ):
+        """두 번째 요청은 토큰 조회 1회로 캐시에서, ETag가 같으면 304"""
+        first = api_client.get(feed_url)
+        body = b"".join(first.streaming_content)
+
+        with django_assert_num_queries(1):
+            second = api_client.get(feed_url)
+        assert not second.streaming
+        assert second.content == body
+        assert second["ETag"] == first["ETag"]
+
+        with django_assert_num_queries(1):
+            response = api_client.get(feed_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert response.status_code == 304
+
+    def test_schedule_change_rebuilds_feed(self, api_client, schedules, feed_url):
+        """일정이 바뀌면 ETag와 본문이 바뀜"""
+        first = api_client.get(feed_url)
+        b"".join(first.streaming_content)
+
+        schedule = schedules.first()
+        schedule.is_completed = True
+        schedule.save()
+
+        second = api_client.get(feed_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert second.status_code == 200
+        assert second["ETag"] != first["ETag"]
+        assert "(완료)" in b"".join(second.streaming_content).decode()
+
+    def test_etag_follows_data_not_cache_versions(
+        self, api_client, child, schedules, feed_url
+    ):
+        """무효화 신호 없이 바뀐 데이터도 ETag에 반영 (다른 프로세스의 변경 등)"""
+        from django.core.cache import cache
+
+        first = api_client.get(feed_url)
+        b"".join(first.streaming_content)
+
+        # 캐시 버전을 바꾸지 않는 변경
+        schedules.filter(pk=schedules.first().pk).update(
+            is_completed=True, updated_at=timezone.now()
+        )
+        second = api_client.get(feed_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert second.status_code == 200
+        assert "(완료)" in b"".join(second.streaming_content).decode()
+
+        # 캐시가 비어도 데이터가 같으면 ETag가 같음
+        cache.clear()
+        assert api_client.get(feed_url)["ETag"] == second["ETag"]
+
+        schedules.filter(pk=schedules.last().pk).delete()
+        assert api_client.get(feed_url)["ETag"] != second["ETag"]
+
+    def test_unknown_token(self, api_client, db):
+        """없는 토큰은 404"""
+        response = api_client.get("/api/vaccinations/calendar/unknown.ics")
+        assert response.status_code == 404
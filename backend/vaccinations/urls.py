@@ -8,6 +8,13 @@ from rest_framework.routers import DefaultRouter
 from vaccinations.views import (
     VaccinationNotificationViewSet,
     VaccinationScheduleViewSet,
+    calendar_feed,
+    calendar_subscription,
+    dashboard,
+    response_cache_stats,
+    stats,
+    sync,
+    upcoming,
 )
 
 router = DefaultRouter()
@@ -17,5 +24,12 @@ router.register(
 )
 
 urlpatterns = [
+    path("stats/", stats, name="vaccination-stats"),
+    path("dashboard/", dashboard, name="vaccination-dashboard"),
+    path("sync/", sync, name="vaccination-sync"),
+    path("cache-stats/", response_cache_stats, name="vaccination-cache-stats"),
+    path("upcoming/", upcoming, name="vaccination-upcoming"),
+    path("calendar/", calendar_subscription, name="vaccination-calendar"),
+    path("calendar/<str:token>.ics", calendar_feed, name="vaccination-calendar-feed"),
     path("", include(router.urls)),
 ]
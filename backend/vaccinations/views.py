@@ -1 +1,621 @@
-# Create your views here.
+"""
+예방접종 API 뷰
+"""
+
+import hashlib
+from datetime import date
+from typing import List, Optional
+
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_safe
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from children.models import Child
+from vaccinations.cache import (
+    cache_stats,
+    calendar_key,
+    get_response,
+    response_key,
+    set_response,
+)
+from vaccinations.ical import CONTENT_TYPE as CALENDAR_CONTENT_TYPE
+from vaccinations.ical import render_calendar
+from vaccinations.models import (
+    CalendarFeed,
+    ChildVaccinationStats,
+    VaccinationNotification,
+    VaccinationSchedule,
+)
+from vaccinations.pagination import NotificationPagination, SchedulePagination
+from vaccinations.serializers import (
+    DashboardChildSerializer,
+    NotificationBulkActionSerializer,
+    ScheduleBulkCompleteSerializer,
+    SyncNotificationSerializer,
+    VaccinationNotificationSerializer,
+    VaccinationScheduleSerializer,
+    VaccinationStatsSerializer,
+    parse_schedule_fields,
+    schedule_only_fields,
+    schedule_representation,
+    schedule_values,
+    serialize_schedules,
+)
+from vaccinations.services import (
+    bulk_mark_notifications,
+    complete_schedules,
+    delete_schedule,
+    get_child_stats,
+    get_dashboard_children,
+    get_upcoming_schedules,
+    list_notifications,
+    mark_notification_read,
+    schedule_state,
+    set_schedule_completed,
+    update_child_stats,
+)
+from vaccinations.sync import changes_since, decode_cursor
+
+
+def get_child_id(request) -> int:
+    """?child_id= 파라미터 검증"""
+    child_id = request.query_params.get("child_id")
+    if not child_id:
+        raise ValidationError({"error": "child_id가 필요합니다."})
+    try:
+        return int(child_id)
+    except ValueError:
+        raise ValidationError({"error": "child_id는 숫자여야 합니다."})
+
+
+def get_child_or_404(request) -> Child:
+    """?child_id= 로 요청한 사용자의 아이 조회"""
+    return get_object_or_404(Child, pk=get_child_id(request), user=request.user)
+
+
+def cached_response(request, child_id: int, endpoint: str, build):
+    """
+    아이별 조회 응답 캐시
+
+    적중하면 DB 조회와 직렬화 없이 저장된 JSON 바이트(또는 304)로 응답합니다.
+    미스면 build()로 응답을 만들고, 200이면 JSON으로 렌더링해 ETag와 함께
+    저장합니다. ETag가 없는 응답은 본문 해시로 ETag를 붙입니다.
+    """
+    key = response_key(request.user.pk, child_id, endpoint, request.query_params.dict())
+    entry = get_response(key)
+    if entry is not None:
+        etag, content, content_type = entry
+        return conditional_response(
+            request, etag, lambda: HttpResponse(content, content_type=content_type)
+        )
+
+    response = build()
+    if response.status_code == status.HTTP_200_OK and isinstance(response, Response):
+        content = JSONRenderer().render(response.data)
+        if not response.has_header("ETag"):
+            response["ETag"] = make_etag(hashlib.md5(content).hexdigest())
+            patch_cache_control(response, private=True, no_cache=True)
+        set_response(key, response["ETag"], content, "application/json")
+    return response
+
+
+def get_schedule_fields(request) -> Optional[List[str]]:
+    """?fields= 희소 필드셋 (없으면 None = 전체 필드)"""
+    return parse_schedule_fields(request.query_params.get("fields"))
+
+
+def make_etag(*parts) -> str:
+    """버전 값들로 강한 ETag 생성"""
+    raw = ":".join(str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+
+def conditional_response(request, etag: str, render):
+    """
+    If-None-Match가 ETag와 같으면 본문 없이 304, 아니면 render()로 응답
+
+    304일 때는 render를 호출하지 않으므로 직렬화 비용이 들지 않습니다.
+    사용자별 데이터이므로 공유 캐시에는 저장하지 않고 매번 재검증하게 합니다.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = render()
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class VaccinationScheduleViewSet(
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    예방접종 일정 API
+
+    일정은 아이 등록 시 자동 생성되므로 직접 생성은 지원하지 않습니다.
+    """
+
+    serializer_class = VaccinationScheduleSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = SchedulePagination
+
+    def get_queryset(self):
+        return VaccinationSchedule.objects.filter(child__user=self.request.user)
+
+    def list(self, request):
+        """
+        아이의 일정 목록 (ETag 지원, ?cursor=/?page_size= 로 페이지 조회)
+
+        렌더링된 응답을 아이별로 캐시합니다.
+        """
+        return cached_response(
+            request, get_child_id(request), "schedules", lambda: self._list(request)
+        )
+
+    def _list(self, request):
+        """
+        일정 목록 응답 생성 (캐시 미스)
+
+        ETag는 아이 조회와 같은 쿼리에서 구한 일정 수와 최종 수정 시각,
+        그리고 오늘 날짜(is_overdue/is_upcoming 기준)로 만듭니다.
+        """
+        child = get_object_or_404(
+            Child.objects.annotate(
+                schedule_count=Count("vaccination_schedules"),
+                schedules_updated_at=Max("vaccination_schedules__updated_at"),
+            ),
+            pk=get_child_id(request),
+            user=request.user,
+        )
+        etag = make_etag(
+            "schedules",
+            child.pk,
+            child.schedule_count,
+            child.schedules_updated_at,
+            timezone.localdate(),
+            request.query_params.get("cursor"),
+            request.query_params.get("page_size"),
+            request.query_params.get("fields"),
+        )
+
+        fields = get_schedule_fields(request)
+
+        def render():
+            # 읽기 전용 경로: .values() + SQL로 계산한 is_overdue/is_upcoming
+            # keyset 정렬 키는 요청하지 않았어도 읽고 표현에서만 뺌
+            ordering = [f.lstrip("-") for f in self.paginator.ordering]
+            rows = schedule_values(
+                self.get_queryset().filter(child=child), fields=fields, extra=ordering
+            )
+            drop = [f for f in ordering if fields is not None and f not in fields]
+            page = self.paginate_queryset(rows)
+            if page is not None:
+                return self.get_paginated_response(schedule_representation(page, drop))
+            return Response(schedule_representation(rows, drop))
+
+        return conditional_response(request, etag, render)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            before = schedule_state(serializer.instance)
+            schedule = serializer.save()
+            update_child_stats(schedule.child_id, before, schedule_state(schedule))
+
+    def perform_destroy(self, instance):
+        delete_schedule(instance)
+
+    @action(detail=True, methods=["post"])
+    def complete(self, request, pk=None):
+        """접종 완료 처리 (completed_date 미지정 시 오늘)"""
+        schedule = self.get_object()
+        completed_date = request.data.get("completed_date")
+        if completed_date:
+            try:
+                completed_date = date.fromisoformat(completed_date)
+            except (TypeError, ValueError):
+                raise ValidationError(
+                    {"error": "completed_date는 YYYY-MM-DD 형식이어야 합니다."}
+                )
+
+        set_schedule_completed(schedule, True, completed_date)
+        return Response(self.get_serializer(schedule).data)
+
+    @action(detail=False, methods=["post"], url_path="complete-bulk")
+    def complete_bulk(self, request):
+        """
+        일정 일괄 완료 처리 (한 방문에 여러 백신)
+
+        body: ids 또는 child_id + vaccination_date, completed_date(미지정 시 오늘)
+        """
+        serializer = ScheduleBulkCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        child = None
+        if not data.get("ids"):
+            child = get_object_or_404(Child, pk=data["child_id"], user=request.user)
+        try:
+            completed = complete_schedules(
+                request.user,
+                ids=data.get("ids"),
+                child=child,
+                vaccination_date=data.get("vaccination_date"),
+                completed_date=data.get("completed_date"),
+            )
+        except VaccinationSchedule.DoesNotExist as e:
+            raise NotFound(str(e))
+
+        schedules = self.get_queryset().filter(pk__in=completed)
+        return Response(
+            {"updated": len(completed), "schedules": serialize_schedules(schedules)}
+        )
+
+    @action(detail=True, methods=["post"])
+    def uncomplete(self, request, pk=None):
+        """접종 완료 취소"""
+        schedule = self.get_object()
+        set_schedule_completed(schedule, False)
+        return Response(self.get_serializer(schedule).data)
+
+
+class VaccinationNotificationViewSet(
+    mixins.RetrieveModelMixin, viewsets.GenericViewSet
+):
+    """
+    예방접종 알림 API
+
+    목록은 저장된 알림(발송/읽음/재시도 대기)과 일정에서 계산한 가상
+    대기 알림을 합쳐 돌려줍니다. 가상 알림은 id가 null입니다.
+    목록은 알림일 최신순 keyset 페이지({"next", "results"})입니다.
+    """
+
+    serializer_class = VaccinationNotificationSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = NotificationPagination
+
+    def get_queryset(self):
+        return VaccinationNotification.objects.filter(
+            schedule__child__user=self.request.user
+        ).select_related("schedule")
+
+    def list(self, request):
+        """
+        알림 목록
+
+        ?fields= 로 일정 필드를 고르면 그 컬럼만 읽고(.only()) 직렬화합니다.
+        ?compact=1 이면 알림에는 일정 ID만 두고, 일정은 "schedules"에
+        ID별로 한 번씩만 담습니다.
+        """
+        child = None
+        if request.query_params.get("child_id"):
+            child = get_child_or_404(request)
+        fields = get_schedule_fields(request)
+        notifications = self.paginator.paginate(
+            lambda after, limit: list_notifications(
+                request.user,
+                child=child,
+                status=request.query_params.get("status"),
+                after=after,
+                limit=limit,
+                schedule_only=schedule_only_fields(fields) if fields else None,
+            ),
+            request,
+        )
+
+        if request.query_params.get("compact") not in ("1", "true"):
+            serializer = self.get_serializer(
+                notifications,
+                many=True,
+                context={**self.get_serializer_context(), "schedule_fields": fields},
+            )
+            return self.get_paginated_response(serializer.data)
+
+        schedules = {n.schedule_id: n.schedule for n in notifications}
+        response = self.get_paginated_response(
+            SyncNotificationSerializer(notifications, many=True).data
+        )
+        response.data["schedules"] = {
+            row["id"]: row
+            for row in VaccinationScheduleSerializer(
+                schedules.values(), many=True, fields=fields
+            ).data
+        }
+        return response
+
+    @action(detail=False, methods=["post"])
+    def read(self, request):
+        """일정의 알림 읽음 처리 (body: schedule_id)"""
+        try:
+            schedule_id = int(request.data.get("schedule_id"))
+        except (TypeError, ValueError):
+            raise ValidationError({"error": "schedule_id는 숫자여야 합니다."})
+        schedule = get_object_or_404(
+            VaccinationSchedule, pk=schedule_id, child__user=request.user
+        )
+        notification = mark_notification_read(schedule)
+        return Response(self.get_serializer(notification).data)
+
+    @action(detail=False, methods=["post"], url_path="mark-read")
+    def mark_read(self, request):
+        """알림 일괄 읽음 처리"""
+        return self._bulk_mark(request, "read")
+
+    @action(detail=False, methods=["post"], url_path="mark-sent")
+    def mark_sent(self, request):
+        """알림 일괄 발송됨 처리"""
+        return self._bulk_mark(request, "sent")
+
+    def _bulk_mark(self, request, new_status):
+        serializer = NotificationBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        child = None
+        if data.get("child_id"):
+            child = get_object_or_404(Child, pk=data["child_id"], user=request.user)
+        updated = bulk_mark_notifications(
+            request.user,
+            new_status,
+            ids=data.get("ids"),
+            schedule_ids=data.get("schedule_ids"),
+            before=data.get("before"),
+            child=child,
+        )
+        return Response({"updated": updated})
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def stats(request):
+    """
+    아이별 예방접종 통계 (비정규화 통계 테이블 PK 조회 1회, ETag 지원)
+
+    통계 행의 기준일과 수정 시각이 곧 버전이므로 ETag에 추가 쿼리가 없습니다.
+    렌더링된 응답을 아이별로 캐시합니다.
+    """
+    child_id = get_child_id(request)
+    return cached_response(
+        request, child_id, "stats", lambda: _stats(request, child_id)
+    )
+
+
+def _stats(request, child_id: int):
+    """통계 응답 생성 (캐시 미스)"""
+    child_stats = ChildVaccinationStats.objects.filter(
+        pk=child_id, child__user=request.user
+    ).first()
+    if child_stats is None or child_stats.as_of != timezone.localdate():
+        # 통계 행이 아직 없거나 rollover 전이면 그 자리에서 다시 집계
+        child_stats = get_child_stats(get_child_or_404(request))
+
+    etag = make_etag(
+        "stats", child_stats.child_id, child_stats.as_of, child_stats.updated_at
+    )
+    return conditional_response(
+        request,
+        etag,
+        lambda: Response(VaccinationStatsSerializer(child_stats).data),
+    )
+
+
+# 대시보드에서 아이별로 보여줄 다가오는 접종 수
+DASHBOARD_UPCOMING_LIMIT = 5
+DASHBOARD_UPCOMING_MAX = 20
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def dashboard(request):
+    """
+    전체 아이 예방접종 대시보드 (?upcoming_limit=, 기본 5건, ETag 지원)
+
+    아이마다 통계, 다가오는 접종, 지연된 접종을 담아 한 번에 돌려줍니다.
+    아이 수와 관계없이 쿼리 수가 일정하며, ETag가 같으면 집계 쿼리 1회
+    후 304로 응답합니다.
+    """
+    try:
+        upcoming_limit = int(
+            request.query_params.get("upcoming_limit", DASHBOARD_UPCOMING_LIMIT)
+        )
+    except ValueError:
+        return Response(
+            {"error": "upcoming_limit는 숫자여야 합니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    upcoming_limit = max(0, min(upcoming_limit, DASHBOARD_UPCOMING_MAX))
+
+    version = Child.objects.filter(user=request.user).aggregate(
+        children=Count("id", distinct=True),
+        children_updated_at=Max("updated_at"),
+        schedules=Count("vaccination_schedules"),
+        schedules_updated_at=Max("vaccination_schedules__updated_at"),
+    )
+    etag = make_etag(
+        "dashboard",
+        request.user.pk,
+        upcoming_limit,
+        timezone.localdate(),
+        *(version[key] for key in sorted(version)),
+    )
+
+    def render():
+        children = get_dashboard_children(request.user, upcoming_limit=upcoming_limit)
+        return Response(
+            {"children": DashboardChildSerializer(children, many=True).data}
+        )
+
+    return conditional_response(request, etag, render)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def sync(request):
+    """
+    일정/알림 델타 동기화 (?since=직전 응답의 cursor)
+
+    since가 없거나 너무 오래됐으면 reset=true와 함께 전체 목록을 돌려주며,
+    앱은 저장소를 비우고 다시 채웁니다. archived_schedules의 일정은 알림이
+    보관된 것이므로 앱이 가상 알림을 만들지 않습니다.
+    """
+    since = request.query_params.get("since")
+    if since:
+        try:
+            since = decode_cursor(since)
+        except ValueError:
+            return Response(
+                {"error": "since는 직전 응답의 cursor여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    result = changes_since(request.user, since or None)
+    return Response(
+        {
+            "cursor": result.cursor,
+            "reset": result.reset,
+            "schedules": VaccinationScheduleSerializer(
+                result.schedules, many=True
+            ).data,
+            "notifications": SyncNotificationSerializer(
+                result.notifications, many=True
+            ).data,
+            "deleted": {
+                "schedules": result.deleted_schedules,
+                "notifications": result.deleted_notifications,
+            },
+            "archived_schedules": result.archived_schedules,
+        }
+    )
+
+
+# 다가오는 예방접종 조회 기간 상한 (일)
+UPCOMING_DAYS_AHEAD_MAX = 3650
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def upcoming(request):
+    """
+    다가오는 예방접종 (?days_ahead=, 기본 60일, 최대 10년, ?fields= 지원)
+
+    렌더링된 응답을 아이별로 캐시합니다.
+    """
+    return cached_response(
+        request, get_child_id(request), "upcoming", lambda: _upcoming(request)
+    )
+
+
+def _upcoming(request):
+    """다가오는 예방접종 응답 생성 (캐시 미스)"""
+    child = get_child_or_404(request)
+    try:
+        days_ahead = int(request.query_params.get("days_ahead", 60))
+    except ValueError:
+        return Response(
+            {"error": "days_ahead는 숫자여야 합니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    days_ahead = max(0, min(days_ahead, UPCOMING_DAYS_AHEAD_MAX))
+
+    schedules = get_upcoming_schedules(child, days_ahead=days_ahead)
+    return Response(serialize_schedules(schedules, fields=get_schedule_fields(request)))
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def response_cache_stats(request):
+    """조회 응답 캐시 적중/미스/저장/무효화 카운터 (관리자 전용)"""
+    return Response(cache_stats())
+
+
+@api_view(["GET", "POST"])
+@permission_classes([IsAuthenticated])
+def calendar_subscription(request):
+    """
+    캘린더 구독 URL 조회 (GET, 없으면 발급) / 토큰 재발급 (POST)
+
+    재발급하면 이전 URL로 구독한 캘린더는 더 이상 갱신되지 않습니다.
+    """
+    feed, created = CalendarFeed.objects.get_or_create(user=request.user)
+    if request.method == "POST" and not created:
+        feed.rotate()
+    url = request.build_absolute_uri(
+        reverse("vaccination-calendar-feed", args=[feed.token])
+    )
+    return Response(
+        {
+            "token": feed.token,
+            "url": url,
+            "webcal_url": "webcal://" + url.split("://", 1)[1],
+        }
+    )
+
+
+@require_safe
+def calendar_feed(request, token: str):
+    """
+    가족 예방접종 캘린더 (.ics, 토큰 URL로 로그인 없이 구독)
+
+    캘린더 앱은 구독 URL을 자주 다시 요청하므로
+    - 토큰으로 보호자와 아이별 (수정일, 일정 수, 일정 최종 수정일)을 모으는
+      쿼리 1회로 ETag와 캐시 키를 정하고, 같으면 304
+    - 캐시에 렌더링된 캘린더가 있으면 그대로 응답 (일정 조회 없음)
+    - 없으면 일정을 iterator로 읽으며 스트리밍하고, 끝까지 보낸 본문을
+      캐시에 저장 (일정이 바뀌어 ETag가 바뀔 때만 다시 렌더링)
+
+    ETag는 캐시의 버전 토큰이 아니라 데이터에서 만들므로, 캐시가 비거나
+    다른 프로세스의 무효화를 못 보더라도 바뀐 캘린더를 304로 답하지 않습니다.
+
+    DRF 콘텐츠 협상을 거치지 않도록 일반 Django 뷰입니다
+    (캘린더 앱은 Accept: text/calendar로 요청).
+    """
+    rows = list(
+        CalendarFeed.objects.filter(token=token)
+        .values_list("user_id", "user__children__id", "user__children__updated_at")
+        .annotate(
+            count=Count("user__children__vaccination_schedules"),
+            latest=Max("user__children__vaccination_schedules__updated_at"),
+        )
+        .order_by("user__children__id")
+    )
+    if not rows:
+        raise Http404("구독 URL이 올바르지 않습니다.")
+    user_id = rows[0][0]
+    etag = make_etag(*rows)
+    key = calendar_key(user_id, etag)
+
+    def render():
+        entry = get_response(key)
+        if entry is not None:
+            response = HttpResponse(entry[1], content_type=CALENDAR_CONTENT_TYPE)
+        else:
+            response = StreamingHttpResponse(
+                stream(), content_type=CALENDAR_CONTENT_TYPE
+            )
+        response["Content-Disposition"] = 'inline; filename="vaccinations.ics"'
+        return response
+
+    def stream():
+        chunks = []
+        for chunk in render_calendar(user_id):
+            chunk = chunk.encode()
+            chunks.append(chunk)
+            yield chunk
+        # 끝까지 보낸 경우에만 저장 (중간에 연결이 끊기면 저장하지 않음)
+        set_response(key, etag, b"".join(chunks), CALENDAR_CONTENT_TYPE)
+
+    return conditional_response(request, etag, render)